@@ -4,6 +4,33 @@ Scraper package for extracting sustainability data from company websites.
 Enhanced with AI-based analysis using proven analyze_scorecard.py logic.
 """
 
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+def configure_logging() -> None:
+    """
+    Send log records through a queue so formatting and the stdout write happen on a
+    background listener thread instead of in the scraper and request threads.
+    Called by entry points (the main_ai_scraper CLI, the API before it runs the scraper),
+    never at import. Leaves logging alone if the host application already configured it.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
+
+
 # Main AI scraper functions (primary interface)
 from .main_ai_scraper import (
     analyze_company_sustainability,
@@ -18,6 +45,7 @@ __all__ = [
     # Main AI scraper (primary interface)
     'analyze_company_sustainability',
     'ALL_CRITERIA',
+    'configure_logging',
     
     # Core utilities
     'extract_pdf_content',
@@ -2,15 +2,19 @@ import os
 import json
 import logging
 import re
+import sys
 from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass
 import openai
 from openai import OpenAI
 from pathlib import Path
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from fuzzywuzzy import fuzz
 import random
 
+from ..search.rate_limit import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 # Initialize OpenAI client
@@ -19,8 +23,24 @@ client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 # Configuration constants
 CRITERION_DEADLINE_SEC = 60  # Maximum time per criterion to prevent monopolization
 MAX_BATCHES_PER_CRITERION = 10  # Increased from 6 to 10 for more thorough analysis
+MAX_CONCURRENT_AI_BATCHES = 4  # Text batches of one document sent to OpenAI at the same time
+AI_BATCH_WORKERS = 16  # Threads shared by all batched analyses (several companies may run at once)
+OPENAI_REQUESTS_PER_MINUTE = 500  # gpt-4o-mini request limit, shared by all threads
+OPENAI_TOKENS_PER_MINUTE = 200000  # gpt-4o-mini token limit, shared by all threads
+MULTI_CRITERIA_PROMPT_TOKENS = 1500  # Approximate size of the fixed multi-criteria prompt
+MULTI_CRITERIA_MAX_TOKENS = 2000  # Completion budget for a multi-criteria call
+
+# Proactive throttling so concurrent batches stay under the OpenAI rate limits instead of hitting 429s
+_request_bucket = TokenBucket(OPENAI_REQUESTS_PER_MINUTE)
+_token_bucket = TokenBucket(OPENAI_TOKENS_PER_MINUTE)
+# Shared across calls instead of a pool started and torn down per document
+_AI_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=AI_BATCH_WORKERS, thread_name_prefix="ai-batches")
+
+# __slots__ instead of a per-instance __dict__ where supported (dataclass slots needs Python 3.10+);
+# evidence is created per criterion and per batch, and validators still assign its fields in place
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CriteriaEvidence:
     """Evidence found for a specific criterion"""
     criterion: str
@@ -222,9 +242,16 @@ def batch_text_with_overlap(text: str, max_length: int = 4000, overlap: int = 50
     
 #     return result
 
-def analyze_text_with_ai_batched(text: str, url: str, needed: Set[str], company: str) -> Dict[str, CriteriaEvidence]:
+def analyze_text_with_ai_batched(
+    text: str,
+    url: str,
+    needed: Set[str],
+    company: str,
+    concurrency: int = MAX_CONCURRENT_AI_BATCHES
+) -> Dict[str, CriteriaEvidence]:
     """
     OPTIMIZED: Analyze multiple criteria in a single OpenAI call to reduce API usage by ~70%.
+    Up to `concurrency` text batches are sent at once; results are still merged in batch order.
     """
     findings = {}
     
@@ -450,6 +477,12 @@ def analyze_text_with_ai_batched(text: str, url: str, needed: Set[str], company:
     # Process all batches regardless of source type - quality over artificial cost savings
     max_batches = len(batches)  # Process all content to avoid missing valuable information
     
+    # At most `concurrency` batches are in flight; a new one is only submitted when the oldest
+    # is consumed, so the early-exit check below runs after every batch and bounds API usage
+    concurrency = max(1, min(concurrency, max_batches))
+    pending: Dict[int, Future] = {}
+    next_batch = 0
+    
     for i in range(max_batches):
         batch = batches[i]
         
@@ -475,8 +508,11 @@ def analyze_text_with_ai_batched(text: str, url: str, needed: Set[str], company:
         try:
             # EFFICIENCY: Multi-criteria analysis in single call
             # FIXED: Always pass ALL needed criteria to each batch so multi-criteria evidence can be found
-            logger.debug(f"Making OpenAI API call for batch {i+1}/{max_batches} with {len(needed)} criteria")
-            multi_result = call_openai_multi_criteria(batch, needed, company)
+            while next_batch < min(i + concurrency, max_batches):
+                logger.debug(f"Making OpenAI API call for batch {next_batch+1}/{max_batches} with {len(needed)} criteria")
+                pending[next_batch] = _AI_BATCH_EXECUTOR.submit(call_openai_multi_criteria, batches[next_batch], needed, company)
+                next_batch += 1
+            multi_result = pending.pop(i).result()
             
             # Process results for each criterion
             for criterion in needed:
@@ -571,6 +607,9 @@ def analyze_text_with_ai_batched(text: str, url: str, needed: Set[str], company:
             logger.warning(f"Batched AI analysis failed for batch {i+1}: {e}")
             continue
     
+    # After an early exit, calls that haven't started yet are never sent
+    for future in pending.values():
+        future.cancel()
     return findings
 
 def call_openai_multi_criteria(text: str, criteria: Set[str], company_name: str) -> Dict[str, Dict]:
@@ -714,6 +753,11 @@ def call_openai_multi_criteria(text: str, criteria: Set[str], company_name: str)
     criteria_text = "\n".join(criteria_list)
 
     try:
+        # Roughly 4 characters per token for the prompt, plus the full completion budget
+        estimated_tokens = (len(criteria_text) + min(len(text), 6000)) // 4 + MULTI_CRITERIA_PROMPT_TOKENS + MULTI_CRITERIA_MAX_TOKENS
+        _request_bucket.acquire()
+        _token_bucket.acquire(estimated_tokens)
+        
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             response_format={"type": "json_object"},  # Force JSON-only response
@@ -770,7 +814,7 @@ Only include entries for criteria where you find evidence (criteria_found: true)
 """}
             ],
             temperature=0.1,
-            max_tokens=2000,
+            max_tokens=MULTI_CRITERIA_MAX_TOKENS,
             timeout=25
         )
         
@@ -4,7 +4,7 @@ import time
 import logging
 from typing import Set
 from urllib.parse import urlparse
-from ...search.google_search import get_company_domain
+from ...search.google_search import TRUSTED_PDF_DOMAINS, get_company_domain, host_in_domains
 
 logger = logging.getLogger(__name__)
 
@@ -64,14 +64,6 @@ def should_crawl_pdf(url: str, company: str) -> bool:
     if isinstance(allowed_domains, str):
         allowed_domains = [allowed_domains]
     
-    # Add trusted sustainability/reporting domains
-    trusted_domains = [
-        'sec.gov', 'edgar.sec.gov',           # SEC filings
-        'cdp.net',                            # CDP reports  
-        'globalreporting.org',                # GRI reports
-        'sustainabledevelopment.report'       # UN SDG reports
-    ]
-    
     # Check if PDF is from allowed domain
     try:
         host = urlparse(url).netloc.lower()
@@ -84,10 +76,9 @@ def should_crawl_pdf(url: str, company: str) -> bool:
                 return True
         
         # Check trusted domains
-        for trusted in trusted_domains:
-            if trusted in host:
-                logger.debug(f"[PDF ALLOW] {url} - trusted domain: {trusted}")
-                return True
+        if host_in_domains(host.split(':', 1)[0], TRUSTED_PDF_DOMAINS):
+            logger.debug(f"[PDF ALLOW] {url} - trusted domain: {host}")
+            return True
                 
         logger.debug(f"[PDF REJECT] {url} - not from allowed domain (host: {host})")
         return False
@@ -5,6 +5,9 @@ import logging
 import heapq
 import random
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from typing import Dict, Set, Optional, List, Any, Tuple
 from urllib.parse import urlparse, urljoin, urldefrag
 from pathlib import Path
@@ -19,7 +22,6 @@ if sys.platform == "win32":
 # Playwright and web scraping imports
 from playwright.sync_api import sync_playwright
 import trafilatura
-import requests
 from bs4 import BeautifulSoup
 
 # Add paths for imports
@@ -36,25 +38,27 @@ from ..search.google_search import (
     filter_search_results,
     get_sustainability_reports,
     analyze_search_snippets,  # REVERT: Use original working version
-    CRITERIA_QUESTIONS  # Add this import
+    CRITERIA_QUESTIONS,  # Add this import
+    render_criterion_questions
 )
+from ..search.http_session import get_http_session
 
 # Import efficient AI analysis functions
 from .ai_criteria_analyzer import (
     analyze_text_with_ai_batched,
     CriteriaEvidence,
-    should_replace_evidence_ai
+    should_replace_evidence_ai,
+    MAX_CONCURRENT_AI_BATCHES
 )
 
 # Import scraping utilities and scoring
 from .utils.pdf import extract_pdf_content
-from .utils.html import html_to_clean_text
+from .utils.html import html_to_clean_text, get_cached_page_text, cache_page_text
 from .crawler.fetch import should_crawl, should_crawl_pdf, safe_get_page_content, is_trusted_domain_ai
 from .analysis.company import validate_pdf_ownership
 from .ai_scorecard_integration import score_url  # URL scoring function
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Set up logging (handlers are installed by configure_logging() in the entry points)
 logger = logging.getLogger(__name__)
 
 # Configuration constants - OPTIMIZED FOR PRODUCTION
@@ -69,6 +73,10 @@ FIRST_CHUNK_CHARS = 25000  # Increased from 20k → 25k (better executive summar
 MAX_WEB_PAGES_PER_PHASE = 8  # Increased from 5 to 8 for more comprehensive web scraping
 MAX_CRAWL_PAGES = 12  # Increased from 8 to 12 for deeper crawling
 MAX_SEARCH_PAGES_PER_CRITERION = 3  # Increased from 2 to 3 for more search depth
+CRITERION_SEARCH_WORKERS = 16  # Threads shared by the Phase 1 criterion searches of all analyses
+
+# Shared across analyses instead of a pool started and torn down per Phase 1 run
+_CRITERION_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=CRITERION_SEARCH_WORKERS, thread_name_prefix="criterion-search")
 
 # JavaScript for link extraction
 ALL_LINKS_JS = "Array.from(document.querySelectorAll('a[href]')).map(a => a.href)"
@@ -398,6 +406,63 @@ def is_mostly_javascript(text: str) -> bool:
     
     return False
 
+def content_fingerprint(content: str) -> bytes:
+    """
+    128-bit hash of whitespace-normalized content.
+    Extraction methods often return the same text with different spacing - equal
+    fingerprints let the supplementary merge skip them without building word sets.
+    """
+    return hashlib.blake2b(' '.join(content.split()).encode('utf-8'), digest_size=16).digest()
+
+def has_unique_words(content: str, primary_words: frozenset, min_unique_words: int) -> bool:
+    """
+    True if content has more than min_unique_words distinct words not in primary_words.
+    Stops scanning as soon as the threshold is crossed instead of building the full set difference.
+    """
+    unique_words = set()
+    for word in content.split():
+        if word not in primary_words and word not in unique_words:
+            unique_words.add(word)
+            if len(unique_words) > min_unique_words:
+                return True
+    return False
+
+def select_supplementary_content(
+    primary_content: str,
+    primary_method: str,
+    extraction_methods: List[Tuple[str, str]],
+    min_unique_words: int,
+    max_length_ratio: float
+) -> List[Tuple[str, str]]:
+    """
+    Pick the extraction methods worth appending to the primary content.
+    A method qualifies if it is not a whitespace variant of earlier content, its length is
+    between 20% and max_length_ratio of the primary content, and it adds more than
+    min_unique_words new words.
+    """
+    primary_words = frozenset(primary_content.split())
+    primary_length = len(primary_content)
+    seen_hashes = {content_fingerprint(primary_content)}
+    selected = []
+    
+    for method_name, content in extraction_methods:
+        if method_name == primary_method:
+            continue
+        
+        # Skip whitespace-only variants of content we already have (O(1) check)
+        content_hash = content_fingerprint(content)
+        if content_hash in seen_hashes:
+            continue
+        seen_hashes.add(content_hash)
+        
+        if not (primary_length * 0.2 < len(content) < primary_length * max_length_ratio):
+            continue
+        
+        if has_unique_words(content, primary_words, min_unique_words):
+            selected.append((method_name, content))
+    
+    return selected
+
 def process_content_with_ai(
     content: str,
     url: str,
@@ -507,10 +572,10 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
         try:
             page.wait_for_load_state("networkidle", timeout=8000)
             if verbose:
-                print(f"    Page fully loaded with dynamic content")
+                logger.info(f"    Page fully loaded with dynamic content")
         except Exception as e:
             if verbose:
-                print(f"    Dynamic content wait failed: {e}")
+                logger.info(f"    Dynamic content wait failed: {e}")
         
         # Step 2: Get clean readable content using multiple methods
         extraction_methods = []
@@ -524,13 +589,13 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
                 if not is_mostly_javascript(clean_text):
                     extraction_methods.append(("HTML_CLEAN", clean_text))
                     if verbose:
-                        print(f"    Clean HTML text: {len(clean_text):,} characters")
+                        logger.info(f"    Clean HTML text: {len(clean_text):,} characters")
                 else:
                     if verbose:
-                        print(f"    Clean HTML text rejected (mostly JavaScript): {len(clean_text):,} characters")
+                        logger.info(f"    Clean HTML text rejected (mostly JavaScript): {len(clean_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    HTML cleaning failed: {e}")
+                logger.info(f"    HTML cleaning failed: {e}")
         
         # Method 2: Simple innerText extraction
         try:
@@ -540,13 +605,13 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
                 if not is_mostly_javascript(body_text):
                     extraction_methods.append(("VISIBLE_TEXT", body_text))
                     if verbose:
-                        print(f"    Visible text: {len(body_text):,} characters")
+                        logger.info(f"    Visible text: {len(body_text):,} characters")
                 else:
                     if verbose:
-                        print(f"    Visible text rejected (mostly JavaScript): {len(body_text):,} characters")
+                        logger.info(f"    Visible text rejected (mostly JavaScript): {len(body_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Visible text extraction failed: {e}")
+                logger.info(f"    Visible text extraction failed: {e}")
         
         # Method 3: Content-specific selectors (main content areas)
         try:
@@ -563,15 +628,15 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
                         if not is_mostly_javascript(selector_text):
                             extraction_methods.append((f"SELECTOR_{selector}", selector_text))
                             if verbose:
-                                print(f"    Content from {selector}: {len(selector_text):,} characters")
+                                logger.info(f"    Content from {selector}: {len(selector_text):,} characters")
                             break  # Use first successful selector
                 except Exception as e:
                     if verbose:
-                        print(f"    Selector {selector} failed: {e}")
+                        logger.info(f"    Selector {selector} failed: {e}")
                     continue
         except Exception as e:
             if verbose:
-                print(f"    Selector extraction failed: {e}")
+                logger.info(f"    Selector extraction failed: {e}")
         
         # Method 4: Table extraction (important for fleet data)
         try:
@@ -591,15 +656,15 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
             if table_text and len(table_text.strip()) > 50:
                 extraction_methods.append(("TABLE_DATA", table_text))
                 if verbose:
-                    print(f"    Table data: {len(table_text):,} characters")
+                    logger.info(f"    Table data: {len(table_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Table extraction failed: {e}")
+                logger.info(f"    Table extraction failed: {e}")
         
         # Step 3: Validate and combine extraction methods
         if not extraction_methods:
             if verbose:
-                print(f"    No valid content extracted, trying fallback")
+                logger.info(f"    No valid content extracted, trying fallback")
             # Fallback: aggressive content extraction
             try:
                 fallback_text = page.evaluate("""() => {
@@ -614,25 +679,25 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
                 if fallback_text and len(fallback_text.strip()) > 100:
                     extraction_methods.append(("FALLBACK_PARAGRAPHS", fallback_text))
                     if verbose:
-                        print(f"    Fallback paragraph extraction: {len(fallback_text):,} characters")
+                        logger.info(f"    Fallback paragraph extraction: {len(fallback_text):,} characters")
             except Exception as e:
                 if verbose:
-                    print(f"    Fallback extraction failed: {e}")
+                    logger.info(f"    Fallback extraction failed: {e}")
         
         if not extraction_methods:
             if verbose:
-                print(f"    No readable content extracted, trying HTML fallback")
+                logger.info(f"    No readable content extracted, trying HTML fallback")
             # Last resort: use HTML cleaning even if it was rejected as JavaScript
             try:
                 html_content = page.content()
                 fallback_html_text = html_to_clean_text(html_content, url)
                 if fallback_html_text and len(fallback_html_text.strip()) > 50:
                     if verbose:
-                        print(f"    Using HTML fallback content: {len(fallback_html_text):,} characters (may contain some JavaScript)")
+                        logger.info(f"    Using HTML fallback content: {len(fallback_html_text):,} characters (may contain some JavaScript)")
                     return fallback_html_text
             except Exception as e:
                 if verbose:
-                    print(f"    HTML fallback failed: {e}")
+                    logger.info(f"    HTML fallback failed: {e}")
             return ""
         
         # Find the best extraction (prefer HTML_CLEAN, then longest)
@@ -645,18 +710,16 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
         primary_content = best_extraction[1]
         
         if verbose:
-            print(f"    Primary content from {best_extraction[0]}: {len(primary_content):,} characters")
+            logger.info(f"    Primary content from {best_extraction[0]}: {len(primary_content):,} characters")
         
         # Add supplementary content that's meaningful and different
-        supplementary_content = []
-        for method_name, content in extraction_methods:
-            if method_name != best_extraction[0]:
-                # Include if it's substantially different and meaningful
-                if len(content) > len(primary_content) * 0.2 and len(content) < len(primary_content) * 3:
-                    # Check if it has meaningful different content
-                    unique_words = len(set(content.split()) - set(primary_content.split()))
-                    if unique_words > 20:
-                        supplementary_content.append(f"=== {method_name} ===\n{content}")
+        supplementary_content = [
+            f"=== {method_name} ===\n{content}"
+            for method_name, content in select_supplementary_content(
+                primary_content, best_extraction[0], extraction_methods,
+                min_unique_words=20, max_length_ratio=3
+            )
+        ]
         
         # Combine primary + supplementary content
         if supplementary_content:
@@ -667,9 +730,9 @@ def get_complete_website_content(page, url: str, verbose: bool = False) -> str:
             final_content = primary_content  # Don't add headers if only one source
         
         if verbose:
-            print(f"    Final combined content: {len(final_content):,} characters")
-            print(f"    Content sources: {len(extraction_methods)} extraction methods")
-            print(f"    Content preview: {final_content[:300]}...")
+            logger.info(f"    Final combined content: {len(final_content):,} characters")
+            logger.info(f"    Content sources: {len(extraction_methods)} extraction methods")
+            logger.info(f"    Content preview: {final_content[:300]}...")
         
         return final_content
         
@@ -693,7 +756,7 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
     """
     try:
         if verbose:
-            print(f"    Raw HTML content: {len(html_content):,} characters")
+            logger.info(f"    Raw HTML content: {len(html_content):,} characters")
         
         extraction_methods = []
         
@@ -704,13 +767,13 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
                 if not is_mostly_javascript(clean_text):
                     extraction_methods.append(("TRAFILATURA", clean_text))
                     if verbose:
-                        print(f"    Trafilatura extraction: {len(clean_text):,} characters")
+                        logger.info(f"    Trafilatura extraction: {len(clean_text):,} characters")
                 else:
                     if verbose:
-                        print(f"    Trafilatura extraction rejected (mostly JavaScript): {len(clean_text):,} characters")
+                        logger.info(f"    Trafilatura extraction rejected (mostly JavaScript): {len(clean_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Trafilatura extraction failed: {e}")
+                logger.info(f"    Trafilatura extraction failed: {e}")
         
         # Method 2: Aggressive BeautifulSoup extraction
         try:
@@ -729,13 +792,13 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
                 if not is_mostly_javascript(aggressive_text):
                     extraction_methods.append(("AGGRESSIVE_SOUP", aggressive_text))
                     if verbose:
-                        print(f"    Aggressive BeautifulSoup: {len(aggressive_text):,} characters")
+                        logger.info(f"    Aggressive BeautifulSoup: {len(aggressive_text):,} characters")
                 else:
                     if verbose:
-                        print(f"    Aggressive BeautifulSoup rejected (mostly JavaScript): {len(aggressive_text):,} characters")
+                        logger.info(f"    Aggressive BeautifulSoup rejected (mostly JavaScript): {len(aggressive_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Aggressive BeautifulSoup failed: {e}")
+                logger.info(f"    Aggressive BeautifulSoup failed: {e}")
         
         # Method 3: Conservative BeautifulSoup (keep more structure)
         try:
@@ -754,13 +817,13 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
                 if not is_mostly_javascript(conservative_text):
                     extraction_methods.append(("CONSERVATIVE_SOUP", conservative_text))
                     if verbose:
-                        print(f"    Conservative BeautifulSoup: {len(conservative_text):,} characters")
+                        logger.info(f"    Conservative BeautifulSoup: {len(conservative_text):,} characters")
                 else:
                     if verbose:
-                        print(f"    Conservative BeautifulSoup rejected (mostly JavaScript): {len(conservative_text):,} characters")
+                        logger.info(f"    Conservative BeautifulSoup rejected (mostly JavaScript): {len(conservative_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Conservative BeautifulSoup failed: {e}")
+                logger.info(f"    Conservative BeautifulSoup failed: {e}")
         
         # Method 4: Table extraction (important for fleet data)
         try:
@@ -782,10 +845,10 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
                 table_text = "\n".join(table_data)
                 extraction_methods.append(("TABLE_DATA", table_text))
                 if verbose:
-                    print(f"    Table extraction: {len(table_text):,} characters")
+                    logger.info(f"    Table extraction: {len(table_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Table extraction failed: {e}")
+                logger.info(f"    Table extraction failed: {e}")
         
         # Method 5: Content-specific extraction (main, article, etc.)
         try:
@@ -809,13 +872,13 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
                             if not is_mostly_javascript(selector_text):
                                 extraction_methods.append((f"SELECTOR_{selector}", selector_text))
                                 if verbose:
-                                    print(f"    Content from {selector}: {len(selector_text):,} characters")
+                                    logger.info(f"    Content from {selector}: {len(selector_text):,} characters")
                                 break  # Use first successful selector
                 except:
                     continue
         except Exception as e:
             if verbose:
-                print(f"    Content selector extraction failed: {e}")
+                logger.info(f"    Content selector extraction failed: {e}")
         
         # Method 6: Raw text extraction (last resort)
         try:
@@ -828,18 +891,18 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
                 if not is_mostly_javascript(raw_text):
                     extraction_methods.append(("RAW_TEXT", raw_text))
                     if verbose:
-                        print(f"    Raw text extraction: {len(raw_text):,} characters")
+                        logger.info(f"    Raw text extraction: {len(raw_text):,} characters")
                 else:
                     if verbose:
-                        print(f"    Raw text extraction rejected (mostly JavaScript): {len(raw_text):,} characters")
+                        logger.info(f"    Raw text extraction rejected (mostly JavaScript): {len(raw_text):,} characters")
         except Exception as e:
             if verbose:
-                print(f"    Raw text extraction failed: {e}")
+                logger.info(f"    Raw text extraction failed: {e}")
         
         # Combine all extraction methods intelligently
         if not extraction_methods:
             if verbose:
-                print(f"    No content extracted, returning empty")
+                logger.info(f"    No content extracted, returning empty")
             return ""
         
         # Find the best extraction (longest with good content)
@@ -847,21 +910,16 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
         primary_content = best_extraction[1]
         
         if verbose:
-            print(f"    Primary content from {best_extraction[0]}: {len(primary_content):,} characters")
+            logger.info(f"    Primary content from {best_extraction[0]}: {len(primary_content):,} characters")
         
         # Add supplementary content that's significantly different
-        supplementary_content = []
-        for method_name, content in extraction_methods:
-            if method_name != best_extraction[0]:
-                # Include if it's substantially different or contains additional info
-                if len(content) > len(primary_content) * 0.2 and len(content) < len(primary_content) * 5:
-                    # Check if it has meaningful different content
-                    content_words = set(content.split())
-                    primary_words = set(primary_content.split())
-                    unique_words = content_words - primary_words
-                    
-                    if len(unique_words) > 10:  # Has meaningful unique content
-                        supplementary_content.append(f"=== {method_name} ===\n{content}")
+        supplementary_content = [
+            f"=== {method_name} ===\n{content}"
+            for method_name, content in select_supplementary_content(
+                primary_content, best_extraction[0], extraction_methods,
+                min_unique_words=10, max_length_ratio=5
+            )
+        ]
         
         # Combine primary + supplementary content
         combined_parts = [f"=== PRIMARY_CONTENT ===\n{primary_content}"]
@@ -870,9 +928,9 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
         final_content = "\n\n".join(combined_parts)
         
         if verbose:
-            print(f"    Final combined content: {len(final_content):,} characters")
-            print(f"    Content sources: {len(combined_parts)} different extraction methods")
-            print(f"    Content preview: {final_content[:300]}...")
+            logger.info(f"    Final combined content: {len(final_content):,} characters")
+            logger.info(f"    Content sources: {len(combined_parts)} different extraction methods")
+            logger.info(f"    Content preview: {final_content[:300]}...")
         
         return final_content
         
@@ -885,6 +943,77 @@ def get_complete_content_from_html(html_content: str, url: str, verbose: bool =
             return ""
 
 
+def append_progress_delta(save_path: str, phase: str, delta: Dict[str, Any]) -> None:
+    """
+    Append one phase delta to the JSONL progress file.
+    Each write only serializes what changed, so saves stay O(delta) instead of
+    rewriting the whole tracking state after every phase.
+    """
+    if not delta:
+        return
+    try:
+        with open(save_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'phase': phase, 'timestamp': time.time(), 'delta': delta}, default=str) + '\n')
+    except Exception as e:
+        logger.warning(f"Failed to append progress for {phase} to {save_path}: {e}")
+
+
+def search_criterion_evidence(
+    company_name: str,
+    criterion: str,
+    max_search_pages: int,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Run the targeted searches for one missing criterion and analyze their snippets.
+    
+    Returns a dict with the best evidence found (or None), the search queries and
+    sources attempted/successful for tracking, and the top result URLs for scraping.
+    """
+    search = {
+        'evidence': None,
+        'search_queries': [],
+        'sources_attempted': [],
+        'sources_successful': [],
+        'urls': []
+    }
+    questions = render_criterion_questions(criterion, company_name, 2)  # Use first 2 questions
+    
+    for query in questions:
+        try:
+            search_phrase = query.replace(f"{company_name} ", "")
+            # Track search query
+            search['search_queries'].append(f"{company_name} {search_phrase}")
+            search['sources_attempted'].append(f"Search: {search_phrase}")
+            search_results = search_google(company_name, search_phrase, max_pages=max_search_pages)
+            
+            if search_results:
+                if verbose:
+                    logger.info(f"    {criterion}: Found {len(search_results)} search results")
+                
+                # Actually analyze and collect evidence from individual searches
+                criterion_evidence = analyze_search_snippets(
+                    search_results, company_name, {criterion}
+                )
+                
+                # analyze_search_snippets returns CriteriaEvidence objects; keep only the targeted criterion
+                evidence_data = criterion_evidence.get(criterion)
+                if evidence_data is not None:
+                    search['evidence'] = evidence_data
+                    if verbose:
+                        logger.info(f"    Found {criterion} in targeted search (score: {evidence_data.score}, confidence: {evidence_data.confidence}%)")
+                    # Track successful search
+                    search['sources_successful'].append(f"Search: {search_phrase}")
+                
+                # Also collect URLs for potential web scraping
+                search['urls'].extend(list(search_results.keys())[:2])
+            
+        except Exception as e:
+            logger.warning(f"Enhanced search failed for {criterion}: {e}")
+            continue
+    
+    return search
+
 
 def analyze_company_sustainability(
     company_name: str,
@@ -893,7 +1022,8 @@ def analyze_company_sustainability(
     max_pdf_reports: int = 8,   # Increased from 5 to 8 for more PDF analysis
     max_web_pages: int = 6,     # Increased from 3 to 6 for more web scraping
     verbose: bool = True,
-    use_crawler: bool = False
+    use_crawler: bool = False,
+    concurrency: int = MAX_CONCURRENT_AI_BATCHES
 ) -> Dict[str, Any]:
     """
     IMPROVED: AI-powered sustainability analysis with page-based limits:
@@ -912,6 +1042,7 @@ def analyze_company_sustainability(
         max_web_pages: Maximum number of web pages to scrape (TEMPORARILY DISABLED - scrapes all URLs)
         verbose: Whether to show detailed progress output
         use_crawler: Enable deep web crawling for long-tail evidence (slower but more comprehensive)
+        concurrency: Maximum number of OpenAI batches / criterion searches in flight at once
     """
     start_time = time.time()
     
@@ -935,12 +1066,46 @@ def analyze_company_sustainability(
         'sources_successful': []
     }
     
-    # Set up temporary save file for incremental progress
+    # Temporary JSONL record of each phase, kept only if the analysis doesn't finish
     import tempfile
-    temp_save_path = tempfile.mktemp(suffix=f"_{company_name.replace(' ', '_')}_analysis.json")
-    
+    safe_company_name = re.sub(r'[^A-Za-z0-9_-]+', '_', company_name)[:50]
+    temp_fd, temp_save_path = tempfile.mkstemp(prefix=f"{safe_company_name}_", suffix="_analysis.jsonl")
+    os.close(temp_fd)
+    logger.debug(f"Recording analysis progress in {temp_save_path}")
+
+    # What has already been written to temp_save_path, so each save only appends the delta
+    saved_list_counts = {key: 0 for key, value in analysis_tracking.items() if isinstance(value, list)}
+    saved_phase_times = set()
+    saved_evidence = {}
+
+    def save_progress(phase_name: str):
+        """Append everything that changed since the last save to the JSONL progress file"""
+        delta = {}
+        for key, saved_count in saved_list_counts.items():
+            new_items = analysis_tracking[key][saved_count:]
+            if new_items:
+                delta[key] = new_items
+                saved_list_counts[key] = len(analysis_tracking[key])
+
+        new_phase_times = {k: v for k, v in analysis_tracking['phase_times'].items() if k not in saved_phase_times}
+        if new_phase_times:
+            delta['phase_times'] = new_phase_times
+            saved_phase_times.update(new_phase_times)
+
+        changed_evidence = {c: e for c, e in evidence_details.items() if saved_evidence.get(c) is not e}
+        if changed_evidence:
+            delta['evidence_details'] = {c: asdict(e) for c, e in changed_evidence.items()}
+            saved_evidence.update(changed_evidence)
+
+        append_progress_delta(temp_save_path, phase_name, delta)
+
     def show_final_summary():
         """Show the final results summary"""
+        # The analysis finished, so its progress record is no longer needed
+        try:
+            os.remove(temp_save_path)
+        except OSError as e:
+            logger.debug(f"Could not remove progress file {temp_save_path}: {e}")
         total_time = time.time() - start_time
         if verbose:
             print(f"\n🔍 Final Results Summary")
@@ -1020,17 +1185,17 @@ def analyze_company_sustainability(
         }
     
     if verbose:
-        print(f"\nAI SUSTAINABILITY ANALYSIS: {company_name}")
-        print("=" * 60)
-        print(f"Analyzing {len(criteria)} criteria using PURE AI logic")
-        print(f"Standardized limits: Search={MAX_SEARCH_PAGES_PER_CRITERION}, Web=UNLIMITED (all URLs), PDFs=Full analysis")
-        print("=" * 60)
+        logger.info(f"AI SUSTAINABILITY ANALYSIS: {company_name}")
+        logger.info("=" * 60)
+        logger.info(f"Analyzing {len(criteria)} criteria using PURE AI logic")
+        logger.info(f"Standardized limits: Search={MAX_SEARCH_PAGES_PER_CRITERION}, Web=UNLIMITED (all URLs), PDFs=Full analysis")
+        logger.info("=" * 60)
 
     # Phase 0: SMART INITIAL SEARCH (NEW - Use available search functions)
     if verbose:
-        print(f"\nPhase 0: PDF Sustainability Reports (PRIORITY)")
-        print("-" * 40)
-        print(f"  Analyzing sustainability PDFs first - highest quality evidence")
+        logger.info(f"Phase 0: PDF Sustainability Reports (PRIORITY)")
+        logger.info("-" * 40)
+        logger.info(f"  Analyzing sustainability PDFs first - highest quality evidence")
     
     # EFFICIENCY: Filter needed criteria to exclude already verified evidence
     remaining_criteria = criteria.copy()
@@ -1041,15 +1206,15 @@ def analyze_company_sustainability(
         if max_pdf_reports > 0:
             # Step 1: Get high-quality PDF sustainability reports FIRST (as user requested)
             if verbose:
-                print(f"  Getting sustainability PDF reports...")
+                logger.info(f"  Getting sustainability PDF reports...")
                 
             sustainability_pdfs = get_sustainability_reports(company_name, max_results=max_pdf_reports)
         else:
             sustainability_pdfs = []
             if verbose:
-                print(f"  Skipping PDF analysis (max_pdf_reports=0)")
+                logger.info(f"  Skipping PDF analysis (max_pdf_reports=0)")
         if verbose:
-            print(f"  Found {len(sustainability_pdfs)} sustainability PDFs")
+            logger.info(f"  Found {len(sustainability_pdfs)} sustainability PDFs")
         
         # Track PDF sources
         analysis_tracking['pdfs_checked'] = list(sustainability_pdfs)
@@ -1061,28 +1226,28 @@ def analyze_company_sustainability(
                 break
                 
             if verbose:
-                print(f"  Analyzing PDF {i+1}/{len(sustainability_pdfs)}: {pdf_url}")
+                logger.info(f"  Analyzing PDF {i+1}/{len(sustainability_pdfs)}: {pdf_url}")
             
             try:
                 pdf_text = extract_pdf_content(pdf_url, company_name)
                 if not pdf_text:
                     if verbose:
-                        print(f"    PDF {i+1}: Empty or invalid content")
+                        logger.info(f"    PDF {i+1}: Empty or invalid content")
                     continue
                     
                 # Validate PDF ownership to prevent third-party PDFs
                 if not validate_pdf_ownership(pdf_url, pdf_text, company_name):
                     if verbose:
-                        print(f"    PDF {i+1}: Failed ownership validation - skipping")
+                        logger.info(f"    PDF {i+1}: Failed ownership validation - skipping")
                     continue
                         
                 full_pdf_length = len(pdf_text)
                 if verbose:
-                    print(f"    PDF {i+1}: {full_pdf_length:,} characters extracted")
+                    logger.info(f"    PDF {i+1}: {full_pdf_length:,} characters extracted")
                 
                 # Use EFFICIENT AI batching - analyze_text_with_ai_batched handles large texts internally
                 page_evidence = analyze_text_with_ai_batched(
-                    pdf_text, pdf_url, remaining_criteria, company_name
+                    pdf_text, pdf_url, remaining_criteria, company_name, concurrency=concurrency
                 )
                 
                 # Update evidence from PDF
@@ -1095,16 +1260,16 @@ def analyze_company_sustainability(
                             evidence_details[criterion] = evidence
                             remaining_criteria.discard(criterion)
                             if verbose:
-                                print(f"    Found {criterion} in PDF (score: {evidence.score})")
+                                logger.info(f"    Found {criterion} in PDF (score: {evidence.score})")
                         elif evidence.score > evidence_details[criterion].score:
                             # Better evidence for existing criterion
                             evidence_details[criterion] = evidence
                             if verbose:
-                                print(f"    Found better {criterion} in PDF (score: {evidence.score} vs {evidence_details[criterion].score})")
+                                logger.info(f"    Found better {criterion} in PDF (score: {evidence.score} vs {evidence_details[criterion].score})")
                         else:
                             # We already have same or better evidence
                             if verbose:
-                                print(f"    Already found {criterion} with score {evidence_details[criterion].score} (PDF score: {evidence.score})")
+                                logger.info(f"    Already found {criterion} with score {evidence_details[criterion].score} (PDF score: {evidence.score})")
                 
                 # Track successful PDF processing
                 if pdf_found_evidence:
@@ -1112,7 +1277,7 @@ def analyze_company_sustainability(
                 
             except Exception as e:
                 if verbose:
-                    print(f"    PDF {i+1} analysis failed: {e}")
+                    logger.info(f"    PDF {i+1} analysis failed: {e}")
                 analysis_tracking['processing_errors'].append(f"PDF analysis failed for {pdf_url}: {str(e)}")
                 continue
     
@@ -1122,6 +1287,7 @@ def analyze_company_sustainability(
         # Track phase completion
         analysis_tracking['phase_times']['Phase 0: PDF Analysis'] = initial_search_time
         analysis_tracking['phases_completed'].append(f'Phase 0: PDF Analysis Complete ({len(evidence_details)} criteria found)')
+        save_progress('Phase 0')
         
         # Progress logging
         criteria_found = len(evidence_details)
@@ -1129,11 +1295,11 @@ def analyze_company_sustainability(
         logger.info(f"📊 Phase 0 complete: {criteria_found}/{len(criteria)} criteria found ({progress_pct:.1f}%) in {initial_search_time:.1f}s")
         
         if verbose:
-            print(f"  Phase 0 found evidence for {len(evidence_details)}/{len(criteria)} criteria")
+            logger.info(f"  Phase 0 found evidence for {len(evidence_details)}/{len(criteria)} criteria")
             
             # GRACEFUL: Show that PDF failures are non-blocking
             if not evidence_details and sustainability_pdfs:
-                print(f"  PDF analysis complete - no company PDFs found, proceeding to search analysis")
+                logger.info(f"  PDF analysis complete - no company PDFs found, proceeding to search analysis")
             
             # MODIFIED: Continue searching for better evidence instead of early exit
             if len(evidence_details) >= len(criteria):
@@ -1144,11 +1310,11 @@ def analyze_company_sustainability(
                 
                 if avg_score >= quality_threshold:
                     if verbose:
-                        print(f"  ALL CRITERIA FOUND with high quality (avg score: {avg_score:.2f}) - skipping web scraping")
+                        logger.info(f"  ALL CRITERIA FOUND with high quality (avg score: {avg_score:.2f}) - skipping web scraping")
                         return show_final_summary()
                 else:
                     if verbose:
-                        print(f"  ALL CRITERIA FOUND but continuing search for better evidence (avg score: {avg_score:.2f})")
+                        logger.info(f"  ALL CRITERIA FOUND but continuing search for better evidence (avg score: {avg_score:.2f})")
                     # Continue to web scraping to find better evidence
             
     except KeyboardInterrupt:
@@ -1157,21 +1323,21 @@ def analyze_company_sustainability(
         logger.error(f"Phase 0 analysis failed: {e}")
         analysis_tracking['processing_errors'].append(f"Phase 0 failed: {str(e)}")
         if verbose:
-            print(f"  Phase 0 failed: {e}")
+            logger.info(f"  Phase 0 failed: {e}")
 
     # Phase 1: Enhanced Search Analysis (for remaining criteria only)
     # EFFICIENCY: Update remaining criteria and skip if all found
     remaining_criteria = criteria - set(evidence_details.keys())
     if not remaining_criteria:
         if verbose:
-            print(f"  ALL CRITERIA FOUND in Phase 0 - skipping remaining phases")
+            logger.info(f"  ALL CRITERIA FOUND in Phase 0 - skipping remaining phases")
         analysis_tracking['phases_completed'].append('All criteria found in Phase 0 - remaining phases skipped')
         return show_final_summary()
         
     if remaining_criteria and verbose:
-        print(f"\nPhase 1: Enhanced Search Analysis")
-        print("-" * 40)
-        print(f"  Analyzing search results for {len(remaining_criteria)} missing criteria: {list(remaining_criteria)}")
+        logger.info(f"Phase 1: Enhanced Search Analysis")
+        logger.info("-" * 40)
+        logger.info(f"  Analyzing search results for {len(remaining_criteria)} missing criteria: {list(remaining_criteria)}")
     
     snippet_start_time = time.time()
     analysis_tracking['phases_completed'].append('Phase 1: Enhanced Search Analysis Started')
@@ -1183,57 +1349,35 @@ def analyze_company_sustainability(
         if remaining_criteria and max_search_pages > 0:
             # ENHANCED: Use the sophisticated search functions for missing criteria
             if verbose:
-                print(f"  Getting enhanced targeted search results...")
+                logger.info(f"  Getting enhanced targeted search results...")
             
             try:
                 # Collect evidence from individual searches instead of re-analyzing everything
                 individual_evidence = {}
                 
-                # For each missing criterion, do targeted searches and collect evidence
-                for criterion in remaining_criteria:
-                    if criterion in CRITERIA_QUESTIONS:
-                        questions = CRITERIA_QUESTIONS[criterion][:2]  # Use first 2 questions
-                        
-                        for question_template in questions:
-                            try:
-                                query = question_template.format(company=company_name)
-                                search_phrase = query.replace(f"{company_name} ", "")
-                                # Track search query
-                                analysis_tracking['search_queries'].append(f"{company_name} {search_phrase}")
-                                analysis_tracking['sources_attempted'].append(f"Search: {search_phrase}")
-                                search_results = search_google(company_name, search_phrase, max_pages=max_search_pages)
-                                
-                                if search_results:
-                                    if verbose:
-                                        print(f"    {criterion}: Found {len(search_results)} search results")
-                                    
-                                    # Actually analyze and collect evidence from individual searches
-                                    criterion_evidence = analyze_search_snippets(
-                                        search_results, company_name, {criterion}
-                                    )
-                                    
-                                    # Store evidence from individual searches (analyze_search_snippets now returns CriteriaEvidence objects)
-                                    for found_criterion, evidence_data in criterion_evidence.items():
-                                        if found_criterion == criterion:  # Only the targeted criterion
-                                            # analyze_search_snippets now always returns CriteriaEvidence objects
-                                            individual_evidence[criterion] = evidence_data
-                                            
-                                            if verbose:
-                                                print(f"    Found {criterion} in targeted search (score: {evidence_data.score}, confidence: {evidence_data.confidence}%)")
-                                            # Track successful search
-                                            analysis_tracking['sources_successful'].append(f"Search: {search_phrase}")
-                                            break  # Found evidence for this criterion, move to next
-                                    
-                                    # Also collect URLs for potential web scraping
-                                    enhanced_search_urls.extend(list(search_results.keys())[:2])
-                                
-                            except Exception as e:
-                                logger.warning(f"Enhanced search failed for {criterion}: {e}")
-                                continue
+                # Each missing criterion gets its own targeted searches, run concurrently
+                search_criteria = [criterion for criterion in remaining_criteria if criterion in CRITERIA_QUESTIONS]
+                if search_criteria:
+                    # At most `concurrency` searches in flight on the shared pool; results are
+                    # collected in criterion order
+                    pending = []
+                    criterion_searches = []
+                    for criterion in search_criteria:
+                        if len(pending) == max(1, concurrency):
+                            criterion_searches.append(pending.pop(0).result())
+                        pending.append(_CRITERION_SEARCH_EXECUTOR.submit(
+                            search_criterion_evidence, company_name, criterion, max_search_pages, verbose
+                        ))
+                    criterion_searches.extend(future.result() for future in pending)
                     
-                    # Early exit if found evidence for this criterion
-                    if criterion in individual_evidence:
-                        continue
+                    # Merge in criterion order so tracking output matches a sequential run
+                    for criterion, search in zip(search_criteria, criterion_searches):
+                        analysis_tracking['search_queries'].extend(search['search_queries'])
+                        analysis_tracking['sources_attempted'].extend(search['sources_attempted'])
+                        analysis_tracking['sources_successful'].extend(search['sources_successful'])
+                        enhanced_search_urls.extend(search['urls'])
+                        if search['evidence'] is not None:
+                            individual_evidence[criterion] = search['evidence']
                 
                 # Use evidence collected from individual searches with proper replacement logic
                 if individual_evidence:
@@ -1244,33 +1388,33 @@ def analyze_company_sustainability(
                             evidence_details[criterion] = evidence_data
                             remaining_criteria.discard(criterion)
                             if verbose:
-                                print(f"    Added new evidence for {criterion} (score: {evidence_data.score})")
+                                logger.info(f"    Added new evidence for {criterion} (score: {evidence_data.score})")
                         else:
                             # Check if new evidence is better than existing
                             existing_evidence = evidence_details[criterion]
                             if should_replace_evidence_ai(evidence_data, existing_evidence):
                                 evidence_details[criterion] = evidence_data
                                 if verbose:
-                                    print(f"    Replaced evidence for {criterion} (new score: {evidence_data.score} vs old: {existing_evidence.score})")
+                                    logger.info(f"    Replaced evidence for {criterion} (new score: {evidence_data.score} vs old: {existing_evidence.score})")
                             else:
                                 if verbose:
-                                    print(f"    Kept existing evidence for {criterion} (existing score: {existing_evidence.score} vs new: {evidence_data.score})")
+                                    logger.info(f"    Kept existing evidence for {criterion} (existing score: {existing_evidence.score} vs new: {evidence_data.score})")
                             
                     if verbose:
-                        print(f"  Enhanced search processed evidence for {len(individual_evidence)} criteria")
+                        logger.info(f"  Enhanced search processed evidence for {len(individual_evidence)} criteria")
                 
                 if verbose:
-                    print(f"  Collected {len(enhanced_search_urls)} enhanced search results")
+                    logger.info(f"  Collected {len(enhanced_search_urls)} enhanced search results")
                 
                 # SKIP redundant batch analysis since we already analyzed individual searches
                 
             except Exception as e:
                 logger.error(f"Enhanced search analysis failed: {e}")
                 if verbose:
-                    print(f"  Enhanced search analysis failed: {e}")
+                    logger.info(f"  Enhanced search analysis failed: {e}")
         elif remaining_criteria and max_search_pages == 0:
             if verbose:
-                print(f"  Skipping search analysis (max_search_pages=0)")
+                logger.info(f"  Skipping search analysis (max_search_pages=0)")
         
         snippet_time = time.time() - snippet_start_time
         remaining_criteria = criteria - set(evidence_details.keys())
@@ -1278,6 +1422,7 @@ def analyze_company_sustainability(
         # Track phase completion
         analysis_tracking['phase_times']['Phase 1: Enhanced Search'] = snippet_time
         analysis_tracking['phases_completed'].append(f'Phase 1: Enhanced Search Complete ({len(evidence_details)} criteria found)')
+        save_progress('Phase 1')
         
         # Progress logging
         criteria_found = len(evidence_details)
@@ -1285,8 +1430,8 @@ def analyze_company_sustainability(
         logger.info(f"📊 Phase 1 complete: {criteria_found}/{len(criteria)} criteria found ({progress_pct:.1f}%) in {snippet_time:.1f}s")
         
         if verbose:
-            print(f"  Total evidence: {len(evidence_details)}/{len(criteria)} criteria")
-            print(f"  Analysis time: {snippet_time:.2f}s")
+            logger.info(f"  Total evidence: {len(evidence_details)}/{len(criteria)} criteria")
+            logger.info(f"  Analysis time: {snippet_time:.2f}s")
             
         # MODIFIED: Continue searching for better evidence instead of early exit
         if len(evidence_details) >= len(criteria):
@@ -1297,17 +1442,17 @@ def analyze_company_sustainability(
             
             if avg_score >= quality_threshold:
                 if verbose:
-                    print(f"  ALL CRITERIA FOUND with high quality (avg score: {avg_score:.2f}) - skipping web scraping")
+                    logger.info(f"  ALL CRITERIA FOUND with high quality (avg score: {avg_score:.2f}) - skipping web scraping")
                     return show_final_summary()
             else:
                 if verbose:
-                    print(f"  ALL CRITERIA FOUND but continuing search for better evidence (avg score: {avg_score:.2f})")
+                    logger.info(f"  ALL CRITERIA FOUND but continuing search for better evidence (avg score: {avg_score:.2f})")
                 # Continue to web scraping to find better evidence
 
     except Exception as e:
         logger.error(f"Enhanced search analysis failed: {e}")
         if verbose:
-            print(f"  Enhanced search analysis failed: {e}")
+            logger.info(f"  Enhanced search analysis failed: {e}")
 
     # Phase 3: Smart Web Scraping (FINAL FALLBACK with user-specified limits)
     # TIMER: Initialize Phase 3 timer variables
@@ -1324,10 +1469,10 @@ def analyze_company_sustainability(
         phase3_start_time = time.time()
         
         if verbose:
-            print(f"\nPhase 3: Smart Web Scraping (FINAL FALLBACK - {scraping_intensity})")
-            print("-" * 40)
-            print(f"  Scraping ALL collected URLs for {len(remaining_criteria)} missing criteria: {list(remaining_criteria)}")
-            print(f"  ⏰ TIMER: Phase 3 has 40-minute timeout - will stop automatically if exceeded")
+            logger.info(f"Phase 3: Smart Web Scraping (FINAL FALLBACK - {scraping_intensity})")
+            logger.info("-" * 40)
+            logger.info(f"  Scraping ALL collected URLs for {len(remaining_criteria)} missing criteria: {list(remaining_criteria)}")
+            logger.info(f"  ⏰ TIMER: Phase 3 has 40-minute timeout - will stop automatically if exceeded")
         
         try:
             # ENHANCED: Balanced URL collection ensuring each criterion gets representation
@@ -1338,11 +1483,11 @@ def analyze_company_sustainability(
             if enhanced_search_urls:
                 phase1_urls = enhanced_search_urls[:dynamic_page_limit]
                 if verbose:
-                    print(f"  Phase 1 provided {len(phase1_urls)} URLs from enhanced search")
+                    logger.info(f"  Phase 1 provided {len(phase1_urls)} URLs from enhanced search")
                     logger.debug(f"Enhanced search URLs: {phase1_urls}")
             else:
                 if verbose:
-                    print(f"  No Phase 1 URLs available (likely due to max_search_pages=0)")
+                    logger.info(f"  No Phase 1 URLs available (likely due to max_search_pages=0)")
             
             # Source 2: Get balanced URLs ensuring each criterion gets representation
             try:
@@ -1352,7 +1497,7 @@ def analyze_company_sustainability(
                     total_criterion_urls = 0
                     
                     if verbose:
-                        print(f"  Getting balanced URLs for {len(remaining_criteria)} criteria...")
+                        logger.info(f"  Getting balanced URLs for {len(remaining_criteria)} criteria...")
                     
                     # Collect URLs for each missing criterion separately
                     for criterion in remaining_criteria:
@@ -1360,8 +1505,8 @@ def analyze_company_sustainability(
                         current_phase3_time = time.time() - phase3_start_time
                         if current_phase3_time > phase3_timeout:
                             if verbose:
-                                print(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes during URL collection ({current_phase3_time/60:.1f} minutes)")
-                                print(f"  Stopping URL collection and proceeding with current URLs")
+                                logger.info(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes during URL collection ({current_phase3_time/60:.1f} minutes)")
+                                logger.info(f"  Stopping URL collection and proceeding with current URLs")
                             analysis_tracking['processing_errors'].append(f"Phase 3 URL collection timeout after {current_phase3_time/60:.1f} minutes")
                             break
                             
@@ -1372,19 +1517,19 @@ def analyze_company_sustainability(
                             urls_per_criterion[criterion] = criterion_urls
                             total_criterion_urls += len(criterion_urls)
                             if verbose:
-                                print(f"    {criterion}: {len(criterion_urls)} URLs found (Phase 3 time: {current_phase3_time/60:.1f} minutes)")
+                                logger.info(f"    {criterion}: {len(criterion_urls)} URLs found (Phase 3 time: {current_phase3_time/60:.1f} minutes)")
                                 if criterion_urls:
-                                    print(f"      URLs collected for {criterion}:")
+                                    logger.info(f"      URLs collected for {criterion}:")
                                     for j, url in enumerate(criterion_urls, 1):
-                                        print(f"        {j}. {url}")
+                                        logger.info(f"        {j}. {url}")
                                 else:
-                                    print(f"      No URLs found for {criterion}")
+                                    logger.info(f"      No URLs found for {criterion}")
                         except Exception as e:
                             logger.warning(f"Failed to get URLs for {criterion}: {e}")
                             urls_per_criterion[criterion] = []
                     
                     if verbose:
-                        print(f"  Total URLs collected: {total_criterion_urls} (before balanced distribution)")
+                        logger.info(f"  Total URLs collected: {total_criterion_urls} (before balanced distribution)")
                     
                     # SIMPLE COMBINATION: Add all collected URLs (no fair allocation needed)
                     scraping_urls.extend(phase1_urls)
@@ -1396,17 +1541,17 @@ def analyze_company_sustainability(
                             if criterion_urls:
                                 all_criterion_urls.extend(criterion_urls)
                                 if verbose:
-                                    print(f"    {criterion}: collected {len(criterion_urls)} URLs")
+                                    logger.info(f"    {criterion}: collected {len(criterion_urls)} URLs")
                         
                         scraping_urls.extend(all_criterion_urls)
                         
                         if verbose:
-                            print(f"  Total criterion-specific URLs: {len(all_criterion_urls)}")
-                            print(f"  Total URLs before deduplication: {len(scraping_urls)} (Phase 1: {len(phase1_urls)}, Criterion-specific: {len(all_criterion_urls)})")
+                            logger.info(f"  Total criterion-specific URLs: {len(all_criterion_urls)}")
+                            logger.info(f"  Total URLs before deduplication: {len(scraping_urls)} (Phase 1: {len(phase1_urls)}, Criterion-specific: {len(all_criterion_urls)})")
                     else:
                         if verbose:
-                            print(f"  No criterion-specific URLs found")
-                            print(f"  Total URLs before deduplication: {len(scraping_urls)} (Phase 1 only: {len(phase1_urls)})")
+                            logger.info(f"  No criterion-specific URLs found")
+                            logger.info(f"  Total URLs before deduplication: {len(scraping_urls)} (Phase 1 only: {len(phase1_urls)})")
                     
             except Exception as e:
                 logger.warning(f"Failed to get balanced URLs: {e}")
@@ -1414,7 +1559,7 @@ def analyze_company_sustainability(
                 scraping_urls.extend(phase1_urls)
             
             if verbose:
-                print(f"  Total URLs collected before deduplication: {len(scraping_urls)}")
+                logger.info(f"  Total URLs collected before deduplication: {len(scraping_urls)}")
                 logger.debug(f"All collected URLs: {scraping_urls}")
             
             # Remove duplicates while preserving order and criterion balance
@@ -1425,50 +1570,50 @@ def analyze_company_sustainability(
             none_count = 0
             
             if verbose:
-                print(f"  Processing {len(scraping_urls)} URLs for deduplication:")
+                logger.info(f"  Processing {len(scraping_urls)} URLs for deduplication:")
             
             for i, url in enumerate(scraping_urls, 1):
                 # TIMER CHECK: Check if Phase 3 has exceeded 40 minutes during deduplication
                 current_phase3_time = time.time() - phase3_start_time
                 if current_phase3_time > phase3_timeout:
                     if verbose:
-                        print(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes during deduplication ({current_phase3_time/60:.1f} minutes)")
-                        print(f"  Stopping deduplication and proceeding with current unique URLs")
+                        logger.info(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes during deduplication ({current_phase3_time/60:.1f} minutes)")
+                        logger.info(f"  Stopping deduplication and proceeding with current unique URLs")
                     analysis_tracking['processing_errors'].append(f"Phase 3 deduplication timeout after {current_phase3_time/60:.1f} minutes")
                     break
                     
                 if not url:
                     none_count += 1
                     if verbose:
-                        print(f"    {i}. [SKIPPED - None/empty URL]")
+                        logger.info(f"    {i}. [SKIPPED - None/empty URL]")
                 elif url.endswith('.pdf'):
                     pdf_count += 1
                     if verbose:
-                        print(f"    {i}. [SKIPPED - PDF] {url}")
+                        logger.info(f"    {i}. [SKIPPED - PDF] {url}")
                 elif url in seen_urls:
                     duplicate_count += 1
                     if verbose:
-                        print(f"    {i}. [SKIPPED - DUPLICATE] {url}")
+                        logger.info(f"    {i}. [SKIPPED - DUPLICATE] {url}")
                 elif url not in seen_urls:
                     seen_urls.add(url)
                     unique_scraping_urls.append(url)
                     if verbose:
-                        print(f"    {i}. [ACCEPTED] {url}")
+                        logger.info(f"    {i}. [ACCEPTED] {url}")
             
             if verbose:
-                print(f"  URLs after deduplication: {len(unique_scraping_urls)}")
-                print(f"  Filtered out: {pdf_count} PDFs, {duplicate_count} duplicates, {none_count} None/empty")
-                print(f"  Balanced distribution ensures each criterion gets representation")
-                print(f"  Final URLs to scrape:")
+                logger.info(f"  URLs after deduplication: {len(unique_scraping_urls)}")
+                logger.info(f"  Filtered out: {pdf_count} PDFs, {duplicate_count} duplicates, {none_count} None/empty")
+                logger.info(f"  Balanced distribution ensures each criterion gets representation")
+                logger.info(f"  Final URLs to scrape:")
                 for i, url in enumerate(unique_scraping_urls, 1):
-                    print(f"    {i}. {url}")
+                    logger.info(f"    {i}. {url}")
                 logger.debug(f"Unique URLs: {unique_scraping_urls}")
             
             max_scrape_pages = min(dynamic_page_limit, len(unique_scraping_urls))  # Use dynamic limit
             
             if unique_scraping_urls:
                 if verbose:
-                    print(f"  Found {len(unique_scraping_urls)} targeted URLs to scrape")
+                    logger.info(f"  Found {len(unique_scraping_urls)} targeted URLs to scrape")
                 
                 # Track remaining criteria at start to avoid modification during iteration
                 criteria_to_find = remaining_criteria.copy()
@@ -1480,8 +1625,8 @@ def analyze_company_sustainability(
                     current_phase3_time = time.time() - phase3_start_time
                     if current_phase3_time > phase3_timeout:
                         if verbose:
-                            print(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes before browser launch ({current_phase3_time/60:.1f} minutes)")
-                            print(f"  Skipping Playwright and trying fallback scraping")
+                            logger.info(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes before browser launch ({current_phase3_time/60:.1f} minutes)")
+                            logger.info(f"  Skipping Playwright and trying fallback scraping")
                         analysis_tracking['processing_errors'].append(f"Phase 3 browser launch timeout after {current_phase3_time/60:.1f} minutes")
                         playwright_success = False
                     else:
@@ -1506,47 +1651,61 @@ def analyze_company_sustainability(
                                 current_phase3_time = time.time() - phase3_start_time
                                 if current_phase3_time > phase3_timeout:
                                     if verbose:
-                                        print(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes ({current_phase3_time/60:.1f} minutes)")
-                                        print(f"  Stopping web scraping and returning current results")
+                                        logger.info(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes ({current_phase3_time/60:.1f} minutes)")
+                                        logger.info(f"  Stopping web scraping and returning current results")
                                     analysis_tracking['processing_errors'].append(f"Phase 3 timeout after {current_phase3_time/60:.1f} minutes")
                                     analysis_tracking['phases_completed'].append(f'Phase 3: Web Scraping Timeout ({len(evidence_details)} criteria found)')
                                     return show_final_summary()
                                     
                                 try:
                                     if verbose:
-                                        print(f"  Scraping page {i+1}/{max_scrape_pages}: {url} (Phase 3 time: {current_phase3_time/60:.1f} minutes)")
-                                    
-                                    # Get page content with timeout (network timeout only)
-                                    if verbose:
-                                        print(f"    Navigating to {url}...")
-                                    response = page.goto(url, timeout=PLAYWRIGHT_TIMEOUT)
-                                    
-                                    if verbose:
-                                        print(f"    Response status: {response.status if response else 'No response'}")
+                                        logger.info(f"  Scraping page {i+1}/{max_scrape_pages}: {url} (Phase 3 time: {current_phase3_time/60:.1f} minutes)")
                                     
-                                    if response and response.status == 200:
+                                    # Pages extracted on an earlier run come from the URL text cache without a fetch
+                                    complete_content = get_cached_page_text(url)
+                                    if complete_content is not None:
+                                        if verbose:
+                                            logger.info(f"    Using cached content for {url} ({len(complete_content):,} chars)")
+                                    else:
+                                        # Get page content with timeout (network timeout only)
                                         if verbose:
-                                            print(f"    Getting COMPLETE website content...")
+                                            logger.info(f"    Navigating to {url}...")
+                                        response = page.goto(url, timeout=PLAYWRIGHT_TIMEOUT)
                                         
-                                        # NEW: Get complete website content with multiple extraction methods
-                                        complete_content = get_complete_website_content(page, url, verbose)
+                                        if verbose:
+                                            logger.info(f"    Response status: {response.status if response else 'No response'}")
                                         
+                                        if response and response.status == 200:
+                                            if verbose:
+                                                logger.info(f"    Getting COMPLETE website content...")
+                                            
+                                            # NEW: Get complete website content with multiple extraction methods
+                                            complete_content = get_complete_website_content(page, url, verbose)
+                                            cache_page_text(url, complete_content)
+                                        else:
+                                            if verbose:
+                                                logger.info(f"    Failed to load page - Status: {response.status if response else 'No response'}")
+                                                if response:
+                                                    logger.info(f"    Response URL: {response.url}")
+                                                    logger.info(f"    Response headers: {dict(response.headers)}")
+                                    
+                                    if complete_content is not None:
                                         if len(complete_content.strip()) < 50:
                                             if verbose:
-                                                print(f"    WARNING: Very little content extracted ({len(complete_content)} chars)")
-                                                print(f"    Raw content preview: {complete_content[:200]}")
+                                                logger.info(f"    WARNING: Very little content extracted ({len(complete_content)} chars)")
+                                                logger.debug(f"    Raw content preview: {complete_content[:200]}")
                                         
                                         # Print scraped content for debugging
                                         if verbose:
-                                            print(f"    Analyzing COMPLETE content from {url} ({len(complete_content)} chars)")
-                                            print(f"    --- COMPLETE SCRAPED CONTENT START ---")
-                                            print(complete_content[:3000] + "..." if len(complete_content) > 3000 else complete_content)
-                                            print(f"    --- COMPLETE SCRAPED CONTENT END ---")
+                                            logger.info(f"    Analyzing COMPLETE content from {url} ({len(complete_content)} chars)")
+                                            logger.debug(f"    --- COMPLETE SCRAPED CONTENT START ---")
+                                            logger.debug(complete_content[:3000] + "..." if len(complete_content) > 3000 else complete_content)
+                                            logger.debug(f"    --- COMPLETE SCRAPED CONTENT END ---")
                                         
                                         if len(complete_content.strip()) > 50:  # Only analyze if we have meaningful content
                                             # Use the existing batching function with COMPLETE extracted content
                                             web_evidence = analyze_text_with_ai_batched(
-                                                complete_content, url, criteria_to_find, company_name
+                                                complete_content, url, criteria_to_find, company_name, concurrency=concurrency
                                             )
                                             
                                             # Update evidence for final missing criteria
@@ -1557,23 +1716,17 @@ def analyze_company_sustainability(
                                                     remaining_criteria.discard(criterion)
                                                     criteria_to_find.discard(criterion)
                                                     if verbose:
-                                                        print(f"    Web scraping found {criterion} (score: {evidence.score})")
+                                                        logger.info(f"    Web scraping found {criterion} (score: {evidence.score})")
                                         else:
                                             if verbose:
-                                                print(f"    Skipping AI analysis - insufficient content")
-                                    else:
-                                        if verbose:
-                                            print(f"    Failed to load page - Status: {response.status if response else 'No response'}")
-                                            if response:
-                                                print(f"    Response URL: {response.url}")
-                                                print(f"    Response headers: {dict(response.headers)}")
+                                                logger.info(f"    Skipping AI analysis - insufficient content")
                                                     
                                 except Exception as e:
                                     logger.error(f"Failed to scrape {url}: {e}")
                                     if verbose:
-                                        print(f"    Page {i+1}: Scraping failed - {e}")
+                                        logger.info(f"    Page {i+1}: Scraping failed - {e}")
                                         import traceback
-                                        print(f"    Full error: {traceback.format_exc()}")
+                                        logger.debug(f"    Full error: {traceback.format_exc()}")
                                     continue
                             
                             browser.close()
@@ -1582,12 +1735,12 @@ def analyze_company_sustainability(
                 except Exception as browser_error:
                     logger.error(f"Browser launch failed: {browser_error}")
                     if verbose:
-                        print(f"  Browser launch failed: {browser_error}")
+                        logger.info(f"  Browser launch failed: {browser_error}")
                 
                 # Fallback to requests if Playwright failed and we still need criteria
                 if not playwright_success and criteria_to_find:
                     if verbose:
-                        print(f"  Falling back to requests-based scraping...")
+                        logger.info(f"  Falling back to requests-based scraping...")
                     
                                     # Process URLs using requests instead of browser (respecting max_scrape_pages)
                 for i, url in enumerate(unique_scraping_urls[:max_scrape_pages]):
@@ -1598,47 +1751,58 @@ def analyze_company_sustainability(
                     current_phase3_time = time.time() - phase3_start_time
                     if current_phase3_time > phase3_timeout:
                         if verbose:
-                            print(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes ({current_phase3_time/60:.1f} minutes)")
-                            print(f"  Stopping fallback scraping and returning current results")
+                            logger.info(f"  ⏰ TIMER EXPIRED: Phase 3 exceeded 40 minutes ({current_phase3_time/60:.1f} minutes)")
+                            logger.info(f"  Stopping fallback scraping and returning current results")
                         analysis_tracking['processing_errors'].append(f"Phase 3 fallback timeout after {current_phase3_time/60:.1f} minutes")
                         analysis_tracking['phases_completed'].append(f'Phase 3: Fallback Scraping Timeout ({len(evidence_details)} criteria found)')
                         return show_final_summary()
                         
                     try:
                         if verbose:
-                            print(f"  Fallback scraping {i+1}: {url} (Phase 3 time: {current_phase3_time/60:.1f} minutes)")
-                        
-                        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-                        
-                        if verbose:
-                            print(f"    Making HTTP request to {url}...")
-                        response = requests.get(url, headers=headers, timeout=10)
-                        
-                        if verbose:
-                            print(f"    Response status: {response.status_code}")
-                            print(f"    Response headers: {dict(response.headers)}")
-                            print(f"    Raw response length: {len(response.text)} chars")
+                            logger.info(f"  Fallback scraping {i+1}: {url} (Phase 3 time: {current_phase3_time/60:.1f} minutes)")
                         
-                        if response.status_code == 200:
-                            # NEW: Get complete content using multiple extraction methods
-                            complete_content = get_complete_content_from_html(response.text, url, verbose)
+                        # Pages extracted on an earlier run come from the URL text cache without a fetch
+                        complete_content = get_cached_page_text(url)
+                        if complete_content is not None:
+                            if verbose:
+                                logger.info(f"    Using cached content for {url} ({len(complete_content):,} chars)")
+                        else:
+                            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
                             
+                            if verbose:
+                                logger.info(f"    Making HTTP request to {url}...")
+                            response = get_http_session().get(url, headers=headers, timeout=10)
+                            
+                            if verbose:
+                                logger.info(f"    Response status: {response.status_code}")
+                                logger.info(f"    Response headers: {dict(response.headers)}")
+                                logger.info(f"    Raw response length: {len(response.text)} chars")
+                            
+                            if response.status_code == 200:
+                                # NEW: Get complete content using multiple extraction methods
+                                complete_content = get_complete_content_from_html(response.text, url, verbose)
+                                cache_page_text(url, complete_content)
+                            else:
+                                if verbose:
+                                    logger.info(f"    HTTP request failed - Status: {response.status_code}")
+                        
+                        if complete_content is not None:
                             if len(complete_content.strip()) < 50:
                                 if verbose:
-                                    print(f"    WARNING: Very little content extracted ({len(complete_content)} chars)")
-                                    print(f"    Raw content preview: {complete_content[:200]}")
+                                    logger.info(f"    WARNING: Very little content extracted ({len(complete_content)} chars)")
+                                    logger.debug(f"    Raw content preview: {complete_content[:200]}")
                             
                             # Print scraped content for debugging
                             if verbose:
-                                print(f"    Analyzing COMPLETE fallback content from {url} ({len(complete_content)} chars)")
-                                print(f"    --- COMPLETE FALLBACK SCRAPED CONTENT START ---")
-                                print(complete_content[:3000] + "..." if len(complete_content) > 3000 else complete_content)
-                                print(f"    --- COMPLETE FALLBACK SCRAPED CONTENT END ---")
+                                logger.info(f"    Analyzing COMPLETE fallback content from {url} ({len(complete_content)} chars)")
+                                logger.debug(f"    --- COMPLETE FALLBACK SCRAPED CONTENT START ---")
+                                logger.debug(complete_content[:3000] + "..." if len(complete_content) > 3000 else complete_content)
+                                logger.debug(f"    --- COMPLETE FALLBACK SCRAPED CONTENT END ---")
                             
                             if len(complete_content.strip()) > 50:  # Only analyze if we have meaningful content
                                 # Use the existing batching function with COMPLETE extracted content
                                 web_evidence = analyze_text_with_ai_batched(
-                                    complete_content, url, criteria_to_find, company_name
+                                    complete_content, url, criteria_to_find, company_name, concurrency=concurrency
                                 )
                                 
                                 # Update evidence for final missing criteria
@@ -1649,52 +1813,50 @@ def analyze_company_sustainability(
                                         remaining_criteria.discard(criterion)
                                         criteria_to_find.discard(criterion)
                                         if verbose:
-                                            print(f"    Fallback scraping found {criterion} (score: {evidence.score})")
+                                            logger.info(f"    Fallback scraping found {criterion} (score: {evidence.score})")
                             else:
                                 if verbose:
-                                    print(f"    Skipping AI analysis - insufficient content")
-                        else:
-                            if verbose:
-                                print(f"    HTTP request failed - Status: {response.status_code}")
+                                    logger.info(f"    Skipping AI analysis - insufficient content")
                                         
                     except Exception as e:
                         logger.warning(f"Fallback scraping failed for {url}: {e}")
                         if verbose:
-                            print(f"    Fallback scraping failed: {e}")
+                            logger.info(f"    Fallback scraping failed: {e}")
                             import traceback
-                            print(f"    Full error: {traceback.format_exc()}")
+                            logger.debug(f"    Full error: {traceback.format_exc()}")
                         continue
             else:
                 if verbose:
-                    print(f"  No suitable URLs found for web scraping")
+                    logger.info(f"  No suitable URLs found for web scraping")
                     
         except Exception as e:
             logger.error(f"Web scraping failed: {e}")
             if verbose:
-                print(f"  Web scraping failed: {e}")
+                logger.info(f"  Web scraping failed: {e}")
     
     # TIMER: Track Phase 3 completion time
     if phase3_start_time is not None:
         phase3_total_time = time.time() - phase3_start_time
         analysis_tracking['phase_times']['Phase 3: Web Scraping'] = phase3_total_time
         analysis_tracking['phases_completed'].append(f'Phase 3: Web Scraping Complete ({len(evidence_details)} criteria found) in {phase3_total_time/60:.1f} minutes')
+        save_progress('Phase 3')
         
         if verbose:
-            print(f"  Phase 3 completed in {phase3_total_time/60:.1f} minutes")
+            logger.info(f"  Phase 3 completed in {phase3_total_time/60:.1f} minutes")
             if phase3_total_time < phase3_timeout:
-                print(f"  ⏰ Timer: Phase 3 completed within 40-minute limit")
+                logger.info(f"  ⏰ Timer: Phase 3 completed within 40-minute limit")
             else:
-                print(f"  ⏰ Timer: Phase 3 exceeded 40-minute limit but completed")
+                logger.info(f"  ⏰ Timer: Phase 3 exceeded 40-minute limit but completed")
     elif remaining_criteria and max_web_pages == 0:
         if verbose:
-            print(f"\nPhase 3: Skipping Web Scraping")
-            print("-" * 40)
-            print(f"  Web scraping disabled (max_web_pages=0)")
+            logger.info(f"Phase 3: Skipping Web Scraping")
+            logger.info("-" * 40)
+            logger.info(f"  Web scraping disabled (max_web_pages=0)")
     else:
         if verbose:
-            print(f"\nPhase 3: Skipping Web Scraping")
-            print("-" * 40)
-            print(f"  All criteria found - no web scraping needed!")
+            logger.info(f"Phase 3: Skipping Web Scraping")
+            logger.info("-" * 40)
+            logger.info(f"  All criteria found - no web scraping needed!")
 
     # Final Results - ALWAYS DISPLAY SUMMARY
     remaining_criteria = criteria - set(evidence_details.keys())
@@ -1709,21 +1871,21 @@ def analyze_company_sustainability(
         logger.info(f"🔍 Missing criteria: {', '.join(sorted(remaining_criteria))}")
     
     if verbose:
-        print(f"\nFinal Results Summary")
-        print("-" * 40)
+        logger.info(f"Final Results Summary")
+        logger.info("-" * 40)
         
-        print(f"RESULTS SUMMARY FOR {company_name.upper()}")
-        print("=" * 60)
-        print(format_results_as_markdown_table(evidence_details, criteria))
-        print("=" * 60)
+        logger.info(f"RESULTS SUMMARY FOR {company_name.upper()}")
+        logger.info("=" * 60)
+        logger.info(format_results_as_markdown_table(evidence_details, criteria))
+        logger.info("=" * 60)
         summary_printed = True
         
         # Show missing criteria
         if remaining_criteria:
-            print(f"\nStill Missing: {', '.join(sorted(remaining_criteria))}")
+            logger.info(f"Still Missing: {', '.join(sorted(remaining_criteria))}")
         
-        print(f"\nAnalysis completed successfully!")
-        print("=" * 60)
+        logger.info(f"Analysis completed successfully!")
+        logger.info("=" * 60)
     
     # Return comprehensive format with full analysis details
     return show_final_summary()
@@ -1756,6 +1918,9 @@ def main():
     
     args = parser.parse_args()
     
+    from . import configure_logging
+    configure_logging()
+    
     # Configure logging level based on verbose flag
     logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
     
@@ -1,13 +1,17 @@
 """Validation logic for sustainability criteria evidence."""
 
 import re
+import sys
 import logging
 from typing import Dict, Any, Set, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted evidence objects on Python 3.10+; not frozen, since validation rewrites fields in place
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class CriteriaEvidence:
     """Evidence found for a specific criterion - preserves full context"""
     criterion: str
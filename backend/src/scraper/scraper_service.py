@@ -6,34 +6,53 @@ This module wraps the main scraper and export functionality to provide a consist
 
 import os
 import sys
-from typing import Dict, Any, Optional, Set
+import asyncio
+import functools
+from bisect import bisect_left
+from typing import Dict, Any, Optional, Set, FrozenSet, List, Tuple
 from dotenv import load_dotenv
 import logging
+from pathlib import Path
 
 # Set up logging for debugging
 logger = logging.getLogger(__name__)
 
-# Add project root to path for imports
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Project root (holds the .env file), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+project_root = str(PROJECT_ROOT)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# Load environment variables with debugging
-env_path = os.path.join(project_root, '.env')
-logger.debug(f"ScraperService: Looking for .env file at: {env_path}")
-logger.debug(f"ScraperService: .env file exists: {os.path.exists(env_path)}")
-
-load_dotenv(dotenv_path=env_path)
-
-# Debug environment variable loading
-logger.debug(f"ScraperService: OPENAI_API_KEY loaded: {'✓' if os.getenv('OPENAI_API_KEY') else '✗'}")
-logger.debug(f"ScraperService: GOOGLE_CSE_API_KEY loaded: {'✓' if os.getenv('GOOGLE_CSE_API_KEY') else '✗'}")
-logger.debug(f"ScraperService: GOOGLE_CSE_ID loaded: {'✓' if os.getenv('GOOGLE_CSE_ID') else '✗'}")
+# Set once the .env file has been loaded by the first ScraperService instance
+_ENV_LOADED = False
 
 # Import scraper functions
-from .main_ai_scraper import analyze_company_sustainability
+from .main_ai_scraper import analyze_company_sustainability, ALL_CRITERIA
 from .export.json_exporter import SustainabilityDataExporter
-from .ai_criteria_analyzer import CriteriaEvidence
+from .ai_criteria_analyzer import CriteriaEvidence, MAX_CONCURRENT_AI_BATCHES
+
+# Immutable view of the supported criteria, shared by every caller
+SUPPORTED_CRITERIA = frozenset(ALL_CRITERIA)
+
+# Inclusive upper bounds of fleet size ranges 0=None, 1=1-10, 2=11-50 (anything above is 3=51+);
+# bisect_left keeps a size equal to a bound in that bound's range
+FLEET_SIZE_RANGE_BOUNDS = (0, 10, 50)
+
+# Maximum number of company analyses allowed to run at the same time in batch mode
+MAX_CONCURRENT_ANALYSES = 8
+
+
+def _build_scoring_rows(
+    metrics_mapping: Dict[str, str],
+    weights: Dict[str, int],
+    max_scores: Dict[str, int]
+) -> Tuple[Tuple[str, str, int, int], ...]:
+    """Align metric keys with their criterion weight and max score, in breakdown order."""
+    return tuple(
+        (metric_key, criterion_key, weights[criterion_key], max_scores[criterion_key])
+        for metric_key, criterion_key in metrics_mapping.items()
+        if criterion_key in weights
+    )
 
 
 class ScraperService:
@@ -64,10 +83,47 @@ class ScraperService:
         "regulatory": 1           # 0=No, 1=Yes
     }
     
+    # User-friendly display names for the score breakdown
+    CRITERIA_DISPLAY_NAMES = {
+        "cng_fleet": "CNG Fleet Presence",
+        "cng_fleet_size": "CNG Fleet Size",
+        "emission_reporting": "Emission Reporting",
+        "emission_goals": "Emission Reduction Goals",
+        "alt_fuels": "Alternative Fuels Mentioned",
+        "clean_energy_partner": "Clean Energy Partnerships/CNG Infrastructure",
+        "regulatory": "Regulatory Pressure/Market Type"
+    }
+
+    # Map sustainability_metrics keys (actual JSON output from the scraper) to internal criteria names
+    METRICS_MAPPING = {
+        "owns_cng_fleet": "cng_fleet",
+        "cng_fleet_size_range": "cng_fleet_size",
+        "emission_report": "emission_reporting",
+        "emission_goals": "emission_goals",
+        "alt_fuels": "alt_fuels",
+        "clean_energy_partners": "clean_energy_partner",
+        "regulatory_pressure": "regulatory"
+    }
+    
+    # (metric_key, criterion_key, weight, max_score) rows in breakdown order, built once so
+    # scoring is a single pass with no per-criterion dict lookups
+    _SCORING_ROWS = _build_scoring_rows(METRICS_MAPPING, CRITERIA_WEIGHTS, CRITERIA_MAX_SCORES)
+    _TOTAL_POSSIBLE_SCORE = float(sum(row[2] for row in _SCORING_ROWS))
+    
+    # Set after the first successful environment validation; the variables don't change at runtime
+    _env_validated: bool = False
+    
     def __init__(self):
         """Initialize the scraper service with environment validation."""
+        global _ENV_LOADED
         self.project_root = project_root
-        self._validate_environment()
+        if not _ENV_LOADED:
+            # Deferred from import time so importing the module does no file I/O
+            load_dotenv(dotenv_path=PROJECT_ROOT / '.env')
+            _ENV_LOADED = True
+        if not ScraperService._env_validated:
+            self._validate_environment()
+            ScraperService._env_validated = True
     
     def _validate_environment(self) -> None:
         """Validate that required environment variables are available."""
@@ -89,11 +145,11 @@ class ScraperService:
                 logger.debug(f"ScraperService: Found {var}: {masked_value}")
         
         if missing_vars:
-            env_file_path = os.path.join(self.project_root, '.env')
+            env_file_path = PROJECT_ROOT / '.env'
             error_msg = (
                 f"Missing required environment variables: {', '.join(missing_vars)}\n"
                 f"Expected .env file location: {env_file_path}\n"
-                f".env file exists: {os.path.exists(env_file_path)}\n"
+                f".env file exists: {env_file_path.exists()}\n"
                 f"Current working directory: {os.getcwd()}\n"
                 f"Project root: {self.project_root}\n"
                 f"Please ensure your .env file contains:\n"
@@ -110,7 +166,8 @@ class ScraperService:
         max_pdf_reports: int = 5,
         max_web_pages: int = 5,
         verbose: bool = False,
-        use_crawler: bool = False
+        use_crawler: bool = False,
+        concurrency: int = MAX_CONCURRENT_AI_BATCHES
     ) -> Dict[str, Any]:
         """
         Analyze a company's sustainability and return structured JSON format.
@@ -129,6 +186,7 @@ class ScraperService:
             max_web_pages: Maximum number of web pages to scrape
             verbose: Whether to show detailed progress output
             use_crawler: Enable deep web crawling for comprehensive coverage
+            concurrency: Maximum number of OpenAI batches / criterion searches in flight at once
             
         Returns:
             Dict containing structured sustainability analysis results
@@ -139,7 +197,7 @@ class ScraperService:
         """
         try:
             # Step 1: Run the main AI scraper
-            print(f"ScrapeService: Starting analysis for {company_name}")
+            logger.info("ScrapeService: Starting analysis for %s", company_name)
             
             scraper_results = analyze_company_sustainability(
                 company_name=company_name,
@@ -148,10 +206,11 @@ class ScraperService:
                 max_pdf_reports=max_pdf_reports,
                 max_web_pages=max_web_pages,
                 verbose=verbose,
-                use_crawler=use_crawler
+                use_crawler=use_crawler,
+                concurrency=concurrency
             )
             
-            print(f"ScrapeService: Scraper analysis completed for {company_name}")
+            logger.info("ScrapeService: Scraper analysis completed for %s", company_name)
             
             # Step 2: Process through JSON exporter for structured format
             try:
@@ -193,31 +252,66 @@ class ScraperService:
                 if "sustainability_metrics" in structured_data:
                     overall_score = self.calculate_overall_score(structured_data["sustainability_metrics"])
                     structured_data["overall_score"] = overall_score
-                    print(f"ScrapeService: Overall sustainability score: {overall_score['overall_score_percentage']}%")
+                    logger.info("ScrapeService: Overall sustainability score: %s%%", overall_score['overall_score_percentage'])
                 else:
-                    print("ScrapeService: Warning - No sustainability_metrics found, skipping overall score calculation")
+                    logger.warning("ScrapeService: No sustainability_metrics found, skipping overall score calculation")
                 
-                print(f"ScrapeService: Successfully converted to structured JSON format")
+                logger.info("ScrapeService: Successfully converted to structured JSON format")
                 return structured_data
                 
             except Exception as e:
-                print(f"ScrapeService: JSON export failed, returning raw results: {e}")
+                logger.warning("ScrapeService: JSON export failed, returning raw results: %s", e)
                 # Fallback to raw results if JSON export fails
                 return scraper_results
                 
         except Exception as e:
-            print(f"ScrapeService: Analysis failed for {company_name}: {e}")
+            logger.error("ScrapeService: Analysis failed for %s: %s", company_name, e)
             raise Exception(f"Scraper service failed: {str(e)}")
     
-    def get_supported_criteria(self) -> Set[str]:
+    async def analyze_company_async(
+        self,
+        company_name: str,
+        criteria: Optional[Set[str]] = None,
+        max_search_pages: int = 5,
+        max_pdf_reports: int = 5,
+        max_web_pages: int = 5,
+        verbose: bool = False,
+        use_crawler: bool = False,
+        concurrency: int = MAX_CONCURRENT_AI_BATCHES
+    ) -> Dict[str, Any]:
+        """
+        Async variant of analyze_company.
+        
+        The scraper itself is blocking (sync Playwright, requests, OpenAI), so it runs in
+        the default thread pool executor. This keeps the event loop free and lets several
+        companies be analyzed concurrently.
+        
+        Args and return value are the same as analyze_company.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.analyze_company,
+                company_name=company_name,
+                criteria=criteria,
+                max_search_pages=max_search_pages,
+                max_pdf_reports=max_pdf_reports,
+                max_web_pages=max_web_pages,
+                verbose=verbose,
+                use_crawler=use_crawler,
+                concurrency=concurrency
+            )
+        )
+    
+    def get_supported_criteria(self) -> FrozenSet[str]:
         """
         Get the set of all supported sustainability criteria.
         
         Returns:
-            Set of supported criteria names
+            Frozen set of supported criteria names
         """
-        from .main_ai_scraper import ALL_CRITERIA
-        return ALL_CRITERIA.copy()
+        return SUPPORTED_CRITERIA
     
     def validate_criteria(self, criteria: Set[str]) -> bool:
         """
@@ -229,8 +323,7 @@ class ScraperService:
         Returns:
             True if all criteria are supported, False otherwise
         """
-        supported = self.get_supported_criteria()
-        return criteria.issubset(supported)
+        return criteria <= SUPPORTED_CRITERIA
     
     def calculate_overall_score(self, sustainability_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -243,21 +336,9 @@ class ScraperService:
             Dict containing overall score and breakdown by criteria
         """
         total_weighted_score = 0.0
-        total_possible_score = 0.0
+        total_possible_score = self._TOTAL_POSSIBLE_SCORE
         criteria_breakdown = {}
         
-        # FIXED: Map sustainability_metrics keys to our internal criteria names
-        # These keys match the actual JSON output from the scraper
-        metrics_mapping = {
-            "owns_cng_fleet": "cng_fleet",
-            "cng_fleet_size_range": "cng_fleet_size", 
-            "emission_report": "emission_reporting",           # FIXED: was "emission_reporting"
-            "emission_goals": "emission_goals",
-            "alt_fuels": "alt_fuels",                         # FIXED: was "alt_fuels_mentioned"
-            "clean_energy_partners": "clean_energy_partner",  # FIXED: was "clean_energy_partnerships"
-            "regulatory_pressure": "regulatory"
-        }
-        
         # FIXED: Also check if fleet size range needs recalculation based on actual size
         if sustainability_metrics.get("cng_fleet_size_actual") and sustainability_metrics.get("cng_fleet_size_range") is not None:
             actual_size = sustainability_metrics["cng_fleet_size_actual"]
@@ -265,45 +346,35 @@ class ScraperService:
             correct_range = self._calculate_fleet_size_range(actual_size)
             
             if correct_range != current_range:
-                print(f"ScraperService: Correcting fleet size range from {current_range} to {correct_range} (actual size: {actual_size})")
+                logger.info("ScraperService: Correcting fleet size range from %s to %s (actual size: %s)", current_range, correct_range, actual_size)
                 # Update the range in the metrics for correct scoring
                 sustainability_metrics["cng_fleet_size_range"] = correct_range
         
-        for metric_key, criterion_key in metrics_mapping.items():
-            if criterion_key in self.CRITERIA_WEIGHTS:
-                # Get the score from sustainability metrics
-                metric_value = sustainability_metrics.get(metric_key, 0)
-                
-                # Handle both boolean and numeric values
-                if isinstance(metric_value, bool):
-                    score = 1 if metric_value else 0
-                else:
-                    score = int(metric_value) if metric_value is not None else 0
-                
-                # Get max possible score and weight for this criterion
-                max_score = self.CRITERIA_MAX_SCORES[criterion_key]
-                weight = self.CRITERIA_WEIGHTS[criterion_key]
-                
-                # Calculate normalized score (0-1) and apply weight
-                if max_score > 0:
-                    normalized_score = min(score / max_score, 1.0)  # Cap at 1.0
-                else:
-                    normalized_score = 0.0
-                
-                weighted_score = normalized_score * weight
-                total_weighted_score += weighted_score
-                total_possible_score += weight
-                
-                # Store breakdown for this criterion
-                criteria_breakdown[criterion_key] = {
-                    "name": self._get_criterion_display_name(criterion_key),
-                    "raw_score": score,
-                    "max_score": max_score,
-                    "normalized_score": round(normalized_score * 100, 1),  # As percentage
-                    "weight_percentage": weight,
-                    "weighted_contribution": round(weighted_score, 1),
-                    "possible_contribution": weight
-                }
+        for metric_key, criterion_key, weight, max_score in self._SCORING_ROWS:
+            # Get the score from sustainability metrics
+            metric_value = sustainability_metrics.get(metric_key, 0)
+            
+            # Handle both boolean and numeric values
+            if isinstance(metric_value, bool):
+                score = 1 if metric_value else 0
+            else:
+                score = int(metric_value) if metric_value is not None else 0
+            
+            # Calculate normalized score (0-1, capped at 1.0) and apply weight
+            normalized_score = min(score / max_score, 1.0) if max_score > 0 else 0.0
+            weighted_score = normalized_score * weight
+            total_weighted_score += weighted_score
+            
+            # Store breakdown for this criterion
+            criteria_breakdown[criterion_key] = {
+                "name": self._get_criterion_display_name(criterion_key),
+                "raw_score": score,
+                "max_score": max_score,
+                "normalized_score": round(normalized_score * 100, 1),  # As percentage
+                "weight_percentage": weight,
+                "weighted_contribution": round(weighted_score, 1),
+                "possible_contribution": weight
+            }
         
         # Calculate overall percentage
         overall_percentage = round((total_weighted_score / total_possible_score * 100), 1) if total_possible_score > 0 else 0.0
@@ -328,29 +399,19 @@ class ScraperService:
             fleet_size: Actual number of CNG vehicles
             
         Returns:
-            Range value: 0=None, 1=1-10, 2=11-50, 3=51+
+            Range value: 0=None, 1=1-10, 2=11-50, 3=51+ (negative sizes count as None)
         """
-        if fleet_size == 0:
-            return 0
-        elif 1 <= fleet_size <= 10:
-            return 1
-        elif 11 <= fleet_size <= 50:
-            return 2
-        else:  # 51+
-            return 3
+        return bisect_left(FLEET_SIZE_RANGE_BOUNDS, fleet_size)
     
     def _get_criterion_display_name(self, criterion_key: str) -> str:
         """Get user-friendly display name for criteria."""
-        display_names = {
-            "cng_fleet": "CNG Fleet Presence",
-            "cng_fleet_size": "CNG Fleet Size",
-            "emission_reporting": "Emission Reporting",
-            "emission_goals": "Emission Reduction Goals",
-            "alt_fuels": "Alternative Fuels Mentioned",
-            "clean_energy_partner": "Clean Energy Partnerships/CNG Infrastructure",
-            "regulatory": "Regulatory Pressure/Market Type"
-        }
-        return display_names.get(criterion_key, criterion_key)
+        return self.CRITERIA_DISPLAY_NAMES.get(criterion_key, criterion_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_service() -> ScraperService:
+    """Return the shared ScraperService used by the module-level helpers."""
+    return ScraperService()
 
 
 # Convenience function for direct usage
@@ -361,7 +422,8 @@ def analyze_company_structured(
     max_pdf_reports: int = 5,
     max_web_pages: int = 5,
     verbose: bool = False,
-    use_crawler: bool = False
+    use_crawler: bool = False,
+    concurrency: int = MAX_CONCURRENT_AI_BATCHES
 ) -> Dict[str, Any]:
     """
     Convenience function to analyze a company and get structured results.
@@ -376,6 +438,7 @@ def analyze_company_structured(
         max_web_pages: Maximum number of web pages to scrape
         verbose: Whether to show detailed progress output
         use_crawler: Enable deep web crawling for comprehensive coverage
+        concurrency: Maximum number of OpenAI batches / criterion searches in flight at once
         
     Returns:
         Dict containing structured sustainability analysis results with:
@@ -397,7 +460,7 @@ def analyze_company_structured(
         score_percentage = overall_score["overall_score_percentage"]  # e.g., 73.5
         criteria_breakdown = overall_score["criteria_breakdown"]      # Detailed breakdown per criterion
     """
-    service = ScraperService()
+    service = _get_service()
     return service.analyze_company(
         company_name=company_name,
         criteria=criteria,
@@ -405,5 +468,83 @@ def analyze_company_structured(
         max_pdf_reports=max_pdf_reports,
         max_web_pages=max_web_pages,
         verbose=verbose,
-        use_crawler=use_crawler
-    )   
\ No newline at end of file
+        use_crawler=use_crawler,
+        concurrency=concurrency
+    )
+
+
+async def analyze_company_structured_async(
+    company_name: str,
+    criteria: Optional[Set[str]] = None,
+    max_search_pages: int = 5,
+    max_pdf_reports: int = 5,
+    max_web_pages: int = 5,
+    verbose: bool = False,
+    use_crawler: bool = False,
+    concurrency: int = MAX_CONCURRENT_AI_BATCHES
+) -> Dict[str, Any]:
+    """
+    Async version of analyze_company_structured for use inside an event loop.
+    
+    Returns:
+        Same structured results as analyze_company_structured
+    """
+    service = _get_service()
+    return await service.analyze_company_async(
+        company_name=company_name,
+        criteria=criteria,
+        max_search_pages=max_search_pages,
+        max_pdf_reports=max_pdf_reports,
+        max_web_pages=max_web_pages,
+        verbose=verbose,
+        use_crawler=use_crawler,
+        concurrency=concurrency
+    )
+
+
+async def analyze_companies_structured(
+    company_names: List[str],
+    max_concurrency: int = MAX_CONCURRENT_ANALYSES,
+    criteria: Optional[Set[str]] = None,
+    max_search_pages: int = 5,
+    max_pdf_reports: int = 5,
+    max_web_pages: int = 5,
+    verbose: bool = False,
+    use_crawler: bool = False,
+    concurrency: int = MAX_CONCURRENT_AI_BATCHES
+) -> List[Any]:
+    """
+    Analyze several companies concurrently, at most max_concurrency at a time.
+    
+    Args:
+        company_names: Names of the companies to analyze
+        max_concurrency: Maximum number of analyses running at once
+        (remaining args are passed to analyze_company for every company)
+        
+    Returns:
+        List in the same order as company_names. Each entry is the structured results
+        dict, or the exception raised for that company (one failure does not cancel the rest).
+        
+    Example:
+        results = asyncio.run(analyze_companies_structured(["UPS", "FedEx"]))
+    """
+    service = _get_service()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def analyze_one(company_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await service.analyze_company_async(
+                company_name=company_name,
+                criteria=criteria,
+                max_search_pages=max_search_pages,
+                max_pdf_reports=max_pdf_reports,
+                max_web_pages=max_web_pages,
+                verbose=verbose,
+                use_crawler=use_crawler,
+                concurrency=concurrency
+            )
+    
+    return await asyncio.gather(
+        *(analyze_one(company_name) for company_name in company_names),
+        return_exceptions=True
+    )
@@ -1,114 +1,433 @@
 """HTML processing and text extraction utilities."""
 
 import trafilatura
+from trafilatura.settings import use_config
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+import html as _html
 import re
+import hashlib
 import logging
-from typing import Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Optional fast HTML parser (C-based Lexbor/Modest bindings); lxml is used when missing
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logger.debug("selectolax not installed - using lxml for HTML text extraction")
 
-def html_to_clean_text(html: str, url: Optional[str] = None) -> str:
+# Tag stripping and whitespace collapse used by every extraction method
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Script/style blocks, removed before any parsing so no method has to build nodes for them
+_SCRIPT_RE = re.compile(r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# Pages mentioning none of these can't hold evidence for any criterion, so they aren't extracted
+_REPORT_KEYWORDS_RE = re.compile(
+    r'emission|sustainab|\bcng\b|natural gas|fleet|truck|vehicle|fuel|net[- ]zero|carbon|climate'
+    r'|\besg\b|renewable|greenhouse|\bghg\b',
+    re.IGNORECASE
+)
+
+# Byte-string versions so raw HTTP bodies can be filtered without decoding them first
+_TAG_RE_BYTES = re.compile(_TAG_RE.pattern.encode())
+_SCRIPT_RE_BYTES = re.compile(_SCRIPT_RE.pattern.encode(), re.IGNORECASE | re.DOTALL)
+_REPORT_KEYWORDS_RE_BYTES = re.compile(_REPORT_KEYWORDS_RE.pattern.encode(), re.IGNORECASE)
+
+# Letters and non-whitespace counted for the language check
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+_NON_SPACE_RE = re.compile(r'\S')
+
+# HTML as decoded text, or the raw response body (lxml/Trafilatura detect its encoding themselves)
+HtmlInput = Union[str, bytes]
+
+# Elements dropped before taking the text of a page
+NOISE_TAGS = ("script", "style", "noscript", "iframe", "object", "embed")
+
+# Extracted-text cache shared across runs: page text keyed by HTML hash and by URL in one SQLite table
+HTML_CACHE_DIR = Path(__file__).parent.parent.parent.parent / 'html_cache'
+HTML_CACHE_DB = HTML_CACHE_DIR / 'text_cache.db'
+HTML_CACHE_TTL = 7 * 24 * 60 * 60      # Seconds before a cached page text is re-extracted
+HTML_CACHE_MAX_ENTRIES = 5000          # Oldest rows beyond this are evicted
+
+# Part of every cache key - bump when extraction methods, relevance gates or limits change
+# so text produced by the old logic is never served again
+EXTRACTOR_VERSION = "2"
+
+# Minimum text worth caching by URL; shorter results are failures a re-fetch may fix
+MIN_CACHED_PAGE_CHARS = 50
+
+# Pages with less text than this outside of tags go straight to the regex fallback
+MIN_TEXT_ESTIMATE = 200
+
+# Trafilatura is skipped on pathological inputs larger than this
+MAX_TRAFILATURA_HTML_CHARS = 2_000_000
+
+# Extracted text is capped at this size - beyond it is navigation chrome and repeated
+# listings that only add OpenAI tokens
+MAX_CLEAN_TEXT_CHARS = 200_000
+
+# Language check: pages whose text is mostly non-Latin are skipped (analysis prompts are English)
+LANGUAGE_SAMPLE_CHARS = 20_000
+MIN_ASCII_LETTER_RATIO = 0.3
+
+# Trafilatura settings built once and shared by every extraction call. The signal-based
+# extraction timeout only works on the main thread, and extraction runs in worker threads
+TRAFILATURA_CONFIG = use_config()
+TRAFILATURA_CONFIG.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+TRAFILATURA_CONFIG.set("DEFAULT", "MIN_EXTRACTED_SIZE", "50")  # Same threshold as our own checks
+
+# Pages larger than this run the independent extraction methods concurrently; below it
+# thread overhead outweighs the overlap and the sequential cascade is faster
+HTML_PARALLEL_THRESHOLD = 500_000
+PARALLEL_EXTRACTION_WORKERS = 6  # Threads shared by the parallel extraction of large pages (3 methods each)
+# Shared across pages instead of a pool started and torn down per large page
+_EXTRACTION_EXECUTOR = ThreadPoolExecutor(max_workers=PARALLEL_EXTRACTION_WORKERS, thread_name_prefix="html-extract")
+
+# In-process LRU in front of the disk cache (stores extracted text only, not HTML)
+HTML_MEMORY_CACHE_SIZE = 512
+_memory_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+# Opened lazily; one connection shared by all threads (WAL lets readers and the writer overlap)
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_db_lock = threading.Lock()
+
+
+def _open_cache_db() -> sqlite3.Connection:
+    HTML_CACHE_DIR.mkdir(exist_ok=True)
+    conn = sqlite3.connect(HTML_CACHE_DB, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS text_cache "
+        "(key TEXT PRIMARY KEY, ts REAL NOT NULL, url TEXT, text TEXT NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_text_cache_ts ON text_cache (ts)")
+    # Expired rows and rows from other extractor versions are swept once per process
+    conn.execute(
+        "DELETE FROM text_cache WHERE ts < ? OR (key NOT LIKE ? AND key NOT LIKE ?)",
+        (time.time() - HTML_CACHE_TTL, f"html:{EXTRACTOR_VERSION}:%", f"url:{EXTRACTOR_VERSION}:%")
+    )
+    return conn
+
+
+def _cache_db_execute(sql: str, params: Tuple = ()) -> List[Tuple]:
+    global _cache_db
+    with _cache_db_lock:
+        if _cache_db is None:
+            _cache_db = _open_cache_db()
+        return _cache_db.execute(sql, params).fetchall()
+
+
+def get_html_cache_key(html: HtmlInput) -> str:
+    """Cache key for extracted text - extraction only depends on the HTML and the extractor version."""
+    if isinstance(html, str):
+        html = html.encode('utf-8', errors='replace')
+    return f"html:{EXTRACTOR_VERSION}:{hashlib.blake2b(html, digest_size=16).hexdigest()}"
+
+
+def get_url_cache_key(url: str) -> str:
+    """Cache key for the final text of a page, looked up before the page is fetched at all."""
+    return f"url:{EXTRACTOR_VERSION}:{url}"
+
+
+def get_cached_text(cache_key: str) -> Optional[str]:
+    """Return text cached under this key within HTML_CACHE_TTL, or None on a miss."""
+    with _memory_cache_lock:
+        entry = _memory_cache.get(cache_key)
+        if entry is not None:
+            _memory_cache.move_to_end(cache_key)
+    if entry is not None and time.time() - entry[0] <= HTML_CACHE_TTL:
+        return entry[1]
+    
+    try:
+        rows = _cache_db_execute(
+            "SELECT ts, text FROM text_cache WHERE key = ? AND ts >= ?",
+            (cache_key, time.time() - HTML_CACHE_TTL)
+        )
+    except Exception as e:
+        logger.warning(f"Failed to read HTML text cache: {e}")
+        return None
+    if not rows:
+        return None
+    
+    timestamp, text = rows[0]
+    _remember_text(cache_key, timestamp, text)
+    return text
+
+
+def cache_text(cache_key: str, text: str, url: Optional[str] = None) -> None:
+    """Store text in memory and on disk, evicting the oldest rows beyond HTML_CACHE_MAX_ENTRIES."""
+    timestamp = time.time()
+    _remember_text(cache_key, timestamp, text)
+    try:
+        _cache_db_execute(
+            "INSERT OR REPLACE INTO text_cache (key, ts, url, text) VALUES (?, ?, ?, ?)",
+            (cache_key, timestamp, url, text)
+        )
+        _cache_db_execute(
+            "DELETE FROM text_cache WHERE key IN "
+            "(SELECT key FROM text_cache ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+            (HTML_CACHE_MAX_ENTRIES,)
+        )
+    except Exception as e:
+        logger.warning(f"Failed to write HTML text cache for {url or 'unknown URL'}: {e}")
+
+
+def get_cached_page_text(url: str) -> Optional[str]:
+    """Final extracted text for a URL from an earlier fetch, so the page need not be fetched again."""
+    return get_cached_text(get_url_cache_key(url))
+
+
+def cache_page_text(url: str, text: str) -> None:
+    """Remember a URL's final extracted text; too-short results are not cached so they get retried."""
+    if text and len(text.strip()) > MIN_CACHED_PAGE_CHARS:
+        cache_text(get_url_cache_key(url), text, url)
+
+
+def _remember_text(cache_key: str, timestamp: float, text: str) -> None:
+    with _memory_cache_lock:
+        _memory_cache[cache_key] = (timestamp, text)
+        _memory_cache.move_to_end(cache_key)
+        if len(_memory_cache) > HTML_MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def html_to_clean_text(html: HtmlInput, url: Optional[str] = None, force_rescrape: bool = False) -> str:
     """
     ENHANCED: Convert HTML to clean text using multiple extraction methods with fallbacks.
     Enhanced to extract more complete content for sustainability analysis.
+    
+    Accepts the raw response body (bytes) as well as decoded text. Bytes go straight to
+    lxml/Trafilatura, which sniff the encoding, and are only decoded for the regex fallback.
+    
+    Results are cached by HTML hash and EXTRACTOR_VERSION (in memory and in HTML_CACHE_DB,
+    for HTML_CACHE_TTL), so the same page fetched again skips extraction entirely. Empty
+    results - relevance-gated pages and failed extractions - are never cached. Pass
+    force_rescrape=True to bypass the cache and overwrite the stored text.
     """
     if not html or len(html.strip()) < 100:
         logger.warning(f"HTML content too small or empty: {len(html) if html else 0} chars")
         return ""
     
+    cache_key = get_html_cache_key(html)
+    if not force_rescrape:
+        cached = get_cached_text(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached text for {url or 'unknown URL'}: {len(cached)} chars")
+            return cached
+    
+    txt = _extract_clean_text(html, url)
+    if txt:
+        cache_text(cache_key, txt, url)
+    return txt
+
+
+def _extract_clean_text(html: HtmlInput, url: Optional[str] = None) -> str:
+    """Run the extraction methods in order and return the first usable result."""
     original_length = len(html)
     logger.debug(f"Processing HTML: {original_length} chars for {url or 'unknown URL'}")
     
-    # Method 1: Enhanced Trafilatura (best for content extraction)
+    # Drop script/style blocks and take the bare text once, for the checks below
+    if isinstance(html, (bytes, bytearray)):
+        html = _SCRIPT_RE_BYTES.sub(b'', html)
+        text_only = _TAG_RE_BYTES.sub(b'', html)
+        has_keywords = _REPORT_KEYWORDS_RE_BYTES.search(text_only) is not None
+        sample = text_only[:LANGUAGE_SAMPLE_CHARS].decode('utf-8', errors='replace')
+    else:
+        html = _SCRIPT_RE.sub('', html)
+        text_only = _TAG_RE.sub('', html)
+        has_keywords = _REPORT_KEYWORDS_RE.search(text_only) is not None
+        sample = text_only[:LANGUAGE_SAMPLE_CHARS]
+    text_estimate = len(text_only.strip())
+    
+    # Cheap relevance gates before any parser runs
+    if not has_keywords:
+        logger.debug(f"No sustainability/fleet keywords in {url or 'unknown URL'} - skipping extraction")
+        return ""
+    non_space = len(_NON_SPACE_RE.findall(sample))
+    if non_space and len(_ASCII_LETTER_RE.findall(sample)) / non_space < MIN_ASCII_LETTER_RATIO:
+        logger.debug(f"Mostly non-Latin text in {url or 'unknown URL'} - skipping extraction")
+        return ""
+    
+    # Cheap structural check: if stripping tags leaves almost nothing (error pages, redirects,
+    # script-only shells) the DOM parsers can't do better than the regex fallback
+    if text_estimate < MIN_TEXT_ESTIMATE:
+        logger.debug(f"Only ~{text_estimate} chars of text outside tags - skipping DOM parsers")
+        txt = _regex_text(html)
+    elif original_length > HTML_PARALLEL_THRESHOLD:
+        txt = _extract_in_parallel(html)
+    else:
+        txt = _trafilatura_text(html)
+        if not txt:
+            # Trafilatura parses the HTML itself; the lxml tree is only built for the fallbacks
+            tree = _parse_tree(html)
+            txt = (
+                _aggressive_text(html, tree)
+                or _conservative_text(html, tree)
+                or _regex_text(html)
+            )
+    
+    if not txt:
+        # All methods failed
+        logger.warning(f"All text extraction methods failed for {url or 'unknown URL'}. HTML length: {original_length}")
+    elif len(txt) > MAX_CLEAN_TEXT_CHARS:
+        logger.debug(f"Truncating extracted text from {len(txt)} to {MAX_CLEAN_TEXT_CHARS} chars")
+        txt = txt[:MAX_CLEAN_TEXT_CHARS]
+    return txt
+
+
+def _extract_in_parallel(html: HtmlInput) -> str:
+    """
+    Large pages: run Trafilatura, the aggressive extraction and the regex fallback at the
+    same time (lxml and selectolax release the GIL while parsing), then take the result of
+    the highest-priority method that succeeded - the same text the sequential order returns.
+    """
+    # Trafilatura parses its own tree from the HTML, so Methods 2 and 3 can strip this one
+    futures = [_EXTRACTION_EXECUTOR.submit(_trafilatura_text, html)]
+    tree = _parse_tree(html)
+    futures.append(_EXTRACTION_EXECUTOR.submit(_aggressive_text, html, tree))
+    futures.append(_EXTRACTION_EXECUTOR.submit(_regex_text, html))
+    try:
+        for priority, future in enumerate(futures):
+            txt = future.result()
+            if txt:
+                return txt
+            if priority == 1:
+                # Method 3 needs the tree Method 2 just finished with
+                txt = _conservative_text(html, tree)
+                if txt:
+                    return txt
+        return ""
+    finally:
+        # Lower-priority methods not started yet are no longer needed
+        for future in futures:
+            future.cancel()
+
+
+def _parse_tree(html: HtmlInput):
+    """Parse HTML into an lxml tree once, shared by the fallback methods. None if lxml rejects it."""
+    try:
+        return lxml_html.fromstring(html)
+    except Exception as e:
+        logger.debug(f"lxml parsing failed: {e}")
+        return None
+
+
+def _trafilatura_text(html: HtmlInput) -> str:
+    """Method 1: Enhanced Trafilatura (best for content extraction)."""
+    if len(html) >= MAX_TRAFILATURA_HTML_CHARS:
+        logger.debug(f"Skipping Trafilatura for oversized HTML: {len(html)} chars")
+        return ""
     try:
         # Use more aggressive settings to capture more content
         txt = trafilatura.extract(
-            html, 
+            html,
             include_comments=False, 
             favour_recall=True,  # Prefer recall over precision
             include_tables=True, 
-            include_links=True,  # Include link text
+            include_links=False,  # Link targets only add tokens for the AI analysis
             include_images=False,  # Skip image alt text
-            deduplicate=False,  # Don't remove duplicate content (might remove important info)
+            deduplicate=True,  # Repeated boilerplate would be analyzed (and paid for) twice
             prune_xpath=None,  # Don't prune anything
-            only_with_metadata=False  # Don't require metadata
+            only_with_metadata=False,  # Don't require metadata
+            no_fallback=True,  # Our own fallback chain follows, skip Trafilatura's internal one
+            config=TRAFILATURA_CONFIG
         )
         if txt and len(txt.strip()) > 50:
             logger.debug(f"Enhanced Trafilatura extraction successful: {len(txt)} chars")
             return txt.strip()
-        else:
-            logger.debug(f"Enhanced Trafilatura extraction failed or too short: {len(txt) if txt else 0} chars")
+        logger.debug(f"Enhanced Trafilatura extraction failed or too short: {len(txt) if txt else 0} chars")
     except Exception as e:
         logger.debug(f"Enhanced Trafilatura extraction failed: {e}")
-    
-    # Method 2: Aggressive BeautifulSoup extraction (keep more content)
+    return ""
+
+
+def _aggressive_text(html: HtmlInput, tree) -> str:
+    """Method 2: Aggressive extraction (keep nav/footer/header for sustainability info)."""
     try:
-        soup = BeautifulSoup(html, "lxml")
-        
-        # Remove only the most problematic elements (keep nav, footer, header for sustainability info)
-        for script in soup(["script", "style", "noscript", "iframe", "object", "embed"]):
-            script.decompose()
-        
-        # Get text with better spacing
-        txt = soup.get_text(separator=" ", strip=True)
+        if SELECTOLAX_AVAILABLE:
+            parsed = HTMLParser(html)
+            for node in parsed.css(",".join(NOISE_TAGS)):
+                node.decompose()
+            txt = parsed.body.text(separator=" ", strip=True) if parsed.body else ""
+            method_name = "selectolax"
+        elif tree is not None:
+            etree.strip_elements(tree, etree.Comment, *NOISE_TAGS, with_tail=False)
+            txt = " ".join(tree.itertext())
+            method_name = "lxml"
+        else:
+            return ""
         
         # Clean up whitespace
-        txt = re.sub(r'\s+', ' ', txt).strip()
+        txt = _WS_RE.sub(' ', txt).strip()
         
         if txt and len(txt) > 50:
-            logger.debug(f"Aggressive BeautifulSoup extraction successful: {len(txt)} chars")
+            logger.debug(f"Aggressive {method_name} extraction successful: {len(txt)} chars")
             return txt
-        else:
-            logger.debug(f"Aggressive BeautifulSoup extraction failed or too short: {len(txt) if txt else 0} chars")
+        logger.debug(f"Aggressive {method_name} extraction failed or too short: {len(txt) if txt else 0} chars")
     except Exception as e:
-        logger.debug(f"Aggressive BeautifulSoup extraction failed: {e}")
-    
-    # Method 3: Conservative BeautifulSoup extraction (fallback)
+        logger.debug(f"Aggressive extraction failed: {e}")
+    return ""
+
+
+def _conservative_text(html: HtmlInput, tree) -> str:
+    """Method 3: Conservative extraction (fallback) - also drops nav/footer/header."""
     try:
-        soup = BeautifulSoup(html, "html.parser")  # Use different parser
-        
-        # Remove script and style elements (more conservative)
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        # Get text with better spacing
-        txt = soup.get_text(separator=" ", strip=True)
+        if tree is not None:
+            # Reuse the tree Method 2 used; stripping is idempotent if it already ran on it
+            etree.strip_elements(tree, etree.Comment, *NOISE_TAGS, "nav", "footer", "header", with_tail=False)
+            txt = " ".join(tree.itertext())
+            method_name = "lxml"
+        else:
+            # html.parser copes with markup lxml rejects
+            soup = BeautifulSoup(html, "html.parser")
+            for script in soup(["script", "style", "nav", "footer", "header"]):
+                script.decompose()
+            txt = soup.get_text(separator=" ", strip=True)
+            method_name = "BeautifulSoup"
         
         # Clean up whitespace
-        txt = re.sub(r'\s+', ' ', txt).strip()
+        txt = _WS_RE.sub(' ', txt).strip()
         
         if txt and len(txt) > 50:
-            logger.debug(f"Conservative BeautifulSoup extraction successful: {len(txt)} chars")
+            logger.debug(f"Conservative {method_name} extraction successful: {len(txt)} chars")
             return txt
-        else:
-            logger.debug(f"Conservative BeautifulSoup extraction failed or too short: {len(txt) if txt else 0} chars")
+        logger.debug(f"Conservative {method_name} extraction failed or too short: {len(txt) if txt else 0} chars")
     except Exception as e:
-        logger.debug(f"Conservative BeautifulSoup extraction failed: {e}")
-    
-    # Method 4: Enhanced regex-based extraction (last resort)
+        logger.debug(f"Conservative extraction failed: {e}")
+    return ""
+
+
+def _regex_text(html: HtmlInput) -> str:
+    """Method 4: Enhanced regex-based extraction (last resort)."""
     try:
-        # Remove HTML tags but keep text content
-        txt = re.sub(r'<[^>]+>', ' ', html)
+        if isinstance(html, (bytes, bytearray)):
+            # Only this method needs text; the DOM parsers worked on the bytes directly
+            html = bytes(html).decode('utf-8', errors='replace')
+        # Remove HTML tags but keep text content, decode entities (&nbsp; becomes a
+        # non-breaking space, which the whitespace collapse then normalizes)
+        txt = _html.unescape(_TAG_RE.sub(' ', html))
         # Remove extra whitespace
-        txt = re.sub(r'\s+', ' ', txt).strip()
-        # Remove common HTML entities
-        txt = txt.replace('&nbsp;', ' ').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-        txt = txt.replace('&quot;', '"').replace('&#39;', "'").replace('&apos;', "'")
+        txt = _WS_RE.sub(' ', txt).strip()
         
         if txt and len(txt) > 50:
             logger.debug(f"Enhanced regex extraction successful: {len(txt)} chars")
             return txt
-        else:
-            logger.debug(f"Enhanced regex extraction failed or too short: {len(txt) if txt else 0} chars")
+        logger.debug(f"Enhanced regex extraction failed or too short: {len(txt) if txt else 0} chars")
     except Exception as e:
         logger.debug(f"Enhanced regex extraction failed: {e}")
-    
-    # All methods failed
-    logger.warning(f"All text extraction methods failed for {url or 'unknown URL'}. HTML length: {original_length}")
     return ""
-
-
-
-
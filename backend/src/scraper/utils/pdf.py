@@ -11,6 +11,7 @@ from pathlib import Path
 import yaml
 import time
 from .strings import normalize_text
+from ...search.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -275,7 +276,7 @@ def extract_pdf_content(pdf_source: Union[str, bytes], company: str = "") -> str
                 try:
                     logger.info(f"Download attempt {attempt + 1}/{max_retries + 1} for {pdf_source}")
                     # Reduced timeout from 60s to 30s to prevent hanging
-                    response = requests.get(pdf_source, headers=headers, stream=True, timeout=30)
+                    response = get_http_session().get(pdf_source, headers=headers, stream=True, timeout=30)
                     logger.info(f"Response status: {response.status_code}, Content-Type: {response.headers.get('Content-Type', 'Unknown')}")
                     response.raise_for_status()
                     
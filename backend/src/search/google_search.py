@@ -1,4 +1,3 @@
-import requests
 import os
 from dotenv import load_dotenv
 from typing import List, Dict, Optional, Union, Set, Any, Tuple
@@ -8,25 +7,38 @@ import json
 import re
 from pathlib import Path
 import hashlib
+import sqlite3
+import functools
 import time
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-# Load environment variables from project root
+from .http_session import get_api_client, parse_json, API_HEADERS, HTTP_ERRORS
+from .rate_limit import TokenBucket
+
+# Environment variables are loaded from the project root .env on first use (see _creds)
 import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-load_dotenv(dotenv_path=os.path.join(project_root, '.env'))
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Cache directory
+# Cache directory - holds a single SQLite database of search results
 CACHE_DIR = Path(__file__).parent.parent.parent / 'search_cache'
-CACHE_DIR.mkdir(exist_ok=True)
+CACHE_DB = CACHE_DIR / 'cache.db'
 
 # Cache expiry time (24 hours)
 CACHE_EXPIRY = 24 * 60 * 60
 
 # RECURSION FIX: Add domain caching to prevent infinite loops
 _domain_cache: dict[str, list[str]] = {}
+DOMAIN_DISCOVERY_CACHE_SIZE = 4096  # Companies whose discovery query results are memoized
+# Pattern-generated fallbacks are only reused briefly, so a transient discovery failure isn't pinned
+_domain_fallback_cache: dict[str, tuple[float, list[str]]] = {}
+DOMAIN_FALLBACK_TTL = 10 * 60
 
 # SCORING CONSTANTS - Centralized magic numbers for easy tuning
 OFFICIAL_DOMAIN_BOOST = 200        # Massive bonus for company's own domain
@@ -43,63 +55,157 @@ CDN_PATTERN_BOOST = 80             # Company CDN patterns
 # SEARCH THRESHOLDS
 MIN_SCORE_PRIORITY_DOMAIN = 150    # Lower threshold for company domain
 MIN_SCORE_YEAR_SEARCH = 200        # Higher threshold for external sources
+CONFIDENT_REPORT_SCORE = 400       # Year searches are skipped once max_results priority candidates reach this
 
 # RATE LIMITING
 RATE_LIMIT_DELAY = 0.1             # 10 queries/sec (conservative start)
+CSE_QUERIES_PER_MINUTE = int(60 / RATE_LIMIT_DELAY)
+CSE_BURST = 10                     # Requests allowed back-to-back before throttling kicks in
+MAX_SEARCH_WORKERS = 8             # Concurrent CSE requests across all callers
+
+# CSE partial response - only the fields we read, unindented, for a smaller body to download and parse
+CSE_RESPONSE_FIELDS = "items(link,snippet,title),error(message,code)"
+
+# Shared by every CSE request (result pages and domain discovery) so parallel fetches keep the same QPS
+_rate_limiter = TokenBucket(CSE_QUERIES_PER_MINUTE, capacity=CSE_BURST)
+
+# Reused across calls to avoid creating threads per search
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS, thread_name_prefix="cse")
+
+# In-process LRU in front of the SQLite cache, for queries repeated within one run
+SEARCH_MEMORY_CACHE_SIZE = 1024
+_memory_cache: "OrderedDict[str, Tuple[float, Dict[str, Dict[str, str]]]]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+# Opened lazily; one connection shared by all threads (WAL lets readers and the writer overlap)
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_db_lock = threading.Lock()
+
+def _open_cache_db() -> sqlite3.Connection:
+    CACHE_DIR.mkdir(exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS search_cache "
+        "(key TEXT PRIMARY KEY, ts REAL NOT NULL, query TEXT NOT NULL, payload TEXT NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_ts ON search_cache (ts)")
+    # Expired rows are swept in one indexed delete per process rather than checked file by file
+    conn.execute("DELETE FROM search_cache WHERE ts < ?", (time.time() - CACHE_EXPIRY,))
+    return conn
+
+def _cache_db_execute(sql: str, params: Tuple = ()) -> List[Tuple]:
+    global _cache_db
+    with _cache_db_lock:
+        if _cache_db is None:
+            _cache_db = _open_cache_db()
+        return _cache_db.execute(sql, params).fetchall()
 
 # Generate a cache key for a search query
-# def get_cache_key(query: str) -> str:
-#     return hashlib.md5(query.encode()).hexdigest()
+def get_cache_key(query: str) -> str:
+    return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
 
 # Get cached search results if they exist and are not expired
-# def get_cached_results(query: str) -> Optional[Dict[str, Dict[str, str]]]:
-#     cache_key = get_cache_key(query)
-#     cache_file = CACHE_DIR / f"{cache_key}.json"
-#     
-#     if not cache_file.exists():
-#         return None
-#     
-#     try:
-#         with open(cache_file, 'r') as f:
-#             data = json.load(f)
-#         
-#         # Check if cache is expired
-#         if time.time() - data['timestamp'] > CACHE_EXPIRY:
-#             logger.debug(f"Cache expired for query: {query}")
-#             return None
-#         
-#         logger.debug(f"Using cached results for query: {query}")
-#         return data['results']
-#     
-#     except Exception as e:
-#         logger.warning(f"Failed to read cache for query '{query}': {e}")
-#         return None
+def get_cached_results(query: str) -> Optional[Dict[str, Dict[str, str]]]:
+    cache_key = get_cache_key(query)
+    
+    with _memory_cache_lock:
+        entry = _memory_cache.get(cache_key)
+        if entry is not None:
+            _memory_cache.move_to_end(cache_key)
+    if entry is not None:
+        timestamp, results = entry
+        if time.time() - timestamp <= CACHE_EXPIRY:
+            logger.debug(f"Using in-memory cached results for query: {query}")
+            return dict(results)
+    
+    try:
+        rows = _cache_db_execute(
+            "SELECT ts, payload FROM search_cache WHERE key = ? AND ts >= ?",
+            (cache_key, time.time() - CACHE_EXPIRY)
+        )
+        if not rows:
+            return None
+        
+        timestamp, payload = rows[0]
+        results = json.loads(payload)
+        logger.debug(f"Using cached results for query: {query}")
+        _remember_results(cache_key, timestamp, results)
+        return dict(results)
+    
+    except Exception as e:
+        logger.warning(f"Failed to read cache for query '{query}': {e}")
+        return None
 
 # Cache search results for future use
-# def cache_results(query: str, results: Dict[str, Dict[str, str]]) -> None:
-#     cache_key = get_cache_key(query)
-#     cache_file = CACHE_DIR / f"{cache_key}.json"
-#     
-#     try:
-#         data = {
-#             'timestamp': time.time(),
-#             'query': query,
-#             'results': results
-#         }
-#         
-#         with open(cache_file, 'w') as f:
-#             json.dump(data, f)
-#         
-#         logger.debug(f"Cached {len(results)} results for query: {query}")
-#     
-#     except Exception as e:
-#         logger.warning(f"Failed to cache results for query '{query}': {e}")
+def cache_results(query: str, results: Dict[str, Dict[str, str]]) -> None:
+    cache_key = get_cache_key(query)
+    timestamp = time.time()
+    _remember_results(cache_key, timestamp, dict(results))
+    
+    try:
+        _cache_db_execute(
+            "INSERT OR REPLACE INTO search_cache (key, ts, query, payload) VALUES (?, ?, ?, ?)",
+            (cache_key, timestamp, query, json.dumps(results))
+        )
+        logger.debug(f"Cached {len(results)} results for query: {query}")
+    
+    except Exception as e:
+        logger.warning(f"Failed to cache results for query '{query}': {e}")
+
+# Whole seed/report pipelines (searches + filtering + scoring), for repeat evaluations of a company
+PIPELINE_CACHE_SIZE = 1024
+PIPELINE_CACHE_TTL = 60 * 60
+_pipeline_cache: "OrderedDict[Tuple, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+_pipeline_cache_lock = threading.Lock()
+
+def _pipeline_cache_get(key: Tuple) -> Optional[List[str]]:
+    """URLs a pipeline returned for these arguments within PIPELINE_CACHE_TTL, or None"""
+    with _pipeline_cache_lock:
+        entry = _pipeline_cache.get(key)
+        if entry is None:
+            return None
+        timestamp, urls = entry
+        if time.time() - timestamp > PIPELINE_CACHE_TTL:
+            del _pipeline_cache[key]
+            return None
+        _pipeline_cache.move_to_end(key)
+    logger.debug(f"Using cached pipeline results for {key[0]}: {key[1]}")
+    return list(urls)
+
+def _pipeline_cache_put(key: Tuple, urls: List[str]) -> None:
+    # Empty results usually mean a quota/network failure - let the next call retry
+    if not urls:
+        return
+    with _pipeline_cache_lock:
+        _pipeline_cache[key] = (time.time(), tuple(urls))
+        _pipeline_cache.move_to_end(key)
+        if len(_pipeline_cache) > PIPELINE_CACHE_SIZE:
+            _pipeline_cache.popitem(last=False)
+
+def clear_pipeline_cache() -> None:
+    """Forget memoized seed and report lists, e.g. to force a fresh evaluation"""
+    with _pipeline_cache_lock:
+        _pipeline_cache.clear()
+
+def _remember_results(cache_key: str, timestamp: float, results: Dict[str, Dict[str, str]]) -> None:
+    with _memory_cache_lock:
+        _memory_cache[cache_key] = (timestamp, results)
+        _memory_cache.move_to_end(cache_key)
+        if len(_memory_cache) > SEARCH_MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
 
 # API credentials
-GOOGLE_CSE_API_KEY = os.getenv("GOOGLE_CSE_API_KEY")
-GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
-if not GOOGLE_CSE_API_KEY or not GOOGLE_CSE_ID:
-    logger.warning("Google CSE credentials missing – searches will fail.")
+@functools.lru_cache(maxsize=1)
+def _creds() -> Tuple[Optional[str], Optional[str]]:
+    """(GOOGLE_CSE_API_KEY, GOOGLE_CSE_ID), resolved once on the first search instead of at import"""
+    load_dotenv(dotenv_path=os.path.join(project_root, '.env'))
+    api_key = os.getenv("GOOGLE_CSE_API_KEY")
+    cse_id = os.getenv("GOOGLE_CSE_ID")
+    if not api_key or not cse_id:
+        logger.warning("Google CSE credentials missing – searches will fail.")
+    return api_key, cse_id
 
 # Simplified query structure - Direct questions from criteria table
 CRITERIA_QUESTIONS = {
@@ -193,6 +299,17 @@ CRITERIA_QUESTIONS = {
     ]
 }
 
+# Templates pre-split on {company} once, so rendering is a single str.join instead of a
+# str.format parse per template per company
+_COMPILED_CRITERIA_QUESTIONS = {
+    criterion: [tuple(template.split('{company}')) for template in templates]
+    for criterion, templates in CRITERIA_QUESTIONS.items()
+}
+
+def render_criterion_questions(criterion: str, company: str, limit: Optional[int] = None) -> List[str]:
+    """Return the first `limit` criteria questions for a criterion with the company filled in"""
+    return [company.join(parts) for parts in _COMPILED_CRITERIA_QUESTIONS.get(criterion, [])[:limit]]
+
 # Priority queries for initial seeds
 PRIORITY_QUERIES = [
     '{company} total truck fleet size number of vehicles trailers tractors',
@@ -217,6 +334,20 @@ QUERY_TEMPLATES = {
     ]
 }
 
+def _substring_alternation(terms: List[str]) -> "re.Pattern[str]":
+    """One compiled pattern matching wherever any of the literal terms appears"""
+    if not terms:
+        return re.compile(r'(?!)')  # An empty alternation would match everything
+    return re.compile('|'.join(map(re.escape, terms)))
+
+# Phrases on these topics get a company-domain search first in search_google
+_SUSTAINABILITY_PHRASE_RE = re.compile(r'sustainability|esg|report|emission')
+
+@functools.lru_cache(maxsize=1024)
+def _is_sustainability_phrase(phrase: str) -> bool:
+    """Single C-level scan per phrase; criteria templates repeat, so most calls are cache hits"""
+    return _SUSTAINABILITY_PHRASE_RE.search(phrase.lower()) is not None
+
 def make_query(company: str, phrase: str, year: int = None) -> str:
     """Build a natural-language query for Google CSE"""
     q = f'{company} {phrase}'
@@ -224,22 +355,68 @@ def make_query(company: str, phrase: str, year: int = None) -> str:
         q += f' {year}'
     return q
 
+# URLs recur across priority, year and dedup passes; parse/canonicalize each one once
+URL_CACHE_SIZE = 4096
+
+# urlparse returns an immutable ParseResult, so cached results are safe to share
+_cached_urlparse = functools.lru_cache(maxsize=URL_CACHE_SIZE)(urlparse)
+
+# Query parameters that only track the click, never change the page
+_TRACKING_PARAM_RE = re.compile(r'^(?:utm_|fbclid|gclid|msclkid|mc_cid|mc_eid)')
+
+# ASCII scheme://netloc/path with no query, params, fragment, whitespace or IPv6 brackets -
+# nothing for urlparse to strip or validate
+_PLAIN_URL_RE = re.compile(r'^([A-Za-z][A-Za-z0-9+.-]*)://([^/?#;\[\]\x00-\x20\x7f]+)((?:/[^?#;\x00-\x20\x7f]*)?)$')
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
 def canonicalize(url: str) -> str:
     """Canonicalize URL by removing UTM parameters and normalizing format"""
+    # Fast path for the common query-less URL: same result as the full round-trip below
+    m = _PLAIN_URL_RE.match(url) if url.isascii() else None
+    if m:
+        scheme, netloc, path = m.groups()
+        return f"{scheme.lower()}://{netloc.lower()}{path.rstrip('/')}"
     try:
         p = urlparse(url)
         # Remove UTM and other tracking parameters
-        qs = {k: v for k, v in parse_qsl(p.query) if not k.startswith(("utm_", "fbclid", "gclid"))}
+        qs = {k: v for k, v in parse_qsl(p.query) if not _TRACKING_PARAM_RE.match(k)}
         path = p.path.rstrip("/")
         return urlunparse((p.scheme, p.netloc.lower(), path, "", urlencode(sorted(qs.items())), ""))
     except Exception:
         return url
 
+_DOMAIN_END = None  # Trie key marking a complete domain; never equal to a label string
+
+@functools.lru_cache(maxsize=256)
+def _domain_trie(domains: Tuple[str, ...]) -> Dict:
+    """Reversed-label trie for a domain list ('sec.gov' -> gov -> sec), built once per list"""
+    trie: Dict = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        node[_DOMAIN_END] = True
+    return trie
+
+def host_in_domains(host: str, domains: Tuple[str, ...]) -> bool:
+    """
+    True when host is one of the domains or a subdomain of one. Matches whole
+    labels only, so 'ft.com' accepts 'www.ft.com' but not 'microsoft.com'.
+    """
+    node = _domain_trie(domains)
+    for label in reversed(host.split('.')):
+        node = node.get(label)
+        if node is None:
+            return False
+        if _DOMAIN_END in node:
+            return True
+    return False
+
 def is_official_domain(url: str, base_domains: List[str]) -> bool:
     """Check if URL is from an official company domain or subdomain"""
     try:
-        host = urlparse(url).netloc.lower()
-        return any(host == d or host.endswith("." + d) for d in base_domains)
+        host = _cached_urlparse(url).netloc.lower()
+        return host_in_domains(host, tuple(base_domains))
     except Exception:
         return False
 
@@ -247,13 +424,18 @@ def search_google(company: str, phrase: str, year: int = 2025, max_pages: int =
     """Core search function with deterministic, repeatable results using caching"""
     q = make_query(company, phrase, year)
     
-
+    cache_query = f"search_google|{company}|{phrase}|{year}|{max_pages}"
+    cached = get_cached_results(cache_query)
+    if cached is not None:
+        logger.info(f"Using cached results for query: {q} ({len(cached)} URLs)")
+        return cached
     
     # If not cached, perform search
     all_results = {}
     logger.info(f"Searching with query: {q}")
     
-    if not GOOGLE_CSE_API_KEY or not GOOGLE_CSE_ID:
+    api_key, cse_id = _creds()
+    if not api_key or not cse_id:
         logger.error("Missing Google CSE API credentials")
         return {}
     
@@ -261,7 +443,7 @@ def search_google(company: str, phrase: str, year: int = 2025, max_pages: int =
     recent_years = [2025, 2024, 2023]
     
     # First, try company-specific domain search for sustainability content
-    if any(term in phrase.lower() for term in ['sustainability', 'esg', 'report', 'emission']):
+    if _is_sustainability_phrase(phrase):
         # Try company-specific domain search first
         company_domains = get_company_domain(company)
         if isinstance(company_domains, list) and company_domains:
@@ -283,14 +465,12 @@ def search_google(company: str, phrase: str, year: int = 2025, max_pages: int =
         for search_year in recent_years:
             # Use quoted company name for more precise matching with year filter
             enhanced_query = f'"{company}" {phrase}'
-            broader_results = _perform_search(enhanced_query, search_year, max_pages)
+            # ENHANCED: Only results from reliable sources - checked as each page is parsed
+            broader_results = _perform_search(enhanced_query, search_year, max_pages,
+                                              target=8 - len(all_results), reliable_only=True)
             
-            # Filter to prioritize company-relevant results with snippet analysis
             for url, data in broader_results.items():
-                if url not in all_results:
-                    # ENHANCED: Check if this result is company-relevant AND from reliable source
-                    if _is_reliable_source(url, data):
-                        all_results[url] = data
+                all_results.setdefault(url, data)
             
             # Stop if we have enough good results
             if len(all_results) >= 8:
@@ -298,81 +478,145 @@ def search_google(company: str, phrase: str, year: int = 2025, max_pages: int =
     
     logger.info(f"Total unique URLs found: {len(all_results)}")
     
-
+    # Empty results usually mean a quota/network failure - don't pin those for CACHE_EXPIRY
+    if all_results:
+        cache_results(cache_query, all_results)
     
     return all_results
 
-def _perform_search(query: str, year: int, max_pages: int) -> Dict[str, Dict[str, str]]:
-    """Helper function to perform the actual API search"""
+def _perform_search(query: str, year: int, max_pages: int, target: Optional[int] = None,
+                    reliable_only: bool = False) -> Dict[str, Dict[str, str]]:
+    """
+    Helper function to perform the actual API search.
+    
+    With a target, later pages are skipped once the first page already returns that many results.
+    With reliable_only, results failing _is_reliable_source are dropped while each page is parsed.
+    """
+    cache_query = f"cse|{query}|{year}|{max_pages}"
+    if target is not None:
+        cache_query += f"|{target}"
+    if reliable_only:
+        cache_query += "|reliable"
+    cached = get_cached_results(cache_query)
+    if cached is not None:
+        return cached
+    
+    # Add date restriction for recent content (simpler and more reliable)
+    current_year = 2025
+    restrict_date = bool(year and year >= current_year - 2)  # Only restrict if searching recent years
+    
+    # Page 1 first, so a satisfied target costs a single request
+    pages = [_fetch_search_page(query, 0, restrict_date, reliable_only)]
+    first_results, first_stop = pages[0]
+    if max_pages > 1 and not first_stop and (target is None or len(first_results) < target):
+        # Remaining pages are requested concurrently (throttled by _rate_limiter), then merged in page order
+        pages.extend(_SEARCH_EXECUTOR.map(
+            lambda i: _fetch_search_page(query, i, restrict_date, reliable_only),
+            range(1, max_pages)
+        ))
+    
     results = {}
+    for i, (page_results, stop) in enumerate(pages):
+        results.update(page_results)
+        if page_results:
+            logger.info(f"Found {len(page_results)} results on page {i+1} (total: {len(results)})")
+        if stop:
+            break  # Same pages kept as the sequential loop: nothing after a fatal error
+    
+    if results:
+        cache_results(cache_query, results)
+    
+    return results
+
+def multi_search(queries: List[Tuple[str, int]]) -> List[Dict[str, Dict[str, str]]]:
+    """
+    Single-page searches for many (query, year) pairs at once, returned in input order.
+    
+    The requests share the pooled (HTTP/2 when available) API client and are paced by _rate_limiter.
+    A failed query yields {}. Single-page searches never submit to _SEARCH_EXECUTOR themselves,
+    so this can't deadlock.
+    """
+    def run(query_year: Tuple[str, int]) -> Dict[str, Dict[str, str]]:
+        query, year = query_year
+        try:
+            return _perform_search(query, year, 1)
+        except Exception as e:
+            logger.warning(f"Search failed for '{query}': {e}")
+            return {}
+    
+    return list(_SEARCH_EXECUTOR.map(run, queries))
+
+def _fetch_search_page(query: str, page: int, restrict_date: bool,
+                       reliable_only: bool = False) -> Tuple[Dict[str, Dict[str, str]], bool]:
+    """
+    Fetch one page of CSE results.
     
-    for i in range(max_pages):
-        # Add rate limiting delay
-        if i > 0:
-            time.sleep(RATE_LIMIT_DELAY)
+    Returns (results, stop) - stop is True on errors after which later pages shouldn't be used
+    (quota/auth, network, unexpected failures).
+    """
+    api_key, cse_id = _creds()
+    params = {
+        "q": query,
+        "key": api_key,
+        "cx": cse_id,
+        "num": 10,
+        "start": 1 + 10 * page,
+        "gl": "us",
+        "lr": "lang_en",
+        "safe": "off",
+        "fields": CSE_RESPONSE_FIELDS,
+        "prettyPrint": "false"
+    }
+    if restrict_date:
+        params["dateRestrict"] = "y1"  # Last year of content
+    
+    results = {}
+    try:
+        _rate_limiter.acquire()
+        resp = get_api_client().get("https://www.googleapis.com/customsearch/v1",
+                                    params=params, headers=API_HEADERS, timeout=10)
+        resp.raise_for_status()
+        data = parse_json(resp)
         
-        params = {
-            "q": query,
-            "key": GOOGLE_CSE_API_KEY,
-            "cx": GOOGLE_CSE_ID,
-            "num": 10,
-            "start": 1 + 10 * i,
-            "gl": "us",
-            "lr": "lang_en",
-            "safe": "off"
-        }
+        if "error" in data:
+            error_msg = data['error'].get('message', 'Unknown error')
+            logger.error(f"Google API error: {error_msg}")
+            
+            # Stop on quota/auth errors, continue on other errors
+            if any(err in error_msg.lower() for err in ['quota', 'limit', 'auth', 'key']):
+                logger.error("Stopping search due to quota/auth error")
+                return results, True
+            return results, False
         
-        # Add date restriction for recent content (simpler and more reliable)
-        current_year = 2025
-        if year and year >= current_year - 2:  # Only restrict if searching recent years
-            params["dateRestrict"] = "y1"  # Last year of content
+        if "items" not in data:
+            logger.warning(f"No results found for query: {query} (page {page+1})")
+            return results, False
         
-        try:
-            resp = requests.get("https://www.googleapis.com/customsearch/v1", 
-                              params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            if "error" in data:
-                error_msg = data['error'].get('message', 'Unknown error')
-                logger.error(f"Google API error: {error_msg}")
+        for item in data.get("items", []):
+            if "link" in item:
+                url = canonicalize(item["link"])
+                snippet = item.get("snippet", "")
+                title = item.get("title", "")
                 
-                # Stop on quota/auth errors, continue on other errors
-                if any(err in error_msg.lower() for err in ['quota', 'limit', 'auth', 'key']):
-                    logger.error("Stopping search due to quota/auth error")
-                    break
-                continue
-            
-            if "items" not in data:
-                logger.warning(f"No results found for query: {query} (page {i+1})")
-                continue
-            
-            items = data.get("items", [])
-            for item in items:
-                if "link" in item:
-                    url = canonicalize(item["link"])
-                    snippet = item.get("snippet", "")
-                    title = item.get("title", "")
-                    
-                    # Don't store URL redundantly in the data
-                    results[url] = {
-                        "snippet": snippet,
-                        "title": title
-                    }
-                    
-            logger.info(f"Found {len(items)} results on page {i+1} (total: {len(results)})")
-                    
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            break  # Network errors usually mean we should stop
-        except ValueError as e:
-            logger.error(f"JSON decode error: {e}")
-            continue  # Malformed response, try next page
-        except Exception as e:
-            logger.error(f"Unexpected error during search: {e}")
-            break  # Unknown errors, better to stop
-    
-    return results
+                # Don't store URL redundantly in the data
+                data = {
+                    "snippet": snippet,
+                    "title": title
+                }
+                if reliable_only and not _is_reliable_source(url, data):
+                    continue
+                results[url] = data
+        return results, False
+                
+    except HTTP_ERRORS as e:
+        logger.error(f"Request failed: {e}")
+        return results, True  # Network errors usually mean we should stop
+    except ValueError as e:
+        logger.error(f"JSON decode error: {e}")
+        return results, False  # Malformed response, try next page
+    except Exception as e:
+        logger.error(f"Unexpected error during search: {e}")
+        return results, True  # Unknown errors, better to stop
 
 # def _is_company_relevant_result(url: str, data: Dict[str, str], company: str) -> bool:
 #     """Check if a search result is relevant to the specific company"""
@@ -419,112 +663,127 @@ def _perform_search(query: str, year: int, max_pages: int) -> Dict[str, Dict[str
     
 #     return False
 
+# Aggregators and social sites that are never a company's own domain
+_DISCOVERY_SKIP_DOMAIN_RE = _substring_alternation([
+    'wikipedia', 'linkedin', 'facebook', 'twitter', 'youtube',
+    'bloomberg', 'reuters', 'sec.gov', 'crunchbase', 'glassdoor',
+    'indeed', 'yelp', 'bbb.org'
+])
+
 # Simple domain discovery for company websites
 def discover_company_domain(company: str) -> List[str]:
+    api_key, cse_id = _creds()
+    if not api_key or not cse_id:
+        return []
     try:
-        # Use direct API call instead of search_google to avoid recursion
-        query = f'"{company}" official website'
-        logger.debug(f"Discovering domains for {company}")
-        
-        if not GOOGLE_CSE_API_KEY or not GOOGLE_CSE_ID:
-            return []
-        
-        # Direct API call to avoid recursion through search_google
-        params = {
-            "q": query,
-            "key": GOOGLE_CSE_API_KEY,
-            "cx": GOOGLE_CSE_ID,
-            "num": 5,
-            "start": 1,
-            "gl": "us",
-            "lr": "lang_en",
-            "safe": "off"
-        }
-        
-        resp = requests.get("https://www.googleapis.com/customsearch/v1", 
-                          params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        
-        if "error" in data:
-            logger.debug(f"Domain discovery API error: {data['error'].get('message', 'Unknown error')}")
-            return []
-        
-        discovered_domains = []
-        company_variations = [
-            company.lower().strip(),
-            company.lower().replace(' ', '').strip(),
-            company.lower().replace(' ', '-').strip(),
-        ]
-        
-        # Remove common company suffixes for better matching
-        for i, variation in enumerate(company_variations):
-            for suffix in ['inc', 'corp', 'corporation', 'company', 'co', 'llc', 'ltd']:
-                if variation.endswith(f' {suffix}'):
-                    company_variations.append(variation[:-len(f' {suffix}')].strip())
-                elif variation.endswith(suffix):
-                    company_variations.append(variation[:-len(suffix)].strip())
-        
-        for item in data.get("items", []):
-            try:
-                url = item.get("link", "")
-                title = item.get("title", "").lower()
-                parsed = urlparse(url)
-                domain = parsed.netloc.lower()
-                
-                # Skip obvious non-company domains
-                if any(skip in domain for skip in [
-                    'wikipedia', 'linkedin', 'facebook', 'twitter', 'youtube',
-                    'bloomberg', 'reuters', 'sec.gov', 'crunchbase', 'glassdoor',
-                    'indeed', 'yelp', 'bbb.org'
-                ]):
-                    continue
-                
-                # Improved domain cleaning - only remove www prefix and extract main domain part
-                domain_clean = domain.replace('www.', '')
-                domain_main = domain_clean.split('.')[0]  # Get the main part before first dot
-                
-                # Check if this looks like a company domain
-                for variation in company_variations:
-                    if len(variation) > 3:
-                        # Stricter matching: exact match or starts/ends with company name
-                        if (variation == domain_main or 
-                            domain_main.startswith(variation) or 
-                            domain_main.endswith(variation) or
-                            (len(variation) > 5 and variation in domain_main)):
-                            
-                                                         # Additional validation: check if title contains company name
-                             if any(var in title for var in company_variations[:3]):
-                                 # Store clean domain without www
-                                 clean_domain = domain.replace('www.', '')
-                                 discovered_domains.append(clean_domain)
-                                 logger.debug(f"Found company domain: {clean_domain} (matched '{variation}')")
-                                 break
-                
-            except Exception as e:
-                logger.debug(f"Error processing domain discovery item: {e}")
-                continue
-        
-        # Remove duplicates while preserving order
-        unique_domains = []
-        for domain in discovered_domains:
-            if domain not in unique_domains:
-                unique_domains.append(domain)
-        
-        return unique_domains[:3]
-        
+        return list(_discover_company_domain(company))
     except Exception as e:
         logger.debug(f"Domain discovery failed for {company}: {e}")
         return []
 
+@functools.lru_cache(maxsize=DOMAIN_DISCOVERY_CACHE_SIZE)
+def _discover_company_domain(company: str) -> Tuple[str, ...]:
+    """Memoized discovery query; API failures raise so they are retried rather than cached"""
+    # Use direct API call instead of search_google to avoid recursion
+    query = f'"{company}" official website'
+    logger.debug(f"Discovering domains for {company}")
+    
+    # Direct API call to avoid recursion through search_google
+    api_key, cse_id = _creds()
+    params = {
+        "q": query,
+        "key": api_key,
+        "cx": cse_id,
+        "num": 5,
+        "start": 1,
+        "gl": "us",
+        "lr": "lang_en",
+        "safe": "off",
+        "fields": CSE_RESPONSE_FIELDS,
+        "prettyPrint": "false"
+    }
+    
+    _rate_limiter.acquire()
+    resp = get_api_client().get("https://www.googleapis.com/customsearch/v1",
+                                params=params, headers=API_HEADERS, timeout=10)
+    resp.raise_for_status()
+    data = parse_json(resp)
+    
+    if "error" in data:
+        raise RuntimeError(f"API error: {data['error'].get('message', 'Unknown error')}")
+    
+    discovered_domains = []
+    company_lower = company.lower()
+    company_variations = [
+        company_lower.strip(),
+        company_lower.replace(' ', '').strip(),
+        company_lower.replace(' ', '-').strip(),
+    ]
+    
+    # Remove common company suffixes for better matching
+    for i, variation in enumerate(company_variations):
+        for suffix in ['inc', 'corp', 'corporation', 'company', 'co', 'llc', 'ltd']:
+            if variation.endswith(f' {suffix}'):
+                company_variations.append(variation[:-len(f' {suffix}')].strip())
+            elif variation.endswith(suffix):
+                company_variations.append(variation[:-len(suffix)].strip())
+    
+    # Title must name the company (first three forms); domain matching uses every distinct form
+    title_variations = tuple(dict.fromkeys(company_variations[:3]))
+    match_variations = [v for v in dict.fromkeys(company_variations) if len(v) > 3]
+    
+    for item in data.get("items", []):
+        try:
+            url = item.get("link", "")
+            title = item.get("title", "").lower()
+            parsed = urlparse(url)
+            domain = parsed.netloc.lower()
+            
+            # Skip obvious non-company domains
+            if _DISCOVERY_SKIP_DOMAIN_RE.search(domain):
+                continue
+            
+            # Additional validation: check if title contains company name
+            if not any(var in title for var in title_variations):
+                continue
+            
+            # Improved domain cleaning - only remove www prefix and extract main domain part
+            domain_clean = domain.replace('www.', '')
+            domain_main = domain_clean.split('.')[0]  # Get the main part before first dot
+            
+            # Check if this looks like a company domain
+            for variation in match_variations:
+                # Stricter matching: starts/ends with company name (covers exact match),
+                # or contains it for longer names
+                if (domain_main.startswith(variation) or 
+                    domain_main.endswith(variation) or
+                    (len(variation) > 5 and variation in domain_main)):
+                    # Store clean domain without www
+                    discovered_domains.append(domain_clean)
+                    logger.debug(f"Found company domain: {domain_clean} (matched '{variation}')")
+                    break
+            
+        except Exception as e:
+            logger.debug(f"Error processing domain discovery item: {e}")
+            continue
+    
+    # Remove duplicates while preserving order
+    return tuple(list(dict.fromkeys(discovered_domains))[:3])
+
 def get_company_domain(company: str) -> Union[str, List[str]]:
     """Get potential company domains"""
     company_clean = company.lower().strip()
+    if company_clean in _domain_cache:
+        return list(_domain_cache[company_clean])
+    fallback = _domain_fallback_cache.get(company_clean)
+    if fallback is not None and time.time() - fallback[0] < DOMAIN_FALLBACK_TTL:
+        return list(fallback[1])
     
     # Try to discover actual domains first
     discovered = discover_company_domain(company)
     if discovered:
         # Domains are already cleaned in discover_company_domain
+        _domain_cache[company_clean] = discovered[:3]
         return discovered[:3]
     
     # Fallback to pattern generation
@@ -539,6 +798,7 @@ def get_company_domain(company: str) -> Union[str, List[str]]:
                 base_domains.append(f"{clean_key}.com")
             break
     
+    _domain_fallback_cache[company_clean] = (time.time(), base_domains[:3])
     return base_domains[:3]
 
 # Simplified sustainability data collection using criteria questions
@@ -555,35 +815,37 @@ def get_company_sustainability_data(company: str, search_query: Optional[str] =
         "regulatory": []
     }
     
-    all_links_seen = set()
+    # Insertion-ordered dicts act as ordered sets: one C-level update per batch of links
+    all_links_seen: Dict[str, None] = {}
     
     # If specific search query provided, use it
     if search_query:
         search_results = search_google(company, search_query, year=2025, max_pages=max_pages)
-        filtered_links = filter_search_results(search_results, company)
-        for link in filtered_links:
-            if link not in all_links_seen:
-                all_links_seen.add(link)
-                results["all_unique_links"].append(link)
+        results["all_unique_links"] = list(dict.fromkeys(filter_search_results(search_results, company)))
         return results
     
+    # Criteria share overlapping question templates - search and filter each distinct phrase
+    # (case/whitespace-insensitive, as Google treats it) only once per call
+    phrase_links: Dict[str, List[str]] = {}
+    
+    def links_for_phrase(search_phrase: str) -> List[str]:
+        phrase_key = ' '.join(search_phrase.lower().split())
+        if phrase_key not in phrase_links:
+            search_results = search_google(company, search_phrase, year=2025, max_pages=2)
+            phrase_links[phrase_key] = filter_search_results(search_results, company)
+        return phrase_links[phrase_key]
+    
     # Use criteria questions for each criterion
-    for criterion, questions in CRITERIA_QUESTIONS.items():
-        criterion_links = []
-        criterion_seen = set()
+    for criterion in CRITERIA_QUESTIONS:
+        criterion_links: Dict[str, None] = {}
         
-        for question_template in questions[:3]:
-            query = question_template.format(company=company)
+        for query in render_criterion_questions(criterion, company, 3):
             search_phrase = query.replace(f"{company} ", "")
             
             try:
-                search_results = search_google(company, search_phrase, year=2025, max_pages=2)
-                filtered_links = filter_search_results(search_results, company)
+                filtered_links = links_for_phrase(search_phrase)
                 
-                for link in filtered_links[:5]:
-                    if link not in criterion_seen:
-                        criterion_seen.add(link)
-                        criterion_links.append(link)
+                criterion_links.update(dict.fromkeys(filtered_links[:5]))
                 
                 if len(criterion_links) >= 4:
                     break
@@ -592,13 +854,10 @@ def get_company_sustainability_data(company: str, search_query: Optional[str] =
                 logger.warning(f"Search failed for query '{query}': {e}")
                 continue
         
-        results[criterion] = criterion_links
-        
-        for link in criterion_links:
-            if link not in all_links_seen:
-                all_links_seen.add(link)
-                results["all_unique_links"].append(link)
+        results[criterion] = list(criterion_links)
+        all_links_seen.update(criterion_links)
     
+    results["all_unique_links"] = list(all_links_seen)
     logger.debug(f"Found {len(results['all_unique_links'])} filtered seeds for missing criteria")
     return results
 
@@ -609,8 +868,7 @@ def get_criterion_seeds(company: str, criterion: str, max_results: int = 5) -> L
     
     all_results = []
     
-    for question_template in CRITERIA_QUESTIONS[criterion][:3]:
-        query = question_template.format(company=company)
+    for query in render_criterion_questions(criterion, company, 3):
         search_phrase = query.replace(f"{company} ", "")
         
         try:
@@ -626,6 +884,80 @@ def get_criterion_seeds(company: str, criterion: str, max_results: int = 5) -> L
     
     return all_results[:max_results]
 
+def _to_soa(search_results: Dict[str, Dict[str, str]]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Flatten URL -> {title, snippet} results into parallel (urls, titles, snippets), skipping empty entries"""
+    rows = [
+        (url, data.get("title", ""), data.get("snippet", ""))
+        for url, data in search_results.items()
+        if data.get("title") or data.get("snippet")
+    ]
+    if not rows:
+        return (), (), ()
+    urls, titles, snippets = zip(*rows)
+    return urls, titles, snippets
+
+@functools.lru_cache(maxsize=1)
+def _get_analyzer():
+    """
+    Import the AI analyzer on first use. The scraper package imports this module, so a
+    top-level import would be circular; the deferred import runs once and then reuses the
+    module (and its shared OpenAI client and rate limiters) from sys.modules.
+    """
+    from ..scraper.ai_criteria_analyzer import call_openai_multi_criteria, CriteriaEvidence
+    return call_openai_multi_criteria, CriteriaEvidence
+
+# Snippet analysis batching
+SNIPPET_BATCH_CHARS = 6000  # call_openai_multi_criteria only reads this many characters of its text
+SNIPPET_SEPARATOR = "\n\n--- SNIPPET SEPARATOR ---\n\n"
+MAX_CONCURRENT_SNIPPET_BATCHES = 4  # Snippet batches sent to OpenAI at the same time
+SNIPPET_ANALYSIS_CACHE_SIZE = 256  # Batch results kept so retried analyses aren't billed twice
+_snippet_analysis_cache: "OrderedDict[str, Dict[str, Dict]]" = OrderedDict()
+_snippet_analysis_lock = threading.Lock()
+# Shared across calls (like _SEARCH_EXECUTOR) instead of a pool started and torn down per analysis
+_SNIPPET_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SNIPPET_BATCHES, thread_name_prefix="snippets")
+
+def _batch_snippets(snippets: List[str]) -> List[List[int]]:
+    """Greedily group snippet indices so each joined batch fits in SNIPPET_BATCH_CHARS"""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_len = 0
+    for i, snippet in enumerate(snippets):
+        added = len(snippet) + (len(SNIPPET_SEPARATOR) if current else 0)
+        if current and current_len + added > SNIPPET_BATCH_CHARS:
+            batches.append(current)
+            current, current_len = [], 0
+            added = len(snippet)
+        current.append(i)
+        current_len += added
+    if current:
+        batches.append(current)
+    return batches
+
+def _lower_batch(snippets: List[str], indices: List[int]) -> Tuple[str, List[int], List[int], List[int]]:
+    """Lowercased batch text plus each snippet's start and end offsets in it, for _locate_quote"""
+    lowered = [snippets[i].lower() for i in indices]
+    separator = SNIPPET_SEPARATOR.lower()
+    starts, ends = [], []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        ends.append(offset + len(text))
+        offset += len(text) + len(separator)
+    return separator.join(lowered), starts, ends, indices
+
+def _locate_quote(quote_lower: str, batch_text: str, starts: List[int], ends: List[int], indices: List[int]) -> Optional[int]:
+    """Index of the first snippet in the batch that contains the whole quote, or None"""
+    pos = batch_text.find(quote_lower)
+    while pos >= 0:
+        k = bisect_right(starts, pos) - 1
+        if pos + len(quote_lower) <= ends[k]:
+            return indices[k]
+        # Match starts in this snippet but runs past it - resume at the next snippet
+        if k + 1 == len(starts):
+            return None
+        pos = batch_text.find(quote_lower, starts[k + 1])
+    return None
+
 # Analyze search snippets for evidence before crawling full pages
 def analyze_search_snippets(search_results: Dict[str, Dict[str, str]], company: str, needed: Set[str]) -> Dict[str, 'CriteriaEvidence']:
     """AI-based analysis of Google search snippets for evidence before crawling full pages"""
@@ -634,58 +966,54 @@ def analyze_search_snippets(search_results: Dict[str, Dict[str, str]], company:
     
     logger.info(f"Analyzing {len(search_results)} search snippets with AI for {len(needed)} criteria")
     
-    # Collect all snippets into a single text for efficient batch analysis
-    combined_snippets = []
-    url_mapping = {}
-    
-    for url, result_data in search_results.items():
-        snippet = result_data.get("snippet", "")
-        title = result_data.get("title", "")
-        
-        # Skip empty snippets
-        if not snippet and not title:
-            continue
-    
-        # Combine title and snippet for analysis
-        combined_text = f"Title: {title}\nSnippet: {snippet}"
-        
-        
-        combined_snippets.append(combined_text)
-        url_mapping[len(combined_snippets) - 1] = {
-            'url': url,
-            'title': title,
-            'snippet': snippet,
-            'combined_text': combined_text
-        }
-    
+    # Parallel arrays of the non-empty results; a snippet's index is the join key across them
+    urls, titles, snippets = _to_soa(search_results)
+    combined_snippets = [f"Title: {title}\nSnippet: {snippet}" for title, snippet in zip(titles, snippets)]
     if not combined_snippets:
         logger.info("No relevant search snippets found for analysis")
         return evidence
     
-    # Batch analyze all snippets at once for efficiency
-    all_snippets_text = "\n\n--- SNIPPET SEPARATOR ---\n\n".join(combined_snippets)
+    # call_openai_multi_criteria only reads the first SNIPPET_BATCH_CHARS of its text, so
+    # split the snippets into batches that fit and analyze the batches concurrently
+    batches = _batch_snippets(combined_snippets)
     
     try:
-        # FIXED CIRCULAR IMPORT: Direct file import to avoid module loading issues
-        import sys
-        import os
-        import importlib.util
+        call_openai_multi_criteria, CriteriaEvidence = _get_analyzer()
         
-        # Get the path to ai_criteria_analyzer.py directly
-        analyzer_path = os.path.join(os.path.dirname(__file__), '..', 'scraper', 'ai_criteria_analyzer.py')
-        spec = importlib.util.spec_from_file_location("ai_criteria_analyzer", analyzer_path)
-        analyzer_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(analyzer_module)
+        def analyze_batch(indices: List[int]) -> Dict[str, Dict]:
+            batch_text = SNIPPET_SEPARATOR.join(combined_snippets[i] for i in indices)
+            cache_key = get_cache_key(f"snippets|{company}|{','.join(sorted(needed))}|{batch_text}")
+            with _snippet_analysis_lock:
+                if cache_key in _snippet_analysis_cache:
+                    return _snippet_analysis_cache[cache_key]
+            result = call_openai_multi_criteria(batch_text, needed, company)
+            if result:
+                with _snippet_analysis_lock:
+                    _snippet_analysis_cache[cache_key] = result
+                    if len(_snippet_analysis_cache) > SNIPPET_ANALYSIS_CACHE_SIZE:
+                        _snippet_analysis_cache.popitem(last=False)
+            return result
         
-        call_openai_multi_criteria = analyzer_module.call_openai_multi_criteria
-        CriteriaEvidence = analyzer_module.CriteriaEvidence
+        # Use efficient multi-criteria AI analysis, one call per batch
+        if len(batches) == 1:
+            batch_results = [analyze_batch(batches[0])]
+        else:
+            batch_results = list(_SNIPPET_EXECUTOR.map(analyze_batch, batches))
         
-        # Use efficient multi-criteria AI analysis
-        multi_result = call_openai_multi_criteria(all_snippets_text, needed, company)
+        # Each batch lowercased and joined once, so locating a quote is one C-level find per criterion
+        batch_lower = [_lower_batch(combined_snippets, indices) for indices in batches]
+        # (batch, lowercased quote) -> snippet index; criteria often cite the same passage
+        quote_locations: Dict[Tuple[int, str], Optional[int]] = {}
         
         # Process results for each criterion
         for criterion in needed:
-            criterion_result = multi_result.get(criterion, {})
+            # Keep the highest-scoring finding across batches (earliest batch wins ties)
+            criterion_result, batch_no = {}, None
+            for b, multi_result in enumerate(batch_results):
+                candidate = multi_result.get(criterion, {})
+                if candidate.get("criteria_found", False) and candidate.get("score", 0) > criterion_result.get("score", 0):
+                    criterion_result, batch_no = candidate, b
+            
             if criterion_result.get("criteria_found", False):
                 quote = criterion_result.get("quote", "")
                 evidence_score = criterion_result.get("score", 0)
@@ -696,23 +1024,18 @@ def analyze_search_snippets(search_results: Dict[str, Dict[str, str]], company:
                 extracted_unit = criterion_result.get("extracted_unit")
                 numeric_range = criterion_result.get("numeric_range")
                 
-                # Find which snippet contains this evidence
-                best_url = None
-                best_snippet_data = None
-                
-                for idx, snippet_data in url_mapping.items():
-                    if quote.lower() in snippet_data['combined_text'].lower():
-                        best_url = snippet_data['url']
-                        best_snippet_data = snippet_data
-                        break
-                
-                # If we can't find the exact snippet, use the first one
-                if not best_url and url_mapping:
-                    first_snippet = list(url_mapping.values())[0]
-                    best_url = first_snippet['url']
-                    best_snippet_data = first_snippet
-                
-                if best_url and evidence_score > 0:
+                if evidence_score > 0:
+                    # Find which snippet of the batch contains this evidence
+                    quote_key = (batch_no, quote.lower())
+                    if quote_key not in quote_locations:
+                        quote_locations[quote_key] = _locate_quote(quote_key[1], *batch_lower[batch_no])
+                    best_idx = quote_locations[quote_key]
+                    
+                    # If we can't find the exact snippet, use the first one of the batch (O(1) index)
+                    if best_idx is None:
+                        best_idx = batches[batch_no][0]
+                    
+                    best_url = urls[best_idx]
                     # SIMPLIFIED: Let AI handle content validation - it's much better at context understanding
                     
                     # FIXED: Create CriteriaEvidence object to match analyze_text_with_ai_batched pattern
@@ -726,7 +1049,7 @@ def analyze_search_snippets(search_results: Dict[str, Dict[str, str]], company:
                         url=best_url,
                         source_type="search_snippet",
                         verified=True,  # AI verified the evidence
-                        full_context=best_snippet_data['combined_text'],  # Store full snippet context
+                        full_context=combined_snippets[best_idx],  # Store full snippet context
                         confidence=confidence,
                         potential_issues=potential_issues,
                         # NEW: Include extracted numeric data from AI
@@ -737,8 +1060,8 @@ def analyze_search_snippets(search_results: Dict[str, Dict[str, str]], company:
                     
                     evidence[criterion] = evidence_obj
                     logger.info(f"Found {criterion} evidence in search snippet from {best_url} (score: {evidence_score})")
-                    logger.info(f"  Title: {best_snippet_data['title']}")
-                    logger.info(f"  Snippet: {best_snippet_data['snippet'][:150]}...")
+                    logger.info(f"  Title: {titles[best_idx]}")
+                    logger.info(f"  Snippet: {snippets[best_idx][:150]}...")
                     
                     # Log extracted numeric data if available
                     if extracted_number is not None:
@@ -753,23 +1076,22 @@ def analyze_search_snippets(search_results: Dict[str, Dict[str, str]], company:
 
 # Get search results for missing criteria
 def get_missing_criteria_seeds(company: str, needed: Set[str], max_per_criterion: int = 3) -> List[str]:
-    all_seeds = []
+    cache_key = ("missing_criteria_seeds", company, tuple(sorted(needed)), max_per_criterion)
+    cached = _pipeline_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Insertion-ordered dict doubles as the seen-set: duplicates dropped as they arrive, first occurrence kept
+    unique_seeds: Dict[str, None] = {}
     
     for criterion in needed:
         if criterion in CRITERIA_QUESTIONS:
-            seeds = get_criterion_seeds(company, criterion, max_per_criterion)
-            all_seeds.extend(seeds)
-    
-    # Remove duplicates
-    seen = set()
-    unique_seeds = []
-    for seed in all_seeds:
-        if seed not in seen:
-            seen.add(seed)
-            unique_seeds.append(seed)
+            for seed in get_criterion_seeds(company, criterion, max_per_criterion):
+                unique_seeds.setdefault(seed)
     
     logger.debug(f"Found {len(unique_seeds)} filtered seeds for missing criteria")
-    return unique_seeds
+    _pipeline_cache_put(cache_key, list(unique_seeds))
+    return list(unique_seeds)
 
 # Enhanced missing criteria search with more targeted approach
 def get_enhanced_missing_criteria_seeds(company: str, missing_criteria: Set[str], max_per_criterion: int = 5) -> List[str]:
@@ -778,54 +1100,72 @@ def get_enhanced_missing_criteria_seeds(company: str, missing_criteria: Set[str]
     Uses exactly 2 queries per criterion and collects ALL links from first page.
     PDFs are automatically excluded. Deduplication happens in main scraper.
     """
+    cache_key = ("enhanced_criteria_seeds", company, tuple(sorted(missing_criteria)), max_per_criterion)
+    cached = _pipeline_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     all_seeds = []
     
-    # For each missing criterion, use enhanced search strategies
-    for criterion in missing_criteria:
-        criterion_seeds = []
-        
-        if criterion in CRITERIA_QUESTIONS:
-            # Use exactly 2 queries per criterion for consistency
-            base_queries = CRITERIA_QUESTIONS[criterion][:2]
+    # Exactly 2 queries per criterion for consistency, in criterion order
+    tasks = [
+        (criterion, query)
+        for criterion in missing_criteria if criterion in CRITERIA_QUESTIONS
+        for query in render_criterion_questions(criterion, company, 2)
+    ]
+    
+    def run_seed_search(task: Tuple[str, str]) -> List[str]:
+        criterion, query = task
+        try:
+            search_phrase = query.replace(f"{company} ", "")
             
-            # Search with limited scope for efficiency
-            for query_template in base_queries:
-                try:
-                    query = query_template.format(company=company)
-                    search_phrase = query.replace(f"{company} ", "")
-                    
-                    # Single page search to limit API calls
-                    search_results = search_google(company, search_phrase, max_pages=1)
-                    
-                    # Get ALL filtered URLs from first page (PDFs already excluded)
-                    filtered_urls = filter_search_results(search_results, company, exclude_pdfs=True)
-                    criterion_seeds.extend(filtered_urls)  # Take ALL links, not limited
-                    
-                except Exception as e:
-                    logger.warning(f"Enhanced search failed for {criterion}: {e}")
-                    continue
+            # Single page search to limit API calls
+            search_results = search_google(company, search_phrase, max_pages=1)
             
-            # Add all found URLs for this criterion (no deduplication here - done in main scraper)
-            if criterion_seeds:
-                all_seeds.extend(criterion_seeds)
+            # Get ALL filtered URLs from first page (PDFs already excluded)
+            return filter_search_results(search_results, company, exclude_pdfs=True)
+        except Exception as e:
+            logger.warning(f"Enhanced search failed for {criterion}: {e}")
+            return []
+    
+    # All criterion x query searches run at once - _rate_limiter paces the requests.
+    # Single-page searches never submit to _SEARCH_EXECUTOR themselves, so this can't deadlock.
+    # map() yields in task order, so seeds keep the sequential ordering (ALL links, not limited)
+    for filtered_urls in _SEARCH_EXECUTOR.map(run_seed_search, tasks):
+        all_seeds.extend(filtered_urls)
     
     # No deduplication here - it's handled in the main scraper with detailed logging
     logger.debug(f"Found {len(all_seeds)} raw seeds for {len(missing_criteria)} criteria (PDFs excluded, duplicates will be handled in main scraper)")
+    _pipeline_cache_put(cache_key, all_seeds)
     return all_seeds
 
-# Smart filtering with company relevance detection using snippets
-def filter_search_results(search_results: Dict[str, Dict[str, str]], company: str, exclude_pdfs: bool = False) -> List[str]:
-    """
-    Enhanced filtering that considers both URLs and snippet content for relevance.
-    ENHANCED: Can exclude PDFs early to avoid wasting web scraping slots.
-    """
-    filtered_urls = []
+# Legal-form suffixes dropped to get a company's short name, checked in order
+COMPANY_NAME_SUFFIXES = (' inc', ' corp', ' corporation', ' company', ' co', ' llc', ' ltd')
+REPORT_EXTRA_SUFFIXES = (' logistics',)  # Report matching also drops these (e.g. "XPO" from "XPO Logistics")
+
+@functools.lru_cache(maxsize=512)
+def strip_company_suffix(company_lower: str, extra_suffixes: Tuple[str, ...] = ()) -> Optional[str]:
+    """Lowercased company name without its first matching suffix, or None if it has none"""
+    for suffix in COMPANY_NAME_SUFFIXES + extra_suffixes:
+        if company_lower.endswith(suffix):
+            return company_lower[:-len(suffix)].strip()
+    return None
+
+@dataclass(frozen=True)
+class CompanyContext:
+    """Lowercased company name forms for relevance filtering, built once per company"""
+    name: str
+    name_lc: str
+    variants_lc: Tuple[str, ...]       # Every distinct name form longer than 2 characters
+    content_variants: Tuple[str, ...]  # Forms longer than 3 characters (content and path matches)
+    domain_variants: Tuple[str, ...]   # Forms longer than 4 characters (domain and URL matches)
+    variants_re: "re.Pattern[str]"          # Any variant, in one scan
+    content_variants_re: "re.Pattern[str]"  # Any content variant, in one scan
+    domain_variants_re: "re.Pattern[str]"   # Any domain variant, in one scan
+
+@functools.lru_cache(maxsize=256)
+def get_company_context(company: str) -> CompanyContext:
     company_clean = company.lower().strip()
-    
-    potential_domains = get_company_domain(company)
-    if isinstance(potential_domains, str):
-        potential_domains = [potential_domains]
-    
     company_variations = [
         company_clean,
         company_clean.replace(' ', ''),
@@ -834,25 +1174,89 @@ def filter_search_results(search_results: Dict[str, Dict[str, str]], company: st
     ]
     
     # Add variations without common suffixes
-    for suffix in [' inc', ' corp', ' corporation', ' company', ' co', ' llc', ' ltd']:
-        if company_clean.endswith(suffix):
-            clean_no_suffix = company_clean[:-len(suffix)].strip()
-            company_variations.append(clean_no_suffix)
-            company_variations.append(clean_no_suffix.replace(' ', ''))
-            break
+    clean_no_suffix = strip_company_suffix(company_clean)
+    if clean_no_suffix is not None:
+        company_variations.append(clean_no_suffix)
+        company_variations.append(clean_no_suffix.replace(' ', ''))
     
     # Remove duplicates and short variations
-    company_variations = list(set([v for v in company_variations if len(v) > 2]))
+    variants = tuple(v for v in dict.fromkeys(company_variations) if len(v) > 2)
+    content_variants = tuple(v for v in variants if len(v) > 3)
+    domain_variants = tuple(v for v in variants if len(v) > 4)
+    return CompanyContext(
+        name=company,
+        name_lc=company_clean,
+        variants_lc=variants,
+        content_variants=content_variants,
+        domain_variants=domain_variants,
+        variants_re=_substring_alternation(list(variants)),
+        content_variants_re=_substring_alternation(list(content_variants)),
+        domain_variants_re=_substring_alternation(list(domain_variants)),
+    )
+
+# filter_search_results patterns, compiled once instead of rebuilt for every URL
+_IRRELEVANT_DOMAIN_RE = _substring_alternation([
+    'reddit.com', 'quora.com', 'stackoverflow.com', 'forums.',
+    'ntassoc.com', 'commercialtruckinsurance.', 'truckinsurance.',
+    'greenmatch.co.uk', 'therealtrucker.com', 'truckerspath.com',
+    'bigrigchrome.com', 'truckstop.com', 'loadboard.com',
+    'facebook.com', 'twitter.com', 'linkedin.com/pulse',
+    'blog.', 'blogger.com', 'wordpress.com', 'medium.com',
+    'indeed.com', 'glassdoor.com', 'ziprecruiter.com',
+    'wikipedia.org', 'investopedia.com', 'definitions.',
+    'dictionary.', 'encyclopedia.'
+])
+_SUSTAIN_URL_TERMS_RE = _substring_alternation(['sustainability', 'esg', 'environmental', 'climate'])
+_FLEET_URL_TERMS_RE = _substring_alternation(['fleet', 'truck', 'vehicle', 'transportation'])
+_CNG_URL_TERMS_RE = _substring_alternation(['cng', 'natural-gas', 'alternative-fuel'])
+_TRUSTED_FILTER_SOURCE_RE = _substring_alternation(['sec.gov', 'reuters.com', 'bloomberg.com', 'businesswire.com'])
+_EXCLUDED_PATH_RE = _substring_alternation([
+    '/dp/', '/product/', '/shop/', '/buy/',
+    '/gp/', '/ASIN/', '/asin/',  # Amazon product pages
+    '/cart/', '/checkout/', '/wishlist/',
+    '/review/', '/customer-reviews/'
+])
+_ASIN_RE = re.compile(r'/[A-Z0-9]{10}(?:/|$)')
+# Trusted sustainability/reporting domains allowed to host PDFs alongside the company's own;
+# also used by the crawler's PDF check
+TRUSTED_PDF_DOMAINS = (
+    'sec.gov', 'edgar.sec.gov',           # SEC filings
+    'cdp.net',                            # CDP reports
+    'globalreporting.org',                # GRI reports
+    'sustainabledevelopment.report'       # UN SDG reports
+)
+
+# Smart filtering with company relevance detection using snippets
+def filter_search_results(search_results: Dict[str, Dict[str, str]], company: str, exclude_pdfs: bool = False) -> List[str]:
+    """
+    Enhanced filtering that considers both URLs and snippet content for relevance.
+    ENHANCED: Can exclude PDFs early to avoid wasting web scraping slots.
+    """
+    filtered_urls = []  # (quality_score, url)
+    ctx = get_company_context(company)
+    
+    potential_domains = get_company_domain(company)
+    if isinstance(potential_domains, str):
+        potential_domains = [potential_domains]
+    
+    # Domains allowed to host PDFs, cleaned once per call rather than per PDF URL
+    allowed_pdf_re = None
+    if not exclude_pdfs:
+        allowed_pdf_re = _substring_alternation([
+            allowed_domain.replace('www.', '').replace('sustainability.', '').replace('about.', '')
+            for allowed_domain in list(potential_domains) + list(TRUSTED_PDF_DOMAINS)
+        ])
     
     for url, result_data in search_results.items():
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            path = parsed.path.lower()
+            # Lowercase once; parsing the lowercased URL yields lowercase domain and path directly
             full_url = url.lower()
+            parsed = _cached_urlparse(full_url)
+            domain = parsed.netloc
+            path = parsed.path
             
             # ENHANCED: Early PDF filtering for web scraping
-            if exclude_pdfs and url.lower().endswith('.pdf'):
+            if exclude_pdfs and full_url.endswith('.pdf'):
                 logger.debug(f"Excluding PDF early: {url}")
                 continue
             
@@ -864,79 +1268,50 @@ def filter_search_results(search_results: Dict[str, Dict[str, str]], company: st
             company_relevance_score = 0
             
             # Check for company domain matches
-            domain_matches = [d for d in potential_domains if d in domain]
-            if domain_matches:
+            if any(d in domain for d in potential_domains):
                 company_relevance_score += 120
             
             # Check for company name in domain
-            strong_domain_matches = [var for var in company_variations if len(var) > 4 and var in domain]
-            if strong_domain_matches:
+            if ctx.domain_variants_re.search(domain):
                 company_relevance_score += 100
             
             # Enhanced content-based scoring using snippets and titles
-            content_company_mentions = sum(1 for var in company_variations if len(var) > 3 and var in combined_content)
+            # Counts distinct variants present; one regex scan skips the count when none is
+            content_company_mentions = 0
+            if ctx.content_variants_re.search(combined_content):
+                content_company_mentions = sum(1 for var in ctx.content_variants if var in combined_content)
             if content_company_mentions > 0:
                 company_relevance_score += content_company_mentions * 30
             
             # Check for company name in path
-            path_matches = [var for var in company_variations if len(var) > 3 and var in path]
-            if path_matches:
+            if ctx.content_variants_re.search(path):
                 company_relevance_score += 70
             
             # Check for company name anywhere in URL
-            url_matches = [var for var in company_variations if len(var) > 4 and var in full_url]
-            if url_matches:
+            if ctx.domain_variants_re.search(full_url):
                 company_relevance_score += 50
             
             # EXCLUDE obviously irrelevant domains early
-            irrelevant_domains = [
-                'reddit.com', 'quora.com', 'stackoverflow.com', 'forums.',
-                'ntassoc.com', 'commercialtruckinsurance.', 'truckinsurance.',
-                'greenmatch.co.uk', 'therealtrucker.com', 'truckerspath.com',
-                'bigrigchrome.com', 'truckstop.com', 'loadboard.com',
-                'facebook.com', 'twitter.com', 'linkedin.com/pulse',
-                'blog.', 'blogger.com', 'wordpress.com', 'medium.com',
-                'indeed.com', 'glassdoor.com', 'ziprecruiter.com',
-                'wikipedia.org', 'investopedia.com', 'definitions.',
-                'dictionary.', 'encyclopedia.'
-            ]
-            
-            if any(irrelevant in domain for irrelevant in irrelevant_domains):
+            if _IRRELEVANT_DOMAIN_RE.search(domain):
                 continue
             
             # ORIGINAL PDF filtering (only applies when exclude_pdfs=False)
-            if not exclude_pdfs and url.lower().endswith('.pdf'):
-                # Get company domains
-                company_domains = get_company_domain(company)
-                if isinstance(company_domains, str):
-                    company_domains = [company_domains]
-                
-                # Trusted sustainability domains
-                trusted_pdf_domains = ['sec.gov', 'cdp.net', 'globalreporting.org']
-                
-                # Check if PDF is from allowed domain
-                is_allowed_pdf = False
-                for allowed_domain in company_domains + trusted_pdf_domains:
-                    clean_domain = allowed_domain.replace('www.', '').replace('sustainability.', '').replace('about.', '')
-                    if clean_domain in domain:
-                        is_allowed_pdf = True
-                        break
-                
-                if not is_allowed_pdf:
+            if not exclude_pdfs and full_url.endswith('.pdf'):
+                # Check if PDF is from an allowed company or trusted domain
+                if not allowed_pdf_re.search(domain):
                     continue  # Skip PDFs from unrelated domains
             
             # Boost for relevant content types
-            if any(term in full_url for term in ['sustainability', 'esg', 'environmental', 'climate']):
+            if _SUSTAIN_URL_TERMS_RE.search(full_url):
                 company_relevance_score += 15
-            if any(term in full_url for term in ['fleet', 'truck', 'vehicle', 'transportation']):
+            if _FLEET_URL_TERMS_RE.search(full_url):
                 company_relevance_score += 15
-            if any(term in full_url for term in ['cng', 'natural-gas', 'alternative-fuel']):
+            if _CNG_URL_TERMS_RE.search(full_url):
                 company_relevance_score += 20
             
             # Boost for trusted sources
-            trusted_sources = ['sec.gov', 'reuters.com', 'bloomberg.com', 'businesswire.com']
-            if any(trusted in domain for trusted in trusted_sources):
-                if any(var in combined_content for var in company_variations if len(var) > 2):
+            if _TRUSTED_FILTER_SOURCE_RE.search(domain):
+                if ctx.variants_re.search(combined_content):
                     company_relevance_score += 60
             
             # RAISE the minimum threshold to be more selective
@@ -944,41 +1319,39 @@ def filter_search_results(search_results: Dict[str, Dict[str, str]], company: st
                 continue
             
             # Exclude obvious non-corporate content (expanded list)
-            excluded_patterns = [
-                '/dp/', '/product/', '/shop/', '/buy/',
-                '/gp/', '/ASIN/', '/asin/',  # Amazon product pages
-                '/cart/', '/checkout/', '/wishlist/',
-                '/review/', '/customer-reviews/'
-            ]
-            if any(pattern in full_url for pattern in excluded_patterns):
+            if _EXCLUDED_PATH_RE.search(full_url):
                 continue
             
             # Check for ASIN pattern (10 alphanumeric characters)
-            asin_pattern = r'/[A-Z0-9]{10}(?:/|$)'
-            if re.search(asin_pattern, path.upper()):
+            if _ASIN_RE.search(path.upper()):
                 continue
             
             # Boost for PDFs and high-value content (only when not excluding PDFs)
             quality_score = company_relevance_score
-            if not exclude_pdfs and url.lower().endswith('.pdf'):
+            if not exclude_pdfs and full_url.endswith('.pdf'):
                 quality_score += 20
             
             # Apply quality threshold
             if quality_score >= 25:
-                filtered_urls.append(url)
+                filtered_urls.append((quality_score, url))
                 
         except Exception as e:
             logger.warning(f"Error filtering URL {url}: {e}")
             continue
     
-    # Sort by estimated quality (longer URLs often have more specific content)
-    filtered_urls.sort(key=lambda x: len(x), reverse=True)
+    # Sort by the computed quality score; URL length (longer URLs are often more specific) breaks ties
+    filtered_urls.sort(key=lambda x: (x[0], len(x[1])), reverse=True)
     
-    return filtered_urls
+    return [url for _, url in filtered_urls]
 
 # Enhanced sustainability report search with scoring
 def get_sustainability_reports(company: str, max_results: int = 10) -> List[str]:
-    all_candidates = []  # Store (score, url, reason) tuples
+    cache_key = ("sustainability_reports", company, max_results)
+    cached = _pipeline_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    best: Dict[str, Tuple[int, str]] = {}  # canonical_url -> (score, reason), first accepted wins
     
     # ENHANCED: Get company domains including CDN subdomains
     company_domains = get_company_domain(company)
@@ -1031,79 +1404,71 @@ def get_sustainability_reports(company: str, max_results: int = 10) -> List[str]
             f'site:{main_domain}/corporate-responsibility filetype:pdf'
         ])
     
-    # Search priority company domain queries first
-    for i, query in enumerate(priority_queries[:8]):  # Limit to avoid rate limits
-        try:
-            # Add delay between requests to avoid rate limiting
-            if i > 0:
-                time.sleep(RATE_LIMIT_DELAY)  # Configurable delay between requests
-            
-            logger.info(f"Priority search: {query}")
-            results = _perform_search(query, 2024, 1)
-            
-            if not results:
+    # PRIORITY 2: Recent years with company name
+    year_queries = [
+        (f'"{company}" {report_type} {year} filetype:pdf', year)
+        for year in [2024, 2023, 2022]
+        for report_type in ["sustainability report", "ESG report", "annual report sustainability", "environmental report"]
+    ]
+    
+    # Each wave fires at once - _rate_limiter paces the requests instead of a fixed sleep
+    priority_batch = [(query, 2024) for query in priority_queries[:8]]  # Limit to avoid rate limits
+    for query, _ in priority_batch:
+        logger.info(f"Priority search: {query}")
+    priority_results = multi_search(priority_batch)
+    
+    # Score priority company domain results first
+    for results in priority_results:
+        for url, data in list(results.items())[:3]:  # Top 3 per query
+            canonical_url = canonicalize(url)
+            if canonical_url in best:  # Already accepted from an earlier query - skip rescoring
                 continue
+            try:
+                score, reason = score_sustainability_report_relevance(url, data.get('title', ''), data.get('snippet', ''), company)
                 
-            for url, data in list(results.items())[:3]:  # Top 3 per query
-                try:
-                    score, reason = score_sustainability_report_relevance(url, data.get('title', ''), data.get('snippet', ''), company)
-                    
-                    # MASSIVE BONUS for company's own domain
-                    if is_official_domain(url, main_domains):
-                        score += OFFICIAL_DOMAIN_BOOST  # Huge boost for official domain
-                        reason = f"OFFICIAL DOMAIN: {reason}"
-                    
-                    if score > MIN_SCORE_PRIORITY_DOMAIN:  # Lower threshold for company domain
-                        all_candidates.append((score, url, reason))
-                        logger.info(f"Priority candidate: {url} (score: {score})")
-                except Exception as e:
-                    logger.warning(f"Error scoring URL {url}: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Priority search failed for '{query}': {e}")
+                # MASSIVE BONUS for company's own domain
+                if is_official_domain(url, main_domains):
+                    score += OFFICIAL_DOMAIN_BOOST  # Huge boost for official domain
+                    reason = f"OFFICIAL DOMAIN: {reason}"
+                
+                if score > MIN_SCORE_PRIORITY_DOMAIN:  # Lower threshold for company domain
+                    best[canonical_url] = (score, reason)
+                    logger.info(f"Priority candidate: {url} (score: {score})")
+            except Exception as e:
+                logger.warning(f"Error scoring URL {url}: {e}")
+                continue
     
-    # PRIORITY 2: Recent years with company name
-    for year in [2024, 2023, 2022]:
-        for report_type in ["sustainability report", "ESG report", "annual report sustainability", "environmental report"]:
-            query = f'"{company}" {report_type} {year} filetype:pdf'
-            logger.info(f"Trying recent year search: {query}")
+    # Stop if enough matches: official-domain hits this strong outrank anything the year searches add
+    confident = sum(1 for score, _ in best.values() if score >= CONFIDENT_REPORT_SCORE)
+    if confident >= max_results:
+        logger.info(f"{confident} confident priority candidates for {company} - skipping {len(year_queries)} year searches")
+        year_queries = []
+    for query, _ in year_queries:
+        logger.info(f"Trying recent year search: {query}")
+    year_results = multi_search(year_queries)
+    
+    for (query, year), results in zip(year_queries, year_results):
+        for url, data in list(results.items())[:3]:
+            canonical_url = canonicalize(url)
+            if canonical_url in best:
+                continue
             try:
-                # Add delay between requests
-                time.sleep(RATE_LIMIT_DELAY)
+                score, reason = score_sustainability_report_relevance(url, data.get('title', ''), data.get('snippet', ''), company)
                 
-                results = _perform_search(query, year, 1)
-                if not results:
-                    continue
-                    
-                for url, data in list(results.items())[:3]:
-                    try:
-                        score, reason = score_sustainability_report_relevance(url, data.get('title', ''), data.get('snippet', ''), company)
-                        
-                        # BONUS for company's own domain
-                        if is_official_domain(url, main_domains):
-                            score += CDN_DOMAIN_BOOST
-                            reason = f"OFFICIAL DOMAIN: {reason}"
-                        
-                        if score > MIN_SCORE_YEAR_SEARCH:
-                            all_candidates.append((score, url, reason))
-                            logger.info(f"Found {year} candidate: {url} (score: {score})")
-                    except Exception as e:
-                        logger.warning(f"Error scoring URL {url}: {e}")
-                        continue
+                # BONUS for company's own domain
+                if is_official_domain(url, main_domains):
+                    score += CDN_DOMAIN_BOOST
+                    reason = f"OFFICIAL DOMAIN: {reason}"
+                
+                if score > MIN_SCORE_YEAR_SEARCH:
+                    best[canonical_url] = (score, reason)
+                    logger.info(f"Found {year} candidate: {url} (score: {score})")
             except Exception as e:
-                logger.warning(f"Year search failed for {query}: {e}")
+                logger.warning(f"Error scoring URL {url}: {e}")
+                continue
                 
-    # Remove duplicates and sort by score
-    seen_urls = set()
-    unique_candidates = []
-    for score, url, reason in all_candidates:
-        canonical_url = canonicalize(url)
-        if canonical_url not in seen_urls:
-            seen_urls.add(canonical_url)
-            # Store canonical URL for consistency
-            unique_candidates.append((score, canonical_url, reason))
-    
-    # Sort by score (highest first) 
+    # Candidates are already unique by canonical URL; sort by score (highest first)
+    unique_candidates = [(score, url, reason) for url, (score, reason) in best.items()]
     unique_candidates.sort(key=lambda x: x[0], reverse=True)
     
     logger.info(f"Sustainability report candidates for {company}:")
@@ -1112,18 +1477,37 @@ def get_sustainability_reports(company: str, max_results: int = 10) -> List[str]
         logger.info(f"  Score {score}: {url} - {reason}")
     
     # Return top URLs
-    return [url for score, url, reason in unique_candidates[:max_results]]
+    top_urls = [url for score, url, reason in unique_candidates[:max_results]]
+    _pipeline_cache_put(cache_key, top_urls)
+    return top_urls
 
-def score_sustainability_report_relevance(url: str, title: str, snippet: str, company: str, analyze_content: bool = True) -> Tuple[int, str]:
-    """Score how likely a PDF is to be the actual company's sustainability report."""
-    score = 0
-    reasons = []
-    company_lower = company.lower()
-    url_lower = url.lower()
-    title_lower = title.lower()
-    snippet_lower = snippet.lower()
-    
-    # ENHANCED: Generate company name variations for better matching
+# score_sustainability_report_relevance patterns, built once at import
+_IMMEDIATE_REJECTIONS = (
+    # Academic/University content
+    '.edu/', 'university', 'college', 'academic', 'research.pdf', 'thesis.pdf',
+    # Service guides and operational manuals  
+    'service-guide', 'user-guide', 'manual.pdf', 'instructions.pdf', 'handbook.pdf',
+    # E-commerce and marketing materials  
+    'ecommerce-ebook', 'marketing-guide', 'sales-guide', 'product-catalog',
+    # Regional service materials
+    'service-guide-en-', 'guide-en-', '-service-guide', 'regional-guide',
+    # Third-party presentations and reports about the company (not by the company)
+    'analyst-report', 'third-party-analysis', 'industry-report',
+    # Financial presentations (unless annual reports)
+    'earnings-presentation', 'investor-presentation', 'quarterly-presentation'
+)
+_IMMEDIATE_REJECT_RE = _substring_alternation(list(_IMMEDIATE_REJECTIONS))
+_SUSTAINABILITY_TITLE_RE = _substring_alternation(['sustainability', 'esg', 'environmental', 'climate', 'annual report', 'cdp', 'tcfd'])
+# Checked in order - the first indicator present decides the boost
+_HIGH_PRIORITY_INDICATORS = (
+    'esg report', 'esg_report', 'sustainability report', 'sustainability_report',
+    'cdp', 'tcfd', 'gri report', 'annual report', 'corporate responsibility'
+)
+_HIGH_PRIORITY_RE = _substring_alternation(list(_HIGH_PRIORITY_INDICATORS))
+
+@functools.lru_cache(maxsize=256)
+def _report_company_variations(company_lower: str) -> Tuple[str, ...]:
+    """Name forms matched against report titles, snippets and URLs"""
     company_variations = [
         company_lower,
         company_lower.replace(' ', ''),
@@ -1131,38 +1515,59 @@ def score_sustainability_report_relevance(url: str, title: str, snippet: str, co
     ]
     
     # Add variations without common suffixes (like "Logistics" from "XPO Logistics")
-    for suffix in [' inc', ' corp', ' corporation', ' company', ' co', ' llc', ' ltd', ' logistics']:
-        if company_lower.endswith(suffix):
-            clean_no_suffix = company_lower[:-len(suffix)].strip()
-            if len(clean_no_suffix) > 2:
-                company_variations.append(clean_no_suffix)
-                company_variations.append(clean_no_suffix.replace(' ', ''))
-            break
+    clean_no_suffix = strip_company_suffix(company_lower, REPORT_EXTRA_SUFFIXES)
+    if clean_no_suffix is not None and len(clean_no_suffix) > 2:
+        company_variations.append(clean_no_suffix)
+        company_variations.append(clean_no_suffix.replace(' ', ''))
     
     # Add first word for cases like "XPO" from "XPO Logistics"
     first_word = company_lower.split()[0] if ' ' in company_lower else company_lower
     if len(first_word) > 2:
         company_variations.append(first_word)
     
-    # IMMEDIATE REJECTION: Obviously irrelevant content
-    immediate_rejections = [
-        # Academic/University content
-        '.edu/', 'university', 'college', 'academic', 'research.pdf', 'thesis.pdf',
-        # Service guides and operational manuals  
-        'service-guide', 'user-guide', 'manual.pdf', 'instructions.pdf', 'handbook.pdf',
-        # E-commerce and marketing materials  
-        'ecommerce-ebook', 'marketing-guide', 'sales-guide', 'product-catalog',
-        # Regional service materials
-        'service-guide-en-', 'guide-en-', '-service-guide', 'regional-guide',
-        # Third-party presentations and reports about the company (not by the company)
-        'analyst-report', 'third-party-analysis', 'industry-report',
-        # Financial presentations (unless annual reports)
-        'earnings-presentation', 'investor-presentation', 'quarterly-presentation'
-    ]
+    return tuple(dict.fromkeys(company_variations))
+
+@functools.lru_cache(maxsize=256)
+def _report_snippet_mention_re(company_variations: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Any name form longer than 2 characters as a whole word, compiled once per company"""
+    forms = [re.escape(v) for v in company_variations if len(v) > 2]
+    if not forms:
+        return re.compile(r'(?!)')
+    return re.compile(r'\b(?:' + '|'.join(forms) + r')\b', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=256)
+def _report_title_mention_re(company_variations: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Any name form longer than 2 characters, anywhere in a title"""
+    return _substring_alternation([v for v in company_variations if len(v) > 2])
+
+@functools.lru_cache(maxsize=256)
+def _report_strong_indicators(company_variations: Tuple[str, ...]) -> "re.Pattern[str]":
+    """'<company> <report type>' phrases that mark an externally hosted report as the company's own"""
+    return _substring_alternation([
+        f"{variation} {report_type}"
+        for variation in company_variations if len(variation) > 3
+        for report_type in ("sustainability", "annual report", "esg report", "environmental report", "cdp", "tcfd")
+    ])
+
+def score_sustainability_report_relevance(url: str, title: str, snippet: str, company: str, analyze_content: bool = True) -> Tuple[int, str]:
+    """Score how likely a PDF is to be the actual company's sustainability report."""
+    score = 0
+    reasons = []
+    url_lower = url.lower()
+    title_lower = title.lower()
+    snippet_lower = snippet.lower()
+    
+    # ENHANCED: Company name variations for better matching (built once per company)
+    company_variations = _report_company_variations(company.lower())
+    # NUL never occurs in the patterns, so one scan covers URL and title without cross-matches
+    url_and_title = f"{url_lower}\x00{title_lower}"
     
-    for rejection_pattern in immediate_rejections:
-        if rejection_pattern in url_lower or rejection_pattern in title_lower:
-            return 0, f"rejected - {rejection_pattern} content"
+    # IMMEDIATE REJECTION: Obviously irrelevant content
+    # One regex scan gates the ordered loop, which only runs to name the first listed pattern
+    if _IMMEDIATE_REJECT_RE.search(url_and_title):
+        for rejection_pattern in _IMMEDIATE_REJECTIONS:
+            if rejection_pattern in url_and_title:
+                return 0, f"rejected - {rejection_pattern} content"
     
     # ENHANCED: Check for company domain OR CDN hosting with company path
     company_domains = get_company_domain(company)
@@ -1192,16 +1597,11 @@ def score_sustainability_report_relevance(url: str, title: str, snippet: str, co
                 break
     
     # ENHANCED: Company name matching in title with variations
-    company_in_title = False
-    for variation in company_variations:
-        if len(variation) > 2 and variation in title_lower:
-            company_in_title = True
-            break
+    company_in_title = _report_title_mention_re(company_variations).search(title_lower) is not None
     
     if company_in_title:
         # Check if it's actually sustainability content
-        sustainability_indicators = ['sustainability', 'esg', 'environmental', 'climate', 'annual report', 'cdp', 'tcfd']
-        if any(indicator in title_lower for indicator in sustainability_indicators):
+        if _SUSTAINABILITY_TITLE_RE.search(title_lower):
             score += 80
             reasons.append("company name in sustainability title")
         else:
@@ -1219,13 +1619,8 @@ def score_sustainability_report_relevance(url: str, title: str, snippet: str, co
             reasons.append("external hosting without company name in title")
     
     # BOOST: High-priority sustainability content types
-    high_priority_indicators = [
-        'esg report', 'esg_report', 'sustainability report', 'sustainability_report',
-        'cdp', 'tcfd', 'gri report', 'annual report', 'corporate responsibility'
-    ]
-    
-    for indicator in high_priority_indicators:
-        if indicator in title_lower or indicator in url_lower:
+    for indicator in (_HIGH_PRIORITY_INDICATORS if _HIGH_PRIORITY_RE.search(url_and_title) else ()):
+        if indicator in url_and_title:
             if indicator in ['esg', 'esg report', 'esg_report']:
                 score += ESG_INDICATOR_BOOST  # ESG reports are highest priority
                 reasons.append("ESG report - highest priority")
@@ -1242,14 +1637,8 @@ def score_sustainability_report_relevance(url: str, title: str, snippet: str, co
     
     # ENHANCED: Validate the content is actually about the company using snippet with variations
     if snippet_lower:
-        company_mentioned_in_snippet = False
-        for variation in company_variations:
-            if len(variation) > 2:
-                # Use word boundaries for better matching
-                pattern = r'\b' + re.escape(variation) + r'\b'
-                if re.search(pattern, snippet_lower, re.IGNORECASE):
-                    company_mentioned_in_snippet = True
-                    break
+        # Use word boundaries for better matching - one precompiled scan over every variation
+        company_mentioned_in_snippet = _report_snippet_mention_re(company_variations).search(snippet_lower) is not None
         
         if company_mentioned_in_snippet:
             score += COMPANY_MENTION_BOOST
@@ -1273,19 +1662,7 @@ def score_sustainability_report_relevance(url: str, title: str, snippet: str, co
     # RELAXED: Additional validation for external hosting
     if not actual_company_domain:
         # Check if the title/URL contains strong company indicators
-        strong_company_indicators = []
-        for variation in company_variations:
-            if len(variation) > 3:
-                strong_company_indicators.extend([
-                    f"{variation} sustainability",
-                    f"{variation} annual report", 
-                    f"{variation} esg report",
-                    f"{variation} environmental report",
-                    f"{variation} cdp",
-                    f"{variation} tcfd"
-                ])
-        
-        has_strong_indicator = any(indicator in title_lower for indicator in strong_company_indicators)
+        has_strong_indicator = _report_strong_indicators(company_variations).search(title_lower) is not None
         if not has_strong_indicator:
             score -= 20  # Reduced penalty from -30 to -20
             reasons.append("external hosting without strong company indicator")
@@ -1293,67 +1670,117 @@ def score_sustainability_report_relevance(url: str, title: str, snippet: str, co
     reason_text = "; ".join(reasons) if reasons else "no specific indicators"
     return max(0, score), reason_text
 
-def _is_reliable_source(url: str, data: Dict[str, str]) -> bool:
-    """Filter out unreliable sources like Reddit, forums, old articles, and anecdotal content"""
+# Source reliability indicators for _classify_source
+_UNRELIABLE_DOMAIN_RE = _substring_alternation([
+    'reddit.com', 'facebook.com', 'twitter.com', 'linkedin.com/pulse',
+    'quora.com', 'stackoverflow.com', 'forums.', 'discussion.',
+    'medium.com/@', 'blog.', 'blogger.com', 'wordpress.com',
+    'youtube.com', 'tiktok.com', 'instagram.com'
+])
+_VERY_OLD_YEARS = ('2021', '2020', '2019', '2018')
+_VERY_OLD_YEAR_RE = _substring_alternation(list(_VERY_OLD_YEARS))
+_MARKETING_TERMS = (
+    'learn more about', 'discover our', 'explore our', 'join our network',
+    'sign up', 'book now', 'get started', 'find out more'
+)
+_COMPANY_DATA_TERMS = ('report', 'data', 'emissions', 'fleet', 'vehicles', 'partnership')
+# Matched against the hostname on label boundaries, so 'ft.com' no longer accepts microsoft.com
+_TRUSTED_SOURCE_DOMAINS = (
+    'gov', 'sec.gov', 'epa.gov', 'carb.ca.gov',  # Government
+    'bloomberg.com', 'reuters.com', 'wsj.com', 'ft.com',  # Financial news
+    'businesswire.com', 'prnewswire.com',  # Press releases
+    'fleetowner.com', 'ttnews.com', 'freightwaves.com'  # Industry trade
+)
+_SUBSTANTIVE_TERMS = (
+    'operates', 'deployed', 'purchased', 'announced', 'reported', 'disclosed',
+    'compliance', 'regulation', 'emissions', 'fleet', 'vehicles', 'partnership',
+    'agreement', 'contract', 'investment', 'million', 'billion'
+)
+
+# Category bits accumulated by the single tagged scan in _classify_source
+_OLD_YEAR = 1
+_MARKETING = 2
+_COMPANY_DATA = 4
+_SUBSTANCE = 8
+
+def _tagged_scanner(categories: Dict[int, Tuple[str, ...]]) -> Tuple["re.Pattern[str]", Dict[str, int]]:
+    """
+    One pattern for every category's terms plus each term's category bits.
+    The lookahead tests every position and the longest term wins at each, so a
+    term also carries the bits of any shorter term it starts with ('reported'
+    holds 'report'); no occurrence is hidden by an overlapping match.
+    """
+    bits: Dict[str, int] = {}
+    for bit, terms in categories.items():
+        for term in terms:
+            bits[term] = bits.get(term, 0) | bit
+    ordered = sorted(bits, key=len, reverse=True)
+    for term in ordered:
+        for other in ordered:
+            if term.startswith(other):
+                bits[term] |= bits[other]
+    return re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))'), bits
+
+_SOURCE_TERM_RE, _SOURCE_TERM_BITS = _tagged_scanner({
+    _OLD_YEAR: _VERY_OLD_YEARS,
+    _MARKETING: _MARKETING_TERMS,
+    _COMPANY_DATA: _COMPANY_DATA_TERMS,
+    _SUBSTANCE: _SUBSTANTIVE_TERMS,
+})
+
+# The same results recur across queries, years and pages of a company scrape
+RELIABILITY_CACHE_SIZE = 8192
+
+@functools.lru_cache(maxsize=RELIABILITY_CACHE_SIZE)
+def _classify_source(url: str, title: str, snippet: str) -> Tuple[bool, bool, str]:
+    """Pure reliability verdict: (accepted, flagged as old, rejection reason)"""
+    # Keyed on the raw strings, so a repeated result skips the lowercasing too
     url_lower = url.lower()
-    title_lower = data.get('title', '').lower()
-    snippet_lower = data.get('snippet', '').lower()
+    title_lower = title.lower()
+    snippet_lower = snippet.lower()
     
     # REJECT: Social media and forums (anecdotal)
-    unreliable_domains = [
-        'reddit.com', 'facebook.com', 'twitter.com', 'linkedin.com/pulse',
-        'quora.com', 'stackoverflow.com', 'forums.', 'discussion.',
-        'medium.com/@', 'blog.', 'blogger.com', 'wordpress.com',
-        'youtube.com', 'tiktok.com', 'instagram.com'
-    ]
+    if _UNRELIABLE_DOMAIN_RE.search(url_lower):
+        return False, False, "unreliable domain"
     
-    if any(domain in url_lower for domain in unreliable_domains):
-        logger.debug(f"Rejected unreliable domain: {url}")
-        return False
+    # PRIORITIZE: Official sources - accepted outright, so only the year flag needs a scan
+    try:
+        host = _cached_urlparse(url_lower).hostname or ''
+    except ValueError:
+        host = ''
+    if host_in_domains(host, _TRUSTED_SOURCE_DOMAINS):
+        return True, _VERY_OLD_YEAR_RE.search(f"{title_lower}\x00{snippet_lower}") is not None, ""
+    
+    # Title and snippet walked once for every indicator category; the NUL separator
+    # can't be part of a term, and title matches only count towards the year flag
+    flags = 0
+    title_end = len(title_lower)
+    for m in _SOURCE_TERM_RE.finditer(f"{title_lower}\x00{snippet_lower}"):
+        bits = _SOURCE_TERM_BITS[m.group(1)]
+        flags |= bits if m.start() > title_end else bits & _OLD_YEAR
     
     # FLAG: Very old sources (2021 and earlier) but don't reject - let user decide
-    very_old_year_patterns = ['2021', '2020', '2019', '2018']
-    if any(year in title_lower or year in snippet_lower for year in very_old_year_patterns):
-        # Log for transparency but don't reject
-        logger.info(f"Old source flagged (user can evaluate): {url}")
-        # Continue processing - don't return False
+    flagged_old = bool(flags & _OLD_YEAR)
     
     # REJECT: Generic marketing content without substance
-    marketing_indicators = [
-        'learn more about', 'discover our', 'explore our', 'join our network',
-        'sign up', 'book now', 'get started', 'find out more'
-    ]
-    
-    if any(indicator in snippet_lower for indicator in marketing_indicators):
+    if flags & _MARKETING:
         # Unless it's from official company domain with specific data
-        company_data_indicators = ['report', 'data', 'emissions', 'fleet', 'vehicles', 'partnership']
-        if not any(indicator in snippet_lower for indicator in company_data_indicators):
-            logger.debug(f"Rejected marketing content: {url}")
-            return False
-    
-    # PRIORITIZE: Official sources
-    trusted_domains = [
-        '.gov', 'sec.gov', 'epa.gov', 'carb.ca.gov',  # Government
-        'bloomberg.com', 'reuters.com', 'wsj.com', 'ft.com',  # Financial news
-        'businesswire.com', 'prnewswire.com',  # Press releases
-        'fleetowner.com', 'ttnews.com', 'freightwaves.com'  # Industry trade
-    ]
-    
-    is_trusted = any(domain in url_lower for domain in trusted_domains)
+        if not flags & _COMPANY_DATA:
+            return False, flagged_old, "marketing content"
     
     # REQUIRE: Substantive content indicators
-    substantive_indicators = [
-        'operates', 'deployed', 'purchased', 'announced', 'reported', 'disclosed',
-        'compliance', 'regulation', 'emissions', 'fleet', 'vehicles', 'partnership',
-        'agreement', 'contract', 'investment', 'million', 'billion'
-    ]
-    
-    has_substance = any(indicator in snippet_lower for indicator in substantive_indicators)
-    
-    # Accept if trusted domain OR has substantive content
-    if is_trusted or has_substance:
-        return True
+    if flags & _SUBSTANCE:
+        return True, flagged_old, ""
+    return False, flagged_old, "low-quality source"
+
+def _is_reliable_source(url: str, data: Dict[str, str]) -> bool:
+    """Filter out unreliable sources like Reddit, forums, old articles, and anecdotal content"""
+    accepted, flagged_old, reason = _classify_source(url, data.get('title', ''), data.get('snippet', ''))
     
-    logger.debug(f"Rejected low-quality source: {url}")
-    return False
+    if flagged_old:
+        # Log for transparency but don't reject
+        logger.info(f"Old source flagged (user can evaluate): {url}")
+    if not accepted:
+        logger.debug(f"Rejected {reason}: {url}")
+    return accepted
 
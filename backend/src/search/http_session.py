@@ -0,0 +1,107 @@
+"""Shared HTTP session for search and scraping requests."""
+
+import atexit
+import json
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Optional HTTP/2 client for API hosts (needs httpx with the h2 extra); requests is used when missing
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Optional fast JSON decoder for API responses; stdlib json is used when missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Google APIs only gzip a response when the request accepts gzip AND the User-Agent contains "gzip"
+API_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "emissions-report-dashboard (gzip)",
+}
+
+# Connection pool sizing - hosts kept warm, and connections per host for concurrent fetches
+POOL_CONNECTIONS = 50
+POOL_MAXSIZE = 100
+
+# Transparent retries for connection failures only; callers handle read/HTTP errors themselves
+CONNECT_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+
+
+def _build_session() -> requests.Session:
+    """Create a session with pooled keep-alive connections for http and https."""
+    session = requests.Session()
+    retries = Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, backoff_factor=RETRY_BACKOFF_FACTOR)
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Module-level session so every search, PDF download and page fetch reuses the same
+# TCP/TLS connections instead of paying a new handshake per request
+_HTTP_SESSION = _build_session()
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared HTTP session."""
+    return _HTTP_SESSION
+
+
+def _build_api_client():
+    """HTTP/2 client: concurrent requests to one API host share a single multiplexed connection."""
+    if not HTTPX_AVAILABLE:
+        return None
+    try:
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=CONNECT_RETRIES,
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=32)
+        )
+        return httpx.Client(transport=transport, timeout=10)
+    except ImportError:
+        logger.debug("h2 not installed - using requests for API calls")
+        return None
+
+
+_API_CLIENT = _build_api_client()
+
+# Exceptions raised for transport/HTTP failures by whichever client get_api_client returns
+HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError) if _API_CLIENT is not None else (requests.exceptions.RequestException,)
+
+
+def get_api_client():
+    """
+    Return the client for JSON API calls (Google CSE): the HTTP/2 httpx client when
+    available, otherwise the shared requests session. Both support .get(url, params=, timeout=)
+    and return responses with raise_for_status() and json().
+    """
+    return _API_CLIENT if _API_CLIENT is not None else _HTTP_SESSION
+
+
+def _close_clients() -> None:
+    """Close pooled connections cleanly at interpreter exit."""
+    _HTTP_SESSION.close()
+    if _API_CLIENT is not None:
+        _API_CLIENT.close()
+
+
+atexit.register(_close_clients)
+
+
+def parse_json(resp):
+    """Decode a JSON response body from either client, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(resp.content)
+    return json.loads(resp.content)
@@ -0,0 +1,31 @@
+"""Thread-safe rate limiting shared by the search and AI analysis clients."""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket that refills continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: int, capacity: Optional[int] = None):
+        # capacity bounds the burst size; defaults to a full minute's worth of tokens
+        self.capacity = capacity or per_minute
+        self.tokens = float(self.capacity)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, amount: int = 1) -> None:
+        """Block until `amount` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(wait)
@@ -58,6 +58,15 @@ API_CONFIG = {
 DEBUG = is_development()
 SQL_ECHO = os.getenv("SQL_DEBUG", "false").lower() == "true" if not is_development() else True
 
+# Database connection pool - connections are reused across requests instead of reconnecting
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a pooled connection is replaced
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "4"))  # Connections opened at startup
+
+# Seconds a cached list response (dashboard companies, saved reports) is served before re-querying
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
 # Export commonly used values
 __all__ = [
     "FRONTEND_URL",
@@ -68,4 +77,9 @@ __all__ = [
     "API_CONFIG",
     "DEBUG",
     "SQL_ECHO",
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "DB_POOL_RECYCLE",
+    "DB_POOL_WARM",
+    "RESPONSE_CACHE_TTL",
 ] 
\ No newline at end of file
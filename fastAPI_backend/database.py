@@ -1,10 +1,23 @@
+from contextlib import AsyncExitStack
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from dotenv import load_dotenv
-from config import SQL_ECHO
+from config import SQL_ECHO, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_WARM
+import asyncio
+import logging
 import os
 
+# SQLAlchemy 2.x session factory; the legacy sessionmaker(class_=AsyncSession) is used on 1.4
+try:
+  from sqlalchemy.ext.asyncio import async_sessionmaker
+  ASYNC_SESSIONMAKER_AVAILABLE = True
+except ImportError:
+  ASYNC_SESSIONMAKER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
 
 DB_PASSWORD = os.getenv("AZURE_DB_PASS")
@@ -18,15 +31,41 @@ if not DB_PASSWORD:
 
 DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_TABLE}"
 
-# Use configurable SQL echo setting
-engine = create_async_engine(DATABASE_URL, echo=SQL_ECHO)
-
-AsyncSessionLocal = sessionmaker(
-  engine, class_=AsyncSession, expire_on_commit=False
+# Use configurable SQL echo setting; pooled connections are health-checked on checkout
+# and recycled before Azure's idle timeout drops them
+engine = create_async_engine(
+  DATABASE_URL,
+  echo=SQL_ECHO,
+  pool_size=DB_POOL_SIZE,
+  max_overflow=DB_MAX_OVERFLOW,
+  pool_pre_ping=True,
+  pool_recycle=DB_POOL_RECYCLE,
 )
 
+if ASYNC_SESSIONMAKER_AVAILABLE:
+  AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+else:
+  AsyncSessionLocal = sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+  )
+
 Base = declarative_base()
 
 async def get_db():
   async with AsyncSessionLocal() as session:
-    yield session
\ No newline at end of file
+    yield session
+
+async def warm_pool(size: int = DB_POOL_WARM):
+  """Open `size` pooled connections up front so early requests skip the connect/TLS/auth handshake."""
+  size = min(size, DB_POOL_SIZE)
+  if size <= 0:
+    return
+  try:
+    # Hold them all at once so the pool ends up with `size` distinct connections
+    async with AsyncExitStack() as stack:
+      conns = await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(size)))
+      await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+    logger.info(f"Database pool warmed with {size} connections")
+  except Exception as e:
+    # The app still starts; connections are then opened on first use
+    logger.warning(f"Database pool warm-up failed: {e}")
@@ -1,6 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import CORS_ORIGINS, API_CONFIG
+from database import engine, warm_pool
+from responses import FastJSONResponse
 from routers import (
   company_router,
   company_card_routes,
@@ -12,11 +15,20 @@ from routers import (
   saved_reports,
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-open pooled DB connections at startup; close them cleanly on shutdown
+    await warm_pool()
+    yield
+    await engine.dispose()
+
 # Create FastAPI app instance with centralized config
 app = FastAPI(
     title=API_CONFIG["title"],
     description=API_CONFIG["description"],
-    version=API_CONFIG["version"]
+    version=API_CONFIG["version"],
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware with configurable origins
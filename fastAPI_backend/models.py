@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, TIMESTAMP, func, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, TIMESTAMP, func, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -15,6 +15,12 @@ class Company(Base):
 
     sustainability_metric = relationship("SustainabilityMetric", back_populates="company", uselist=False, cascade="all, delete-orphan")
 
+# Serves the case-insensitive equality lookups on lower(company_name) (the exact-match step of
+# find_existing_company, find_company_by_alias, save_company_to_database, delete_company_by_name),
+# which the plain unique index on company_name can't. The partial-match steps use LIKE '%...%'
+# and still scan; a btree index can't help those.
+Index("ix_companies_company_name_lower", func.lower(Company.company_name))
+
 class SustainabilityMetric(Base):
     __tablename__ = "sustainabilitymetrics"
     metric_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -72,7 +78,7 @@ class FleetSummary(Base):
     __tablename__ = "fleetsummary"
     fleet_summary_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     metric_id = Column(Integer, ForeignKey("sustainabilitymetrics.metric_id", ondelete="CASCADE"), nullable=False, unique=True)
-    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True)
+    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True, index=True)
     metric_name = Column(String(50), nullable=False, default='owns_cng_fleet')
     summary_text = Column(Text, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -88,7 +94,7 @@ class EmissionsSummary(Base):
     __tablename__ = "emissionssummary"
     emissions_summary_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     metric_id = Column(Integer, ForeignKey("sustainabilitymetrics.metric_id", ondelete="CASCADE"), nullable=False, unique=True)
-    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True)
+    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True, index=True)
     metric_name = Column(String(50), nullable=False, default='emission_report')
     emissions_summary = Column(Text, nullable=False)
     emissions_goals_summary = Column(Text, nullable=False)
@@ -108,7 +114,7 @@ class AltFuelsSummary(Base):
     __tablename__ = "altfuelssummary"
     alt_fuels_summary_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     metric_id = Column(Integer, ForeignKey("sustainabilitymetrics.metric_id", ondelete="CASCADE"), nullable=False, unique=True)
-    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True)
+    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True, index=True)
     metric_name = Column(String(50), nullable=False, default='alt_fuels')
     summary_text = Column(Text, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -124,7 +130,7 @@ class CleanEnergyPartnersSummary(Base):
     __tablename__ = "cleanenergypartnerssummary"
     clean_energy_summary_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     metric_id = Column(Integer, ForeignKey("sustainabilitymetrics.metric_id", ondelete="CASCADE"), nullable=False, unique=True)
-    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True)
+    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True, index=True)
     metric_name = Column(String(50), nullable=False, default='clean_energy_partners')
     summary_text = Column(Text, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -140,7 +146,7 @@ class RegulatoryPressureSummary(Base):
     __tablename__ = "regulatorypressuresummary"
     regulatory_pressure_summary_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     metric_id = Column(Integer, ForeignKey("sustainabilitymetrics.metric_id", ondelete="CASCADE"), nullable=False, unique=True)
-    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True)
+    metric_source_id = Column(Integer, ForeignKey("metricsources.metric_source_id", ondelete="SET NULL"), nullable=True, index=True)
     metric_name = Column(String(50), nullable=False, default='regulatory_pressure')
     summary_text = Column(Text, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -1,7 +1,22 @@
 import os
 import re
+from bisect import bisect_left
 from bs4 import BeautifulSoup
 
+# Optional C-based HTML parser (selectolax/lexbor) for text extraction; BeautifulSoup is used when missing
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# lxml gives BeautifulSoup a C tokenizer in place of the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = 'lxml'
+except ImportError:
+    BS4_PARSER = 'html.parser'
+
 def read_input(input_data):
     if input_data.endswith('.txt') and os.path.isfile(input_data):
         with open(input_data, 'r', encoding='utf-8') as f:
@@ -9,7 +24,12 @@ def read_input(input_data):
     return input_data
 
 def remove_html_tags(text):
-    return BeautifulSoup(text, 'html.parser').get_text(separator=' ', strip=True)
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(text)
+        # get_text skips script/style contents, so drop them here too
+        tree.strip_tags(['script', 'style'])
+        return tree.text(separator=' ', strip=True)
+    return BeautifulSoup(text, BS4_PARSER).get_text(separator=' ', strip=True)
 
 def clean_text(text):
     lines = text.splitlines()
@@ -24,15 +44,17 @@ def format_for_openai(text, max_tokens=3500):
     """
     max_chars = max_tokens * 4
     chunks = []
+    # Every space position, found once; each chunk boundary is then a binary search
+    spaces = [m.start() for m in re.finditer(' ', text)]
 
     start = 0
     while start < len(text):
         end = start + max_chars
         # Try to break at the nearest space before the limit for cleaner chunks
         if end < len(text):
-            space_index = text.rfind(' ', start, end)
-            if space_index > start:
-                end = space_index
+            i = bisect_left(spaces, end) - 1
+            if i >= 0 and spaces[i] > start:
+                end = spaces[i]
         chunks.append(text[start:end].strip())
         start = end
 
@@ -43,16 +65,19 @@ def write_output(chunks, output_path):
     If chunks is a list, write each chunk to a separate file with numbered suffixes.
     If it's a single string, write directly to the specified file.
     """
+    # Encoded up front and written in binary mode: no text-layer encoder or newline
+    # translation per file (process_input chunks are single-line, so the bytes are the same)
     if isinstance(chunks, list):
         base, ext = os.path.splitext(output_path)
-        for i, chunk in enumerate(chunks, 1):
+        encoded = [chunk.encode('utf-8') for chunk in chunks]
+        for i, data in enumerate(encoded, 1):
             chunk_path = f"{base}_{i}{ext}"
-            with open(chunk_path, 'w', encoding='utf-8') as f:
-                f.write(chunk)
+            with open(chunk_path, 'wb') as f:
+                f.write(data)
         return f"{base}_*.{ext[1:]}"  # wildcard pattern
     else:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(chunks)
+        with open(output_path, 'wb') as f:
+            f.write(chunks.encode('utf-8'))
         return output_path
 
 
@@ -68,5 +93,6 @@ def process_input(input_data, output_path=None):
     return formatted
 
 # Example usage:
-result = process_input('example_input.txt', output_path='clean_output.txt')
-print('Output saved to:', result)
+if __name__ == "__main__":
+    result = process_input('example_input.txt', output_path='clean_output.txt')
+    print('Output saved to:', result)
@@ -0,0 +1,129 @@
+"""JSON responses shared by the app and its routes, and a short-lived cache for list endpoints."""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from config import RESPONSE_CACHE_TTL
+
+# Optional C JSON encoder; stdlib json is used when missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# Array items serialized per streamed chunk
+STREAM_CHUNK_ITEMS = 1000
+
+
+def dumps_json(value: Any) -> bytes:
+    """Encode one value exactly as FastJSONResponse renders it"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+# Rendered bodies keyed by endpoint name: (monotonic time cached, JSON bytes)
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+# Bumped on every clear; a body is only cached if no clear happened since its query began
+_cache_generation = 0
+# Streamed bodies are stored from Starlette's threadpool; the check-and-store and the clear
+# must not interleave
+_cache_lock = threading.Lock()
+
+
+def response_cache_generation() -> int:
+    """Current cache generation - capture it before running the query whose result gets cached"""
+    return _cache_generation
+
+
+def get_cached_response(key: str) -> Optional[Response]:
+    """The body cached under key within RESPONSE_CACHE_TTL, served without re-serializing, or None"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, body = entry
+    if time.monotonic() - cached_at >= RESPONSE_CACHE_TTL:
+        _response_cache.pop(key, None)
+        return None
+    return Response(content=body, media_type="application/json")
+
+
+def stream_json_array(items: Iterable[Any], cache_key: Optional[str] = None,
+                      generation: Optional[int] = None) -> StreamingResponse:
+    """
+    Send items as one JSON array, serialized STREAM_CHUNK_ITEMS at a time, so the first
+    bytes leave before the whole list is encoded and no full list of dicts is held.
+    With cache_key, the complete body is cached once the last chunk is sent - unless the
+    cache was cleared after `generation` (from response_cache_generation() taken before
+    the query), since the rows may then predate a committed write.
+    """
+    def chunks() -> Iterator[bytes]:
+        sent = []
+        separator = b"["
+        batch = []
+        for item in items:
+            batch.append(dumps_json(item))
+            if len(batch) == STREAM_CHUNK_ITEMS:
+                chunk = separator + b",".join(batch)
+                sent.append(chunk)
+                yield chunk
+                separator, batch = b",", []
+        if batch:
+            chunk = separator + b",".join(batch) + b"]"
+        else:
+            chunk = b"[]" if separator == b"[" else b"]"
+        sent.append(chunk)
+        yield chunk
+        if cache_key is not None:
+            body = b"".join(sent)
+            with _cache_lock:
+                if generation == _cache_generation:
+                    _response_cache[cache_key] = (time.monotonic(), body)
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+def clear_response_cache() -> None:
+    """Drop every cached response and stop in-flight responses from caching pre-clear rows"""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _response_cache.clear()
+
+
+# Any committed ORM write may change what the cached lists show, so the cache is cleared
+# once the write commits; a rolled-back flush leaves it alone.
+@event.listens_for(Session, "after_flush")
+def _mark_pending_write(session, flush_context):
+    session.info["response_cache_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_write(session):
+    if session.info.pop("response_cache_dirty", False):
+        clear_response_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_write(session):
+    session.info.pop("response_cache_dirty", None)
+
+
+__all__ = [
+    "FastJSONResponse",
+    "ORJSON_AVAILABLE",
+    "dumps_json",
+    "get_cached_response",
+    "response_cache_generation",
+    "stream_json_array",
+    "clear_response_cache",
+]
@@ -25,15 +25,18 @@ router = APIRouter(
 # GET all CNG scores
 @router.get("/", summary="Retrieve all CNG adoption scores")
 async def get_cng_adoption_scores(db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(SustainabilityMetric))
-	metrics = result.scalars().all()
-	return {"success": True, "scores": [{"company_id": m.company_id, "score": m.cng_adopt_score} for m in metrics]}
+	# Only the two columns that reach the response - no ORM entity hydration
+	result = await db.execute(select(SustainabilityMetric.company_id, SustainabilityMetric.cng_adopt_score))
+	return {"success": True, "scores": [{"company_id": company_id, "score": score} for company_id, score in result.all()]}
 
 # GET CNG score by company id
 @router.get("/{company_id}", summary="Retrieve a CNG adoption score by company ID")
 async def get_cng_adoption_score(company_id: int, db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(SustainabilityMetric).filter(SustainabilityMetric.company_id == company_id))
-	metric = result.scalars().first()
+	result = await db.execute(
+		select(SustainabilityMetric.company_id, SustainabilityMetric.cng_adopt_score)
+		.filter(SustainabilityMetric.company_id == company_id)
+	)
+	metric = result.first()
 	if not metric:
 		raise HTTPException(status_code=404, detail="Company metrics not found")
 	return {"success": True, "score": {"company_id": metric.company_id, "score": metric.cng_adopt_score}}
@@ -41,8 +44,7 @@ async def get_cng_adoption_score(company_id: int, db: AsyncSession = Depends(get
 # POST a new CNG score
 @router.post("/", summary="Create a new CNG adoption score")
 async def create_cng_adoption_score(score: CNGAdoptionScoreCreate, db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(Company).filter(Company.company_id == score.company_id))
-	if not result.scalars().first():
+	if not await db.get(Company, score.company_id):
 		raise HTTPException(status_code=404, detail="Company not found")
 
 	db_score = SustainabilityMetric(
@@ -64,7 +66,7 @@ async def create_cng_adoption_score(score: CNGAdoptionScoreCreate, db: AsyncSess
 @router.put("/{company_id}", summary="Update a CNG adoption score")
 async def update_cng_adoption_score(company_id: int, score: CNGAdoptionScoreUpdate, db: AsyncSession = Depends(get_db)):
 	result = await db.execute(select(SustainabilityMetric).filter(SustainabilityMetric.company_id == company_id))
-	metric = result.scalars().first()
+	metric = result.scalar_one_or_none()  # company_id is UNIQUE: zero or one row
 	if not metric:
 		raise HTTPException(status_code=404, detail="Company metrics not found")
 
@@ -87,7 +89,7 @@ async def update_cng_adoption_score(company_id: int, score: CNGAdoptionScoreUpda
 @router.delete("/{company_id}", summary="Delete a CNG adoption score")
 async def delete_cng_adoption_score(company_id: int, db: AsyncSession = Depends(get_db)):
 	result = await db.execute(select(SustainabilityMetric).filter(SustainabilityMetric.company_id == company_id))
-	metric = result.scalars().first()
+	metric = result.scalar_one_or_none()  # company_id is UNIQUE: zero or one row
 	if not metric:
 		raise HTTPException(status_code=404, detail="CNG adoption score not found")
 
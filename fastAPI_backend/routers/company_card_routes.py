@@ -1,43 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 from database import get_db
-from models import Company, SustainabilityMetric, FleetSummary, EmissionsSummary, AltFuelsSummary, CleanEnergyPartnersSummary, RegulatoryPressureSummary
+from models import Company, SustainabilityMetric
+from responses import dumps_json
 
 router = APIRouter()
 
+# Dashboard renders refetch the same card; browsers reuse it briefly, then revalidate by ETag
+CARD_CACHE_CONTROL = "private, max-age=60, must-revalidate"
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match may list several tags, weak or strong, or be '*'"""
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    candidates = {tag[2:] if tag.startswith("W/") else tag for tag in candidates}
+    return etag in candidates or "*" in candidates
+
 @router.get("/company_card/{company_id}")
-async def get_company_card(company_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Company).filter(Company.company_id == company_id))
+async def get_company_card(company_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    # One round-trip: every relationship is one-to-one, so the metric and its five summaries
+    # are LEFT OUTER JOINed onto the company row instead of fetched by six follow-up queries
+    result = await db.execute(
+        select(Company)
+        .options(
+            joinedload(Company.sustainability_metric).joinedload(SustainabilityMetric.fleet_summary),
+            joinedload(Company.sustainability_metric).joinedload(SustainabilityMetric.emissions_summary),
+            joinedload(Company.sustainability_metric).joinedload(SustainabilityMetric.alt_fuels_summary),
+            joinedload(Company.sustainability_metric).joinedload(SustainabilityMetric.clean_energy_partners_summary),
+            joinedload(Company.sustainability_metric).joinedload(SustainabilityMetric.regulatory_pressure_summary),
+        )
+        .filter(Company.company_id == company_id)
+    )
     company = result.scalars().first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
-    sustainability = (await db.execute(
-        select(SustainabilityMetric).filter(SustainabilityMetric.company_id == company_id)
-    )).scalars().first()
-
-    fleet_summary = (await db.execute(
-        select(FleetSummary).filter(FleetSummary.metric_id == sustainability.metric_id)
-    )).scalars().first() if sustainability else None
-
-    emissions_summary = (await db.execute(
-        select(EmissionsSummary).filter(EmissionsSummary.metric_id == sustainability.metric_id)
-    )).scalars().first() if sustainability else None
+    sustainability = company.sustainability_metric
+    fleet_summary = sustainability.fleet_summary if sustainability else None
+    emissions_summary = sustainability.emissions_summary if sustainability else None
+    alt_fuels_summary = sustainability.alt_fuels_summary if sustainability else None
+    clean_energy_summary = sustainability.clean_energy_partners_summary if sustainability else None
+    regulatory_summary = sustainability.regulatory_pressure_summary if sustainability else None
 
-    alt_fuels_summary = (await db.execute(
-        select(AltFuelsSummary).filter(AltFuelsSummary.metric_id == sustainability.metric_id)
-    )).scalars().first() if sustainability else None
-
-    clean_energy_summary = (await db.execute(
-        select(CleanEnergyPartnersSummary).filter(CleanEnergyPartnersSummary.metric_id == sustainability.metric_id)
-    )).scalars().first() if sustainability else None
-
-    regulatory_summary = (await db.execute(
-        select(RegulatoryPressureSummary).filter(RegulatoryPressureSummary.metric_id == sustainability.metric_id)
-    )).scalars().first() if sustainability else None
-
-    return {
+    payload = {
         "company_name": company.company_name,
         "company_summary": company.company_summary,
         "website_url": company.website_url,
@@ -69,3 +76,13 @@ async def get_company_card(company_id: int, db: AsyncSession = Depends(get_db)):
             "regulatory": regulatory_summary.summary_text if regulatory_summary else None
         }
     }
+
+    # The tag hashes the rendered body: only the company row carries updated_at, so a
+    # timestamp-based tag would miss edits to the metric or its summaries. Rendered with the
+    # app's own encoder, so the body matches every other JSON response
+    body = dumps_json(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CARD_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from models import Company
@@ -27,10 +27,24 @@ router = APIRouter(
 
 # GET all companies
 @router.get("/", summary="Retrieve all companies")
-async def get_companies(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Company))
-    companies = result.scalars().all()
-    return {"success": True, "companies": companies}
+async def get_companies(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: last company_id of the previous page"),
+    db: AsyncSession = Depends(get_db)
+):
+    # Listing columns only, one bounded page ordered on the primary key
+    query = (
+        select(Company.company_id, Company.company_name, Company.industry, Company.website_url)
+        .order_by(Company.company_id)
+        .limit(limit)
+    )
+    # after_id seeks straight to the page through the primary-key index instead of skipping rows
+    query = query.where(Company.company_id > after_id) if after_id is not None else query.offset(offset)
+    result = await db.execute(query)
+    companies = [dict(row._mapping) for row in result.all()]
+    next_after_id = companies[-1]["company_id"] if len(companies) == limit else None
+    return {"success": True, "companies": companies, "next_after_id": next_after_id}
 
 # POST a new company
 @router.post("/", summary="Create a new company")
@@ -54,8 +68,7 @@ async def create_company(company: CompanyCreate, db: AsyncSession = Depends(get_
 # UPDATE a company
 @router.put("/{company_id}", summary="Update an existing company")
 async def update_company(company_id: int, company: CompanyUpdate, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Company).filter(Company.company_id == company_id))
-    db_company = result.scalars().first()
+    db_company = await db.get(Company, company_id)
     if not db_company:
         return HTTPException(status_code = 404, detail="Company not found")
     
@@ -81,8 +94,7 @@ async def update_company(company_id: int, company: CompanyUpdate, db: AsyncSessi
 # DELETE a company
 @router.delete("/{company_id}", summary="Delete an existing company")
 async def delete_company(company_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Company).filter(Company.company_id == company_id))
-    company = result.scalars().first()
+    company = await db.get(Company, company_id)
     if not company:
         raise HTTPException(status_code = 404, detail="Company not found")
 
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
 from database import get_db
+from responses import get_cached_response, response_cache_generation, stream_json_array
 from models import Company, SustainabilityMetric, EmissionsSummary
 from pydantic import BaseModel
 from typing import List, Optional
@@ -40,51 +40,65 @@ router = APIRouter(
     tags=["Dashboard"]
 )
 
+# Frontend labels indexed by the stored code, built once instead of per call
+CNG_FLEET_SIZE_LABELS = ("None", "1-10", "11-50", "50+")
+EMISSION_GOAL_LABELS = ("No", "Goal mentioned", "Goal with timeline")
+
 def map_cng_fleet_size(cng_fleet_size_range: int) -> str:
     """Map database cng_fleet_size_range to frontend expected values"""
-    mapping = {
-        0: "None",
-        1: "1-10", 
-        2: "11-50",
-        3: "50+"
-    }
-    return mapping.get(cng_fleet_size_range, "None")
+    if 0 <= cng_fleet_size_range < len(CNG_FLEET_SIZE_LABELS):
+        return CNG_FLEET_SIZE_LABELS[cng_fleet_size_range]
+    return "None"
 
 def map_emission_goals(emission_goals: int) -> str:
     """Map database emission_goals to frontend expected values"""
-    mapping = {
-        0: "No",
-        1: "Goal mentioned",
-        2: "Goal with timeline"
-    }
-    return mapping.get(emission_goals, "No")
+    if 0 <= emission_goals < len(EMISSION_GOAL_LABELS):
+        return EMISSION_GOAL_LABELS[emission_goals]
+    return "No"
 
 @router.get("/companies", response_model=List[CompanyData])
 async def get_companies_for_dashboard(db: AsyncSession = Depends(get_db)):
     """Get all companies with their sustainability metrics in the format expected by frontend"""
+    cached = get_cached_response("dashboard_companies")
+    if cached is not None:
+        return cached
+    generation = response_cache_generation()
     try:
-        # Join companies with their sustainability metrics
+        # Join companies with their sustainability metrics, selecting only the columns the
+        # dashboard shows - plain row tuples, no Company/SustainabilityMetric instances.
+        # Metric columns are NOT NULL, so None only means the company has no metric row yet.
         result = await db.execute(
-            select(Company, SustainabilityMetric).outerjoin(
-                SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id
+            select(
+                Company.company_name,
+                SustainabilityMetric.owns_cng_fleet,
+                SustainabilityMetric.cng_fleet_size_range,
+                SustainabilityMetric.emission_report,
+                SustainabilityMetric.emission_goals,
+                SustainabilityMetric.alt_fuels,
+                SustainabilityMetric.clean_energy_partners,
+                SustainabilityMetric.regulatory_pressure
             )
+            .select_from(Company)
+            .outerjoin(SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id)
         )
         
-        companies_data = []
-        for company, metric in result:
-            company_data = CompanyData(
-                name=company.company_name,
-                cngFleetPresence=metric.owns_cng_fleet if metric else False,
-                cngFleetSize=map_cng_fleet_size(metric.cng_fleet_size_range if metric else 0),
-                emissionReporting=metric.emission_report if metric else False,
-                emissionReductionGoals=map_emission_goals(metric.emission_goals if metric else 0),
-                alternativeFuels=metric.alt_fuels if metric else False,
-                cleanEnergyPartnerships=metric.clean_energy_partners if metric else False,
-                regulatoryPressure=metric.regulatory_pressure if metric else False
-            )
-            companies_data.append(company_data)
+        rows = result.all()
         
-        return companies_data
+        # Streamed straight from the row tuples: response_model only documents the schema,
+        # skipping the model -> jsonable_encoder -> validation round-trip per company
+        return stream_json_array((
+            {
+                "name": row.company_name,
+                "cngFleetPresence": row.owns_cng_fleet or False,
+                "cngFleetSize": map_cng_fleet_size(row.cng_fleet_size_range or 0),
+                "emissionReporting": row.emission_report or False,
+                "emissionReductionGoals": map_emission_goals(row.emission_goals or 0),
+                "alternativeFuels": row.alt_fuels or False,
+                "cleanEnergyPartnerships": row.clean_energy_partners or False,
+                "regulatoryPressure": row.regulatory_pressure or False
+            }
+            for row in rows
+        ), cache_key="dashboard_companies", generation=generation)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving companies: {str(e)}")
@@ -93,32 +107,24 @@ async def get_companies_for_dashboard(db: AsyncSession = Depends(get_db)):
 async def get_company_emissions(company_name: str, db: AsyncSession = Depends(get_db)):
     """Get emission data for a specific company"""
     try:
-        # Get company
-        company_result = await db.execute(
-            select(Company).filter(Company.company_name == company_name)
+        # Company and its emissions summary in one round-trip; the summary is None when the
+        # company has no metric or no summary yet
+        result = await db.execute(
+            select(Company, EmissionsSummary)
+            .outerjoin(SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id)
+            .outerjoin(EmissionsSummary, SustainabilityMetric.metric_id == EmissionsSummary.metric_id)
+            .filter(Company.company_name == company_name)
+            .limit(1)
         )
-        company = company_result.scalars().first()
+        row = result.first()
         
-        if not company:
+        if not row:
             raise HTTPException(status_code=404, detail="Company not found")
-        
-        # Get sustainability metrics
-        metric_result = await db.execute(
-            select(SustainabilityMetric).filter(SustainabilityMetric.company_id == company.company_id)
-        )
-        metric = metric_result.scalars().first()
-        
-        # Get emissions summary if metric exists
-        emissions_summary = None
-        if metric:
-            emissions_result = await db.execute(
-                select(EmissionsSummary).filter(EmissionsSummary.metric_id == metric.metric_id)
-            )
-            emissions_summary = emissions_result.scalars().first()
+        company, emissions_summary = row
         
         if not emissions_summary:
             # Return default data if no emissions data found
-            return EmissionGoalData(
+            return EmissionGoalData.model_construct(
                 companyName=company.company_name,
                 targetYear=2050,
                 currentYear=2025,
@@ -134,11 +140,11 @@ async def get_company_emissions(company_name: str, db: AsyncSession = Depends(ge
         if emissions_summary.current_emissions and emissions_summary.target_emissions:
             current_year = 2024
             emission_points = [
-                EmissionDataPoint(year=current_year, value=float(emissions_summary.current_emissions)),
-                EmissionDataPoint(year=emissions_summary.target_year, value=float(emissions_summary.target_emissions))
+                EmissionDataPoint.model_construct(year=current_year, value=float(emissions_summary.current_emissions)),
+                EmissionDataPoint.model_construct(year=emissions_summary.target_year, value=float(emissions_summary.target_emissions))
             ]
         
-        return EmissionGoalData(
+        return EmissionGoalData.model_construct(
             companyName=company.company_name,
             targetYear=emissions_summary.target_year,
             currentYear=2025,
@@ -146,7 +152,7 @@ async def get_company_emissions(company_name: str, db: AsyncSession = Depends(ge
             strategy=emissions_summary.emissions_summary,
             additionalInfo="CNG usage and sustainability information included in analysis",
             sources=[
-                SourceLink(title=f"{company.company_name} Sustainability Report", url=company.website_url or "#")
+                SourceLink.model_construct(title=f"{company.company_name} Sustainability Report", url=company.website_url or "#")
             ],
             emissions=emission_points
         )
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func
 from sqlalchemy.future import select
 from models import Company, SustainabilityMetric, FleetSummary, EmissionsSummary, AltFuelsSummary, CleanEnergyPartnersSummary, RegulatoryPressureSummary
 from database import get_db
+from responses import get_cached_response, response_cache_generation, stream_json_array
+from .dashboard_routes import map_cng_fleet_size
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
@@ -36,54 +39,66 @@ router = APIRouter(
 
 @router.get("/", response_model=List[SavedReport])
 async def get_saved_reports(db: AsyncSession = Depends(get_db)):
+    cached = get_cached_response("saved_reports")
+    if cached is not None:
+        return cached
+    generation = response_cache_generation()
     try:
-        # Get all companies with their sustainability metrics
+        # Get all companies that have sustainability metrics, as the columns the report uses
         result = await db.execute(
-            select(Company, SustainabilityMetric).outerjoin(
-                SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id
-            )
+            select(
+                Company.company_id,
+                Company.company_name,
+                Company.company_summary,
+                # Formatted by Postgres, so each row arrives with its YYYY-MM-DD string
+                func.to_char(Company.created_at, "YYYY-MM-DD").label("date_created"),
+                Company.website_url,
+                Company.industry,
+                Company.cso_linkedin_url,
+                SustainabilityMetric.cng_adopt_score,
+                SustainabilityMetric.owns_cng_fleet,
+                SustainabilityMetric.cng_fleet_size_range,
+                SustainabilityMetric.cng_fleet_size_actual,
+                SustainabilityMetric.total_fleet_size,
+                SustainabilityMetric.emission_report,
+                SustainabilityMetric.emission_goals,
+                SustainabilityMetric.alt_fuels,
+                SustainabilityMetric.clean_energy_partners,
+                SustainabilityMetric.regulatory_pressure
+            ).join(SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id)
         )
         
-        saved_reports = []
-        for company, metric in result:
-            if not metric:
-                continue
-
-            # Map CNG fleet size range to string
-            cng_fleet_size_map = {
-                0: "None",
-                1: "1-10",
-                2: "11-50",
-                3: "50+"
-            }
+        rows = result.all()
 
+        def saved_report(row) -> dict:
             # Use the cng_adopt_score from the database instead of calculating
-            overall_score = metric.cng_adopt_score or 0
+            overall_score = row.cng_adopt_score or 0
 
-            saved_report = SavedReport(
-                id=str(company.company_id),
-                companyName=company.company_name,
-                overallScore=overall_score,
-                summary=company.company_summary or "No summary available",
-                dateCreated=company.created_at.strftime("%Y-%m-%d"),
-                websiteUrl=company.website_url,
-                industry=company.industry,
-                csoLinkedinUrl=company.cso_linkedin_url,
-                metrics=SavedReportMetrics(
-                    cngFleetPresence=metric.owns_cng_fleet,
-                    cngFleetSize=cng_fleet_size_map.get(metric.cng_fleet_size_range, "None"),
-                    cngFleetSizeActual=metric.cng_fleet_size_actual,
-                    totalFleetSize=metric.total_fleet_size,
-                    emissionReporting=metric.emission_report,
-                    emissionGoals=metric.emission_goals,
-                    alternativeFuels=metric.alt_fuels,
-                    cleanEnergy=metric.clean_energy_partners,
-                    regulatoryPressure=metric.regulatory_pressure
-                )
-            )
-            saved_reports.append(saved_report)
+            return {
+                "id": str(row.company_id),
+                "companyName": row.company_name,
+                "overallScore": overall_score,
+                "summary": row.company_summary or "No summary available",
+                "dateCreated": row.date_created,
+                "websiteUrl": row.website_url,
+                "industry": row.industry,
+                "csoLinkedinUrl": row.cso_linkedin_url,
+                "metrics": {
+                    "cngFleetPresence": row.owns_cng_fleet,
+                    "cngFleetSize": map_cng_fleet_size(row.cng_fleet_size_range),
+                    "cngFleetSizeActual": row.cng_fleet_size_actual,
+                    "totalFleetSize": row.total_fleet_size,
+                    "emissionReporting": row.emission_report,
+                    "emissionGoals": row.emission_goals,
+                    "alternativeFuels": row.alt_fuels,
+                    "cleanEnergy": row.clean_energy_partners,
+                    "regulatoryPressure": row.regulatory_pressure
+                }
+            }
 
-        return saved_reports
+        # Streamed straight from the row tuples: response_model only documents the schema,
+        # skipping the model -> jsonable_encoder -> validation round-trip per report
+        return stream_json_array((saved_report(row) for row in rows), cache_key="saved_reports", generation=generation)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving saved reports: {str(e)}")
\ No newline at end of file
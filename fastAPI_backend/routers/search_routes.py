@@ -168,8 +168,12 @@ async def search_companies(
         logger.debug(f"API: .env file path: {os.path.join(actual_project_root, '.env')}")
         logger.debug(f"API: .env file exists: {os.path.exists(os.path.join(actual_project_root, '.env'))}")
             
+        from backend.src.scraper import configure_logging
         from backend.src.scraper.scraper_service import analyze_company_structured
         
+        # The scraper logs through the root logger; no-op if logging is already configured
+        configure_logging()
+        
         structured_results = await run_async_wrapper(
             analyze_company_structured,
             company_name=company_name,
@@ -233,14 +237,15 @@ async def find_existing_company(db: AsyncSession, search_name: str):
     partial_query = select(Company, SustainabilityMetric).outerjoin(
         SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id
     ).filter(func.lower(Company.company_name).contains(func.lower(search_name_clean)))
+    # If multiple matches, prefer the shortest one (most likely to be correct) - chosen by the
+    # database, so only that row is transferred
+    partial_query = partial_query.order_by(func.length(Company.company_name)).limit(1)
     
     result = await db.execute(partial_query)
-    partial_matches = result.all()
+    best_match = result.first()
     
-    if partial_matches:
-        # If multiple matches, prefer the shortest one (most likely to be correct)
-        best_match = min(partial_matches, key=lambda x: len(x[0].company_name))
-        logger.debug(f"Partial match found: '{best_match[0].company_name}' (from {len(partial_matches)} matches)")
+    if best_match:
+        logger.debug(f"Partial match found: '{best_match[0].company_name}'")
         return best_match
     
     # Strategy 3: Reverse partial match (database name contained in search name)
@@ -248,14 +253,14 @@ async def find_existing_company(db: AsyncSession, search_name: str):
     reverse_query = select(Company, SustainabilityMetric).outerjoin(
         SustainabilityMetric, Company.company_id == SustainabilityMetric.company_id
     ).filter(func.lower(search_name_clean).contains(func.lower(Company.company_name)))
+    # If multiple matches, prefer the longest database name (most specific)
+    reverse_query = reverse_query.order_by(func.length(Company.company_name).desc()).limit(1)
     
     result = await db.execute(reverse_query)
-    reverse_matches = result.all()
+    best_match = result.first()
     
-    if reverse_matches:
-        # If multiple matches, prefer the longest database name (most specific)
-        best_match = max(reverse_matches, key=lambda x: len(x[0].company_name))
-        logger.debug(f"Reverse partial match found: '{best_match[0].company_name}' (from {len(reverse_matches)} matches)")
+    if best_match:
+        logger.debug(f"Reverse partial match found: '{best_match[0].company_name}'")
         return best_match
     
     # Strategy 4: Common abbreviations and aliases
@@ -1055,9 +1060,7 @@ async def delete_company(company_id: int, db: AsyncSession = Depends(get_db)):
     """
     try:
         # First, check if company exists
-        company_query = select(Company).filter(Company.company_id == company_id)
-        result = await db.execute(company_query)
-        company = result.scalars().first()
+        company = await db.get(Company, company_id)
         
         if not company:
             raise HTTPException(status_code=404, detail=f"Company with ID {company_id} not found")
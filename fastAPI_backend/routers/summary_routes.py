@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import IntegrityError
 import logging
@@ -29,7 +30,7 @@ async def create_scorecard_data(
     # 1. Find or Create Company
     company_stmt = select(Company).filter(Company.company_name == scorecard_data.company_name)
     result = await db.execute(company_stmt)
-    db_company = result.scalars().first()
+    db_company = result.scalar_one_or_none()  # company_name is UNIQUE: zero or one row
 
     if db_company:
         # Optionally update company details if provided
@@ -59,10 +60,28 @@ async def create_scorecard_data(
             raise HTTPException(status_code=500, detail=f"Error creating company: {str(e)}")
 
     # 2. Create or Update SustainabilityMetrics
-    # Check if metrics for this company already exist
-    metrics_stmt = select(SustainabilityMetric).filter(SustainabilityMetric.company_id == db_company.company_id)
+    # Check if metrics for this company already exist; their five one-to-one summaries are
+    # joined into the same query rather than selected one by one in step 4
+    metrics_stmt = (
+        select(SustainabilityMetric)
+        .options(
+            joinedload(SustainabilityMetric.fleet_summary),
+            joinedload(SustainabilityMetric.emissions_summary),
+            joinedload(SustainabilityMetric.alt_fuels_summary),
+            joinedload(SustainabilityMetric.clean_energy_partners_summary),
+            joinedload(SustainabilityMetric.regulatory_pressure_summary),
+        )
+        .filter(SustainabilityMetric.company_id == db_company.company_id)
+    )
     result = await db.execute(metrics_stmt)
     db_metrics = result.scalars().first()
+    
+    # A metric created below has no summaries yet (and lazy loads aren't allowed under asyncio)
+    db_fleet_summary = db_metrics.fleet_summary if db_metrics else None
+    db_emissions_summary = db_metrics.emissions_summary if db_metrics else None
+    db_alt_fuels_summary = db_metrics.alt_fuels_summary if db_metrics else None
+    db_clean_energy_summary = db_metrics.clean_energy_partners_summary if db_metrics else None
+    db_regulatory_summary = db_metrics.regulatory_pressure_summary if db_metrics else None
 
     metrics_payload = scorecard_data.sustainability_metrics_payload
 
@@ -137,9 +156,6 @@ async def create_scorecard_data(
     
     final_fleet_summary_text = " ".join(fleet_summary_text_parts) if fleet_summary_text_parts else "Fleet summary not available."
 
-    fleet_summary_stmt = select(FleetSummary).filter(FleetSummary.metric_id == db_metrics.metric_id)
-    result = await db.execute(fleet_summary_stmt)
-    db_fleet_summary = result.scalars().first()
     if db_fleet_summary:
         db_fleet_summary.summary_text = final_fleet_summary_text
     elif db_metrics.metric_id: # Only create if metric exists
@@ -150,9 +166,6 @@ async def create_scorecard_data(
     emissions_report_summary_text = get_summary_text("emission_reporting_summary")
     emissions_goals_summary_text = get_summary_text("emission_reduction_goals_summary")
     
-    emissions_summary_stmt = select(EmissionsSummary).filter(EmissionsSummary.metric_id == db_metrics.metric_id)
-    result = await db.execute(emissions_summary_stmt)
-    db_emissions_summary = result.scalars().first()
     if db_emissions_summary:
         db_emissions_summary.emissions_summary = emissions_report_summary_text
         db_emissions_summary.emissions_goals_summary = emissions_goals_summary_text
@@ -167,9 +180,6 @@ async def create_scorecard_data(
         
     # AltFuelsSummary
     alt_fuels_summary_text = get_summary_text("alternative_fuels_summary")
-    alt_fuels_summary_stmt = select(AltFuelsSummary).filter(AltFuelsSummary.metric_id == db_metrics.metric_id)
-    result = await db.execute(alt_fuels_summary_stmt)
-    db_alt_fuels_summary = result.scalars().first()
     if db_alt_fuels_summary:
         db_alt_fuels_summary.summary_text = alt_fuels_summary_text
     elif db_metrics.metric_id:
@@ -177,9 +187,6 @@ async def create_scorecard_data(
 
     # CleanEnergyPartnersSummary
     clean_energy_summary_text = get_summary_text("clean_energy_initiatives_summary") # map from JSON key
-    clean_energy_summary_stmt = select(CleanEnergyPartnersSummary).filter(CleanEnergyPartnersSummary.metric_id == db_metrics.metric_id)
-    result = await db.execute(clean_energy_summary_stmt)
-    db_clean_energy_summary = result.scalars().first()
     if db_clean_energy_summary:
         db_clean_energy_summary.summary_text = clean_energy_summary_text
     elif db_metrics.metric_id:
@@ -187,9 +194,6 @@ async def create_scorecard_data(
         
     # RegulatoryPressureSummary
     regulatory_summary_text = get_summary_text("regulatory_pressure_summary")
-    regulatory_summary_stmt = select(RegulatoryPressureSummary).filter(RegulatoryPressureSummary.metric_id == db_metrics.metric_id)
-    result = await db.execute(regulatory_summary_stmt)
-    db_regulatory_summary = result.scalars().first()
     if db_regulatory_summary:
         db_regulatory_summary.summary_text = regulatory_summary_text
     elif db_metrics.metric_id:
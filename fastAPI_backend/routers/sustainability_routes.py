@@ -47,8 +47,7 @@ async def get_sustainability_metrics(db: AsyncSession = Depends(get_db)):
 # GET a sustainability metric by ID
 @router.get("/{metric_id}", summary="Retrieve a sustainability metric by ID")
 async def get_sustainability_metric(metric_id: int, db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(SustainabilityMetric).filter(SustainabilityMetric.metric_id == metric_id))
-	metric = result.scalars().first()
+	metric = await db.get(SustainabilityMetric, metric_id)
 	if not metric:
 		raise HTTPException(status_code=404, detail="Sustainability metric not found")
 	return {"success": True, "metric": metric}
@@ -56,8 +55,7 @@ async def get_sustainability_metric(metric_id: int, db: AsyncSession = Depends(g
 # POST a new sustainability metric
 @router.post("/", summary="Create a new sustainability metric")
 async def create_sustainability_metric(metric: SustainabilityMetricCreate, db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(Company).filter(Company.company_id == metric.company_id))
-	if not result.scalars().first():
+	if not await db.get(Company, metric.company_id):
 		raise HTTPException(status_code=404, detail="Company not found")
 
 	db_metric = SustainabilityMetric(
@@ -86,8 +84,7 @@ async def create_sustainability_metric(metric: SustainabilityMetricCreate, db: A
 # UPDATE an existing sustainability metric
 @router.put("/{metric_id}", summary="Update a sustainability metric")
 async def update_sustainability_metric(metric_id: int, metric: SustainabilityMetricUpdate, db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(SustainabilityMetric).filter(SustainabilityMetric.metric_id == metric_id))
-	db_metric = result.scalars().first()
+	db_metric = await db.get(SustainabilityMetric, metric_id)
 	if not db_metric:
 		raise HTTPException(status_code=404, detail="Sustainability metric not found")
 
@@ -123,8 +120,7 @@ async def update_sustainability_metric(metric_id: int, metric: SustainabilityMet
 # DELETE an existing sustainability metric
 @router.delete("/{metric_id}", summary="Delete a sustainability metric")
 async def delete_sustainability_metric(metric_id: int, db: AsyncSession = Depends(get_db)):
-	result = await db.execute(select(SustainabilityMetric).filter(SustainabilityMetric.metric_id == metric_id))
-	metric = result.scalars().first()
+	metric = await db.get(SustainabilityMetric, metric_id)
 	if not metric:
 		raise HTTPException(status_code=404, detail="Sustainability metric not found")
 
@@ -134,4 +134,24 @@ CREATE TABLE RegulatoryPressureSummary (
     CONSTRAINT regulatory_pressure_summary_metric_name CHECK (metric_name = 'regulatory_pressure')
 );
 
+-- Summary lookups filter on metric_id (company card, scorecard upload), and the
+-- ON DELETE SET NULL from MetricSources scans metric_source_id; neither is a key above
+CREATE INDEX IF NOT EXISTS idx_fleetsummary_metric_id ON FleetSummary(metric_id);
+CREATE INDEX IF NOT EXISTS idx_emissionssummary_metric_id ON EmissionsSummary(metric_id);
+CREATE INDEX IF NOT EXISTS idx_altfuelssummary_metric_id ON AltFuelsSummary(metric_id);
+CREATE INDEX IF NOT EXISTS idx_cleanenergypartnerssummary_metric_id ON CleanEnergyPartnersSummary(metric_id);
+CREATE INDEX IF NOT EXISTS idx_regulatorypressuresummary_metric_id ON RegulatoryPressureSummary(metric_id);
+
+CREATE INDEX IF NOT EXISTS idx_fleetsummary_metric_source_id ON FleetSummary(metric_source_id);
+CREATE INDEX IF NOT EXISTS idx_emissionssummary_metric_source_id ON EmissionsSummary(metric_source_id);
+CREATE INDEX IF NOT EXISTS idx_altfuelssummary_metric_source_id ON AltFuelsSummary(metric_source_id);
+CREATE INDEX IF NOT EXISTS idx_cleanenergypartnerssummary_metric_source_id ON CleanEnergyPartnersSummary(metric_source_id);
+CREATE INDEX IF NOT EXISTS idx_regulatorypressuresummary_metric_source_id ON RegulatoryPressureSummary(metric_source_id);
+
+-- Case-insensitive equality lookups (lower(company_name) = lower(...)) use this index;
+-- the UNIQUE constraint index only serves exact-case lookups. The substring (LIKE '%...%')
+-- steps of company search can't use a btree index and still scan. company_name and
+-- SustainabilityMetrics.company_id are already indexed by their UNIQUE constraints.
+CREATE INDEX IF NOT EXISTS idx_companies_company_name_lower ON Companies(LOWER(company_name));
+
 -- Might need to add boolen for webscraper finishing
\ No newline at end of file